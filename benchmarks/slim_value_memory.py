@@ -0,0 +1,42 @@
+"""
+Measures the memory held per instance, and the construction time, of a `Value`, a `SlimValue` and the raw values
+they wrap.
+
+Usage:
+    python benchmarks/slim_value_memory.py [count]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from typing_extensions import Any, Callable
+
+from pydddantic import SlimValue, Value
+
+
+class CountValue(Value[int]): ...
+
+
+class SlimCount(SlimValue[int]): ...
+
+
+def _measure(label: str, create: Callable[[int], Any], count: int) -> None:
+    tracemalloc.start()
+    instances = [create(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timeit.repeat(lambda: create(count), number=10_000, repeat=5)) / 10_000
+    print(f"{label:<12} {size / len(instances):>8.0f} B/instance {seconds * 1e9:>8.0f} ns/instance")
+
+
+def main(count: int) -> None:
+    # Start past the small ints cached by CPython, so that every raw value is allocated too
+    offset = 1_000
+    _measure("int", lambda i: int(str(offset + i)), count)
+    _measure("Value", lambda i: CountValue(offset + i), count)
+    _measure("SlimValue", lambda i: SlimCount(offset + i), count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
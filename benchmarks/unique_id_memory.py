@@ -0,0 +1,40 @@
+"""
+Measures the memory held per instance, and the construction time, of a hashed `UniqueId` and the `UUID` it extends.
+
+Usage:
+    python benchmarks/unique_id_memory.py [count]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from typing_extensions import Any, Callable
+from uuid import UUID
+
+from pydddantic import UniqueId
+
+
+class UserId(UniqueId): ...
+
+
+def _measure(label: str, create: Callable[[int], Any], count: int) -> None:
+    tracemalloc.start()
+    instances = [create(i) for i in range(count)]
+    for instance in instances:
+        hash(instance)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timeit.repeat(lambda: create(count), number=10_000, repeat=5)) / 10_000
+    print(f"{label:<12} {size / len(instances):>8.0f} B/instance {seconds * 1e9:>8.0f} ns/instance")
+
+
+def main(count: int) -> None:
+    # Ids start past 2**64, so that every id's int is allocated too
+    offset = 1 << 100
+    _measure("UUID", lambda i: UUID(int=offset + i), count)
+    _measure("UniqueId", lambda i: UserId._from_int(offset + i), count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,12 +1,52 @@
 from typing_extensions import deprecated
 
-from .aes import EventSourcedAggregate, EventStore, EventStream
+from .aes import (
+    CatchUpSubscription,
+    CheckpointStore,
+    ConcurrencyError,
+    EventCountPolicy,
+    EventLog,
+    EventSerializer,
+    EventSourcedAggregate,
+    EventStore,
+    EventStream,
+    FileEventStore,
+    InMemoryCheckpointStore,
+    InMemorySnapshotStore,
+    JsonEventSerializer,
+    LazyEventStream,
+    RecordedEvent,
+    ReplayTimePolicy,
+    Snapshot,
+    SnapshotLoader,
+    SnapshotPolicy,
+    SnapshotStore,
+    SqliteConnectionPool,
+    SqliteEventStore,
+    UnitOfWork,
+    event_handler,
+)
 from .aggregate_root import AggregateRoot
-from .eda import Command, Event, Message, MessageBus, Subscriber
+from .eda import (
+    AsyncMessageBus,
+    AsyncSubscriber,
+    BatchSubscriber,
+    CascadeLimitError,
+    Command,
+    Event,
+    Message,
+    MessageBus,
+    MessagePackCodec,
+    PublishError,
+    Subscriber,
+    Upcaster,
+    UpcasterRegistry,
+)
 from .entity import Entity
+from .flyweight import FlyweightCache, FlyweightStats
 from .immutable_entity import ImmutableEntity
 from .unique_id import UniqueId
-from .value import Value
+from .value import SlimValue, Value
 from .value_object import ValueObject
 
 
@@ -17,18 +57,50 @@ class UUIDValue(UniqueId):
 
 __all__ = [
     "AggregateRoot",
+    "AsyncMessageBus",
+    "AsyncSubscriber",
+    "BatchSubscriber",
+    "CascadeLimitError",
+    "CatchUpSubscription",
+    "CheckpointStore",
     "Command",
+    "ConcurrencyError",
     "Event",
+    "EventCountPolicy",
+    "EventLog",
+    "EventSerializer",
     "EventSourcedAggregate",
     "EventStore",
     "EventStream",
+    "FileEventStore",
     "Entity",
+    "FlyweightCache",
+    "FlyweightStats",
     "ImmutableEntity",
+    "InMemoryCheckpointStore",
+    "InMemorySnapshotStore",
+    "JsonEventSerializer",
+    "LazyEventStream",
     "Message",
     "MessageBus",
+    "MessagePackCodec",
+    "PublishError",
+    "RecordedEvent",
+    "ReplayTimePolicy",
+    "SlimValue",
+    "Snapshot",
+    "SnapshotLoader",
+    "SnapshotPolicy",
+    "SnapshotStore",
+    "SqliteConnectionPool",
+    "SqliteEventStore",
     "Subscriber",
     "UniqueId",
+    "UnitOfWork",
+    "Upcaster",
+    "UpcasterRegistry",
     "UUIDValue",
     "Value",
     "ValueObject",
+    "event_handler",
 ]
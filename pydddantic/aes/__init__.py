@@ -1,3 +1,11 @@
-from .aggregate import EventSourcedAggregate
-from .stream import EventStream
-from .store import EventStore
+from .aggregate import EventSourcedAggregate, event_handler
+from .errors import ConcurrencyError
+from .file_store import FileEventStore
+from .loader import SnapshotLoader
+from .serializer import EventSerializer, JsonEventSerializer
+from .snapshot import EventCountPolicy, InMemorySnapshotStore, ReplayTimePolicy, Snapshot, SnapshotPolicy
+from .sqlite_store import SqliteConnectionPool, SqliteEventStore
+from .store import CheckpointStore, EventLog, EventStore, SnapshotStore
+from .stream import EventStream, LazyEventStream, RecordedEvent
+from .subscription import CatchUpSubscription, InMemoryCheckpointStore
+from .unit_of_work import UnitOfWork
@@ -1,20 +1,125 @@
+import inspect
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from functools import singledispatchmethod
-from typing_extensions import Any
+from typing_extensions import Any, Callable, ClassVar, TypeVar, get_type_hints, overload
 
 from ..eda.event import Event
+from .snapshot import Snapshot
 from .stream import EventStream
 
+_EventHandler = Callable[[Any, Any], None]
+THandler = TypeVar("THandler", bound=_EventHandler)
+
+
+@overload
+def event_handler(handler: THandler, /) -> THandler: ...
+
+
+@overload
+def event_handler(event_type: type[Event], /) -> Callable[[THandler], THandler]: ...
+
+
+def event_handler(handler_or_event_type: Any, /) -> Any:
+    """
+    Decorator marking a method of an Event-Sourced Aggregate as the handler mutating the Aggregate for an Event type.
+    The Event type is taken from the annotation of the event parameter, or may be provided explicitly. A handler
+    also handles subtypes of its Event type, unless they have a handler of their own.
+
+    Handlers are collected into a table when the Aggregate class is defined, so replaying events only requires a
+    dictionary lookup per event.
+
+    Example:
+        ```
+        class User(EventSourcedAggregate):
+            @event_handler
+            def _user_created(self, event: UserCreatedEvent) -> None:
+                ...
+
+            @event_handler(UserNameChangedEvent)
+            def _user_name_changed(self, event) -> None:
+                ...
+        ```
+    """
+
+    if isinstance(handler_or_event_type, type):
+
+        def decorator(handler: THandler) -> THandler:
+            handler._handles_event = handler_or_event_type  # type: ignore[attr-defined]
+            return handler
+
+        return decorator
+
+    handler_or_event_type._handles_event = None
+    return handler_or_event_type
+
+
+def _handled_event_type(handler: _EventHandler) -> type[Event]:
+    event_type = handler._handles_event  # type: ignore[attr-defined]
+    if event_type is not None:
+        return event_type
+
+    parameters = list(inspect.signature(handler).parameters)
+    hints = get_type_hints(handler)
+    if len(parameters) != 2 or not isinstance(hints.get(parameters[1]), type):
+        raise TypeError(
+            f"Event handler {handler.__qualname__} must have a single event parameter annotated with its type"
+        )
+    return hints[parameters[1]]
+
 
 class EventSourcedAggregate(ABC):
     """
     Abstract base class for an Event-Sourced Aggregate when using Aggregate + Event Sourcing (A+ES).
 
-    Subclasses must implement _mutate as singledispatchmethods for each event type they handle.
+    Subclasses must either decorate a handler for each event type they handle with `event_handler`, or implement
+    _mutate as singledispatchmethods for each event type they handle. To support Snapshots, subclasses must also
+    implement _take_snapshot and _restore_snapshot.
     """
 
-    def __init__(self, event_stream: EventStream | None = None) -> None:
+    __event_handlers: ClassVar[dict[type[Event], _EventHandler]] = {}
+    "The handlers decorated with `event_handler` on the class and its bases, by the Event type they handle"
+
+    __dispatch: ClassVar[dict[type[Event], _EventHandler]] = {}
+    "The handlers resolved for each concrete Event type applied to the class"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        event_handlers = {}
+        for event_type, handler in cls.__event_handlers.items():
+            # A handler overridden without being decorated again still handles the Event type of the handler it
+            # overrides, while one decorated again is collected below
+            override = cls.__dict__.get(handler.__name__, handler)
+            if not hasattr(override, "_handles_event") and callable(override):
+                event_handlers[event_type] = override
+            elif override is handler:
+                event_handlers[event_type] = handler
+
+        for attribute in cls.__dict__.values():
+            if hasattr(attribute, "_handles_event"):
+                event_handlers[_handled_event_type(attribute)] = attribute
+
+        cls.__event_handlers = event_handlers
+        cls.__dispatch = dict(event_handlers)
+
+    @classmethod
+    def __resolve_handler(cls, event_type: type[Event]) -> _EventHandler:
+        for base in event_type.__mro__:
+            if base in cls.__event_handlers:
+                handler = cls.__event_handlers[base]
+                break
+        else:
+            mutate = inspect.getattr_static(cls, "_mutate")
+            if isinstance(mutate, singledispatchmethod):
+                handler = mutate.dispatcher.dispatch(event_type)
+            else:
+                handler = mutate
+
+        cls.__dispatch[event_type] = handler
+        return handler
+
+    def __init__(self, event_stream: EventStream | None = None, snapshot: Snapshot | None = None) -> None:
         """
         Creates the Aggregate from a sequence of Domain Events, such as when loading from an Event Store.
 
@@ -22,15 +127,29 @@ class EventSourcedAggregate(ABC):
             event_stream (EventStream | None, optional):
                 The Event Stream from which to load the Aggregate. May be None to create a new Aggregate.
                 Defaults to None.
+            snapshot (Snapshot | None, optional):
+                A Snapshot from which to restore the Aggregate before applying the Event Stream, which must then only
+                contain the Events after the Snapshot's version. Defaults to None.
         """
 
         self.__changes: list[Event] = []
         self.__version = 0
 
+        if snapshot is not None:
+            self.__version = snapshot.version
+            self._restore_snapshot(snapshot.state)
+
         if event_stream is not None:
             self.__version = event_stream.version
+
+            dispatch = type(self).__dispatch
+            resolve = type(self).__resolve_handler
             for event in event_stream:
-                self._mutate(event)
+                try:
+                    handler = dispatch[type(event)]
+                except KeyError:
+                    handler = resolve(type(event))
+                handler(self, event)
 
     @property
     @abstractmethod
@@ -45,21 +164,32 @@ class EventSourcedAggregate(ABC):
 
     @property
     def version(self) -> int:
-        "The version of the Aggregate at the time it was loaded from the Event Store"
+        "The version of the Aggregate at the time it was loaded from the Event Store, or its changes last committed"
         return self.__version
 
+    def _commit_changes(self) -> None:
+        """
+        Mark the recorded changes as persisted to the Event Store, advancing the version of the Aggregate past them
+        and clearing them, so that further changes can be appended to the same Event Stream.
+        """
+
+        self.__version += len(self.__changes)
+        self.__changes.clear()
+
     @singledispatchmethod
-    @abstractmethod
     def _mutate(self, event: Event) -> None:
         """
         Mutate the Aggregate state based on the provided Event. Handlers for specific events should be implemented as
-        `singledispatchmethod`s.
+        `singledispatchmethod`s, unless they are decorated with `event_handler`.
+
+        The implementation of `_mutate` for each Event type is resolved once per class and cached, so handlers should
+        be registered when the class is defined.
 
         Args:
             event (Event): The event to use to mutate the Aggregate
 
         Raises:
-            NotImplementedError: If not implemented by the subclass
+            NotImplementedError: If not implemented by the subclass, or the event type is not handled
 
         Example:
             ```
@@ -82,6 +212,44 @@ class EventSourcedAggregate(ABC):
 
         raise NotImplementedError
 
+    def _take_snapshot(self) -> Any:
+        """
+        Serialize the current state of the Aggregate for a Snapshot. Must be implemented by the subclass to support
+        Snapshots.
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass
+
+        Returns:
+            Any: The serialized state of the Aggregate
+
+        Example:
+            ```
+            class User(EventSourcedAggregate):
+                def _take_snapshot(self) -> Any:
+                    return self._state.model_dump()
+
+                def _restore_snapshot(self, state: Any) -> None:
+                    self._state = _UserState.model_validate(state)
+            ```
+        """
+
+        raise NotImplementedError
+
+    def _restore_snapshot(self, state: Any) -> None:
+        """
+        Restore the state of the Aggregate from a Snapshot, as serialized by `_take_snapshot`. Must be implemented by
+        the subclass to support Snapshots.
+
+        Args:
+            state (Any): The serialized state of the Aggregate
+
+        Raises:
+            NotImplementedError: If not implemented by the subclass
+        """
+
+        raise NotImplementedError
+
     def _apply(self, event: Event) -> None:
         """
         Apply the provided Event to the Aggregate, updating the state and recording the change for later persistence.
@@ -91,4 +259,9 @@ class EventSourcedAggregate(ABC):
         """
 
         self.__changes.append(event)
-        self._mutate(event)
+
+        try:
+            handler = type(self).__dispatch[type(event)]
+        except KeyError:
+            handler = type(self).__resolve_handler(type(event))
+        handler(self, event)
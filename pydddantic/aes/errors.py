@@ -0,0 +1,22 @@
+from typing_extensions import Any
+
+
+class ConcurrencyError(Exception):
+    """
+    Raised by an Event Store when appending the changes of an Aggregate whose version no longer matches the version
+    of its Event Stream, such as when another writer has appended Events since the Aggregate was loaded.
+    """
+
+    def __init__(self, id: Any, expected_version: int, actual_version: int) -> None:
+        super().__init__(
+            f"Expected version {expected_version} of the Event Stream for {id}, but found version {actual_version}"
+        )
+
+        self.id = id
+        "The Aggregate Id"
+
+        self.expected_version = expected_version
+        "The version of the Aggregate when it was loaded"
+
+        self.actual_version = actual_version
+        "The current version of the Event Stream"
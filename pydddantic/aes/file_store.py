@@ -0,0 +1,405 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing_extensions import Any, Self
+
+from ..eda.event import Event
+from .aggregate import EventSourcedAggregate
+from .errors import ConcurrencyError
+from .serializer import EventSerializer
+from .stream import EventStream, LazyEventStream, RecordedEvent
+
+_HEADER = struct.Struct("<IIQH")
+"Record header: payload length, CRC-32 of the key and payload, version, key length"
+
+_CONTINUED = 1 << 63
+"Flag set on the version of every record but the last one written by the same append, which commits them all"
+
+
+class _Segment:
+    """
+    A segment file of the log, named after the position of its first byte within the whole log.
+    """
+
+    __slots__ = ("base", "path", "size", "map")
+
+    def __init__(self, base: int, path: Path) -> None:
+        self.base = base
+        self.path = path
+        self.size = 0
+        self.map: mmap.mmap | None = None
+
+    def mapped(self) -> mmap.mmap:
+        "Returns a read-only memory map covering at least the current size of the segment"
+
+        if self.map is None or len(self.map) < self.size:
+            with open(self.path, "rb") as file:
+                # Replaced maps are closed once no longer referenced, as events may still be read from them
+                self.map = mmap.mmap(file.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self.map
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+_IndexEntry = tuple[_Segment, int, int]
+"The segment, offset and length of a serialized event"
+
+_LogEntry = tuple[str, int, _IndexEntry]
+"The Aggregate Id, version and index entry of a serialized event, in the order it was appended to the log"
+
+
+def _position(entry: _LogEntry) -> int:
+    "The global position of an event: the position within the whole log of the byte following its record"
+
+    segment, offset, length = entry[2]
+    return segment.base + offset + length
+
+
+class FileEventStore:
+    """
+    Reference Event Store persisting Events to append-only segment files in a local directory.
+
+    Each Event is appended to the log as a length-prefixed, checksummed record, and an in-memory index of the
+    records of each Aggregate is rebuilt by scanning the record headers when the store is opened. Events are read
+    through memory maps of the segment files, and are only deserialized as the loaded Event Stream is consumed.
+
+    The changes of an Aggregate are appended with a single write, and synced to disk according to `fsync_every`.
+    An append interrupted at the end of the log, such as by a crash, is truncated when the store is opened.
+
+    Example:
+        ```
+        with FileEventStore("./events", JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)) as store:
+            store.append(user)
+            user = User(event_stream=store.load(user.id))
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        serializer: EventSerializer,
+        segment_size: int = 64 * 1024 * 1024,
+        fsync_every: int = 1,
+    ) -> None:
+        """
+        Args:
+            directory (str | os.PathLike[str]): The directory holding the segment files; created if missing.
+            serializer (EventSerializer): Serializes the Events written to and read from the log.
+            segment_size (int, optional):
+                The size in bytes after which a new segment file is started. Defaults to 64 MiB.
+            fsync_every (int, optional):
+                Sync the log to disk after this many appends; 0 leaves syncing to the operating system. Defaults to 1.
+
+        Raises:
+            RuntimeError: Occurs if a segment other than the last one is corrupt.
+        """
+
+        self.__directory = Path(directory)
+        self.__serializer = serializer
+        self.__segment_size = segment_size
+        self.__fsync_every = fsync_every
+        self.__unsynced_appends = 0
+        self.__lock = threading.Lock()
+        self.__index: dict[str, list[_IndexEntry]] = {}
+        self.__log: list[_LogEntry] = []
+        self.__segments: list[_Segment] = []
+
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        paths = sorted(self.__directory.glob("*.log"), key=lambda path: int(path.stem))
+        for i, path in enumerate(paths):
+            segment = _Segment(int(path.stem), path)
+            self.__recover(segment, is_last=i == len(paths) - 1)
+            self.__segments.append(segment)
+
+        if not self.__segments:
+            self.__segments.append(self.__create_segment(0))
+
+        self.__file = open(self.__segments[-1].path, "ab")
+
+    def load(self, id: Any, after_version: int = 0) -> EventStream:
+        """
+        Loads an Event Stream from the Event Store for the provided Aggregate Id. Events are deserialized lazily as
+        the Event Stream is consumed.
+
+        Args:
+            id (Any): The Aggregate Id to load
+            after_version (int, optional): Only load the Events after this version. Defaults to 0.
+
+        Returns:
+            EventStream: The Event Stream for the Aggregate Id
+        """
+
+        with self.__lock:
+            return self.__stream(id, after_version)
+
+    def load_many(self, ids: Iterable[Any]) -> dict[Any, EventStream]:
+        """
+        Loads the Event Streams of many Aggregates at once from the in-memory index. Events are deserialized lazily
+        as each Event Stream is consumed.
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids to load
+
+        Returns:
+            dict[Any, EventStream]:
+                The Event Stream for each Aggregate Id; Aggregate Ids without any Events map to an empty Event Stream.
+        """
+
+        with self.__lock:
+            return {id: self.__stream(id) for id in ids}
+
+    def append(self, aggregate: EventSourcedAggregate) -> None:
+        """
+        Appends the new Events of the Aggregate to the log with a single write.
+
+        Args:
+            aggregate (EventSourcedAggregate):
+                The Aggregate instance whose changes will be appended to the Event Store
+
+        Raises:
+            ConcurrencyError: Occurs if the version of the Aggregate does not match the version of its Event Stream.
+        """
+
+        self.append_many([aggregate])
+
+    def append_many(self, aggregates: Sequence[EventSourcedAggregate]) -> None:
+        """
+        Appends the new Events of many Aggregates to the log with a single write and sync. Either all of the Events
+        are appended, or none of them are, including when a crash interrupts the write.
+
+        Args:
+            aggregates (Sequence[EventSourcedAggregate]):
+                The Aggregate instances whose changes will be appended to the Event Store
+
+        Raises:
+            ConcurrencyError:
+                Occurs if the version of any Aggregate does not match the version of its Event Stream, in which case
+                no Events are appended.
+        """
+
+        batch = [
+            (aggregate, [self.__serializer.serialize(event) for event in aggregate.changes])
+            for aggregate in aggregates
+            if aggregate.changes
+        ]
+        if not batch:
+            return
+
+        with self.__lock:
+            versions: dict[str, int] = {}
+            for aggregate, _ in batch:
+                name = str(aggregate.id)
+                version = versions.get(name, len(self.__index.get(name, ())))
+                if aggregate.version != version:
+                    raise ConcurrencyError(aggregate.id, aggregate.version, version)
+                versions[name] = version + len(aggregate.changes)
+
+            segment = self.__active_segment()
+            buffer = bytearray()
+            appended: list[_LogEntry] = []
+            remaining = sum(len(payloads) for _, payloads in batch)
+            for aggregate, payloads in batch:
+                name = str(aggregate.id)
+                key = name.encode()
+                key_crc = zlib.crc32(key)
+                for version, payload in enumerate(payloads, start=aggregate.version + 1):
+                    remaining -= 1
+                    if remaining:
+                        version |= _CONTINUED
+                    buffer += _HEADER.pack(len(payload), zlib.crc32(payload, key_crc), version, len(key))
+                    buffer += key
+                    appended.append((name, version & ~_CONTINUED, (segment, segment.size + len(buffer), len(payload))))
+                    buffer += payload
+
+            self.__write(segment, buffer)
+            segment.size += len(buffer)
+            self.__commit(appended)
+
+    def get_version(self, id: Any) -> int:
+        """
+        Returns the current version of the Event Stream for a given Aggregate Id
+
+        Args:
+            id (Any): The Aggregate Id whose version to get
+
+        Returns:
+            int: The latest version number of the Aggregate
+        """
+
+        return len(self.__index.get(str(id), ()))
+
+    def get_versions(self, ids: Iterable[Any]) -> dict[Any, int]:
+        """
+        Returns the current versions of the Event Streams for many Aggregate Ids at once
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids whose versions to get
+
+        Returns:
+            dict[Any, int]: The latest version number of each Aggregate, or 0 for Aggregate Ids without any Events
+        """
+
+        index = self.__index
+        return {id: len(index.get(str(id), ())) for id in ids}
+
+    def read_all(self, after_position: int = 0, limit: int = 1000) -> list[RecordedEvent]:
+        """
+        Reads the Events of all Aggregates in the order they were appended, from the in-memory index of the log.
+
+        The global position of each Event is the position of the end of its record within the whole log, across
+        segment files.
+
+        Args:
+            after_position (int, optional): Only read the Events after this global position. Defaults to 0.
+            limit (int, optional): The maximum number of Events to read. Defaults to 1000.
+
+        Returns:
+            list[RecordedEvent]: The Events read, in order of their global position
+        """
+
+        with self.__lock:
+            start = bisect_right(self.__log, after_position, key=_position)
+            entries = self.__log[start : start + limit]
+            for segment in {entry[2][0] for entry in entries}:
+                segment.mapped()
+
+        return [
+            RecordedEvent(position=_position(entry), stream_id=entry[0], version=entry[1], event=event)
+            for entry, event in zip(entries, self.__read([entry[2] for entry in entries]))
+        ]
+
+    def flush(self) -> None:
+        "Syncs any appended Events not yet synced to disk"
+
+        with self.__lock:
+            if self.__unsynced_appends:
+                os.fsync(self.__file.fileno())
+                self.__unsynced_appends = 0
+
+    def close(self) -> None:
+        "Syncs any appended Events to disk, and closes the segment files"
+
+        self.flush()
+        with self.__lock:
+            self.__file.close()
+            for segment in self.__segments:
+                segment.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __commit(self, entries: list[_LogEntry]) -> None:
+        for entry in entries:
+            self.__index.setdefault(entry[0], []).append(entry[2])
+        self.__log.extend(entries)
+
+    def __stream(self, id: Any, after_version: int = 0) -> EventStream:
+        entries = self.__index.get(str(id), [])
+        version = len(entries)
+        entries = entries[after_version:]
+        for segment in {entry[0] for entry in entries}:
+            segment.mapped()
+
+        return LazyEventStream.from_trusted(version, self.__read(entries))
+
+    def __read(self, entries: list[_IndexEntry]) -> Iterator[Event]:
+        deserialize = self.__serializer.deserialize
+        for segment, offset, length in entries:
+            with memoryview(segment.map)[offset : offset + length] as view:  # type: ignore[arg-type]
+                event = deserialize(view)
+            yield event
+
+    def __write(self, segment: _Segment, buffer: bytearray) -> None:
+        try:
+            self.__file.write(buffer)
+            self.__file.flush()
+            if self.__fsync_every:
+                self.__unsynced_appends += 1
+                if self.__unsynced_appends >= self.__fsync_every:
+                    os.fsync(self.__file.fileno())
+                    self.__unsynced_appends = 0
+        except BaseException:
+            # Discard a partial or unsynced write so the log only ever holds complete records, and none that failed
+            self.__file.close()
+            os.truncate(segment.path, segment.size)
+            self.__file = open(segment.path, "ab")
+            raise
+
+    def __active_segment(self) -> _Segment:
+        segment = self.__segments[-1]
+        if segment.size < self.__segment_size:
+            return segment
+
+        if self.__unsynced_appends:
+            os.fsync(self.__file.fileno())
+            self.__unsynced_appends = 0
+        self.__file.close()
+
+        segment = self.__create_segment(segment.base + segment.size)
+        self.__segments.append(segment)
+        self.__file = open(segment.path, "ab")
+        return segment
+
+    def __create_segment(self, base: int) -> _Segment:
+        segment = _Segment(base, self.__directory / f"{base:020d}.log")
+        segment.path.touch()
+        return segment
+
+    def __recover(self, segment: _Segment, is_last: bool) -> None:
+        size = segment.path.stat().st_size
+        offset = 0
+
+        if size:
+            with open(segment.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                with memoryview(data) as view:
+                    offset = self.__scan(segment, view)
+
+        if offset < size:
+            if not is_last:
+                raise RuntimeError(f"Event Store segment {segment.path} is corrupt at offset {offset}")
+            os.truncate(segment.path, offset)
+
+        segment.size = offset
+
+    def __scan(self, segment: _Segment, view: memoryview) -> int:
+        "Indexes the committed records of the segment, returning the offset after the last one"
+
+        size = len(view)
+        offset = committed = 0
+        pending: list[_LogEntry] = []
+        versions: dict[str, int] = {}
+        while offset + _HEADER.size <= size:
+            length, crc, version, key_length = _HEADER.unpack_from(view, offset)
+            start = offset + _HEADER.size
+            end = start + key_length + length
+            if end > size or zlib.crc32(view[start:end]) != crc:
+                break
+
+            name = bytes(view[start : start + key_length]).decode()
+            continued = version & _CONTINUED
+            version ^= continued
+            if version != versions.get(name, len(self.__index.get(name, ()))) + 1:
+                break
+
+            pending.append((name, version, (segment, start + key_length, length)))
+            versions[name] = version
+            offset = end
+
+            if not continued:
+                self.__commit(pending)
+                pending = []
+                versions.clear()
+                committed = offset
+
+        return committed
@@ -0,0 +1,67 @@
+from time import perf_counter
+from typing_extensions import Any, Generic, TypeVar
+
+from .aggregate import EventSourcedAggregate
+from .snapshot import Snapshot, SnapshotPolicy
+from .store import EventStore, SnapshotStore
+
+TAggregate = TypeVar("TAggregate", bound=EventSourcedAggregate)
+
+
+class SnapshotLoader(Generic[TAggregate]):
+    """
+    Loads Event-Sourced Aggregates from their latest Snapshot and the Events after it, taking a new Snapshot whenever
+    the Snapshot Policy determines the Aggregate has become too costly to load.
+
+    Example:
+        ```
+        users = SnapshotLoader(User, event_store, snapshot_store, EventCountPolicy(every=100))
+        user = users.load(user_id)
+        ```
+    """
+
+    def __init__(
+        self,
+        aggregate_type: type[TAggregate],
+        event_store: EventStore,
+        snapshot_store: SnapshotStore,
+        policy: SnapshotPolicy,
+    ) -> None:
+        """
+        Args:
+            aggregate_type (type[TAggregate]): The type of Aggregate to load
+            event_store (EventStore): The Event Store from which to load Events
+            snapshot_store (SnapshotStore): The Snapshot Store from which to load and to which to save Snapshots
+            policy (SnapshotPolicy): Determines when to take a new Snapshot after loading an Aggregate
+        """
+
+        self.__aggregate_type = aggregate_type
+        self.__event_store = event_store
+        self.__snapshot_store = snapshot_store
+        self.__policy = policy
+
+    def load(self, id: Any) -> TAggregate:
+        """
+        Loads an Aggregate from its latest Snapshot, if any, and the Events after it.
+
+        Args:
+            id (Any): The Aggregate Id to load
+
+        Returns:
+            TAggregate: The loaded Aggregate
+        """
+
+        started = perf_counter()
+
+        snapshot = self.__snapshot_store.load(id)
+        snapshot_version = snapshot.version if snapshot is not None else 0
+        event_stream = self.__event_store.load(id, after_version=snapshot_version)
+        aggregate = self.__aggregate_type(event_stream=event_stream, snapshot=snapshot)
+
+        replay_seconds = perf_counter() - started
+        if self.__policy.should_snapshot(aggregate.version - snapshot_version, replay_seconds):
+            self.__snapshot_store.save(
+                Snapshot(id=aggregate.id, version=aggregate.version, state=aggregate._take_snapshot())
+            )
+
+        return aggregate
@@ -0,0 +1,100 @@
+from typing_extensions import Protocol
+
+from pydantic_core import from_json
+
+from ..eda.event import Event
+from ..eda.upcaster import UpcasterRegistry
+
+
+class EventSerializer(Protocol):
+    """
+    Protocol for serializing Events to bytes, such as when persisting them to an Event Store.
+    """
+
+    def serialize(self, event: Event) -> bytes:
+        """
+        Serializes an Event, including enough information to deserialize it as the same type.
+
+        Args:
+            event (Event): The Event to serialize
+
+        Returns:
+            bytes: The serialized Event
+        """
+
+        ...
+
+    def deserialize(self, data: bytes | memoryview) -> Event:
+        """
+        Deserializes an Event serialized by `serialize`.
+
+        Args:
+            data (bytes | memoryview): The serialized Event. Must not be retained after returning.
+
+        Returns:
+            Event: The deserialized Event
+        """
+
+        ...
+
+
+class JsonEventSerializer:
+    """
+    Event Serializer storing Events as JSON, prefixed by the name of their type and their schema version if later
+    than 1. Events serialized with an older schema version are upcast by the given upcasters before being validated.
+
+    Example:
+        ```
+        serializer = JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)
+        ```
+    """
+
+    def __init__(self, *event_types: type[Event], upcasters: UpcasterRegistry | None = None) -> None:
+        """
+        Args:
+            *event_types (type[Event]): The Event types to serialize; each must have a unique class name.
+            upcasters (UpcasterRegistry | None, optional):
+                The upcasters converting Events serialized with an older schema version. Defaults to None.
+
+        Raises:
+            ValueError: Occurs if two Event types have the same class name.
+        """
+
+        self.__types: dict[bytes, type[Event]] = {}
+        self.__tags: dict[type[Event], bytes] = {}
+        self.__upcasters = upcasters if upcasters is not None else UpcasterRegistry()
+        for event_type in event_types:
+            tag = event_type.__name__.encode()
+            if self.__types.setdefault(tag, event_type) is not event_type:
+                raise ValueError(f"More than one Event type is named {event_type.__name__}")
+
+            schema_version = event_type.get_schema_version()
+            self.__tags[event_type] = tag + (b"@%d" % schema_version if schema_version != 1 else b"") + b"\n"
+
+        # The longest header: a type name, then "@" and the digits of its schema version, then the newline
+        self.__header_size = max((len(tag) for tag in self.__types), default=0) + 22
+
+    def serialize(self, event: Event) -> bytes:
+        try:
+            prefix = self.__tags[type(event)]
+        except KeyError:
+            raise ValueError(f"Event type {type(event).__name__} is not registered with the serializer") from None
+
+        return prefix + event.__pydantic_serializer__.to_json(event)
+
+    def deserialize(self, data: bytes | memoryview) -> Event:
+        # Slice views before copying them, so that only the header and the JSON are copied out of a mapped file, as
+        # Pydantic does not parse memoryviews
+        view = memoryview(data)
+        header = bytes(view[: self.__header_size])
+        separator = header.index(b"\n")
+        name, _, version = header[:separator].partition(b"@")
+        event_type = self.__types[name]
+        body = bytes(view[separator + 1 :])
+
+        schema_version = int(version) if version else 1
+        if schema_version == event_type.__schema_version__:
+            return event_type.model_validate_json(body)
+
+        fields = self.__upcasters.upcast(event_type.get_type_tag(), schema_version, from_json(body))
+        return event_type.model_validate(fields)
@@ -0,0 +1,82 @@
+from typing_extensions import Any, Protocol
+
+from pydantic import NonNegativeFloat, NonNegativeInt, PositiveInt
+
+from ..value_object import ValueObject
+
+
+class Snapshot(ValueObject):
+    """
+    Value Object holding the serialized state of an Event-Sourced Aggregate at a given version, allowing the Aggregate
+    to be loaded without replaying the events up to that version.
+    """
+
+    id: Any
+    "The unique identifier of the Aggregate"
+
+    version: NonNegativeInt
+    "The version of the Aggregate at the time the snapshot was taken"
+
+    state: Any
+    "The serialized state of the Aggregate, as returned by `EventSourcedAggregate._take_snapshot`"
+
+
+class SnapshotPolicy(Protocol):
+    """
+    Protocol for deciding when to take a new Snapshot of an Aggregate after it has been loaded.
+    """
+
+    def should_snapshot(self, events_replayed: int, replay_seconds: float) -> bool:
+        """
+        Determines whether a new Snapshot should be taken of a loaded Aggregate.
+
+        Args:
+            events_replayed (int): The number of events replayed since the latest Snapshot
+            replay_seconds (float): The time taken to load the Aggregate, in seconds
+
+        Returns:
+            bool: True if a new Snapshot should be taken
+        """
+
+        ...
+
+
+class EventCountPolicy(ValueObject):
+    """
+    Snapshot Policy that takes a new Snapshot once a number of events have been replayed since the latest Snapshot.
+    """
+
+    every: PositiveInt
+    "The number of events after which to take a new Snapshot"
+
+    def should_snapshot(self, events_replayed: int, replay_seconds: float) -> bool:
+        return events_replayed >= self.every
+
+
+class ReplayTimePolicy(ValueObject):
+    """
+    Snapshot Policy that takes a new Snapshot once loading the Aggregate takes longer than a threshold.
+    """
+
+    threshold_seconds: NonNegativeFloat
+    "The time in seconds after which to take a new Snapshot"
+
+    def should_snapshot(self, events_replayed: int, replay_seconds: float) -> bool:
+        return events_replayed > 0 and replay_seconds > self.threshold_seconds
+
+
+class InMemorySnapshotStore:
+    """
+    Reference Snapshot Store keeping the latest Snapshot of each Aggregate in memory, such as for testing.
+    """
+
+    def __init__(self) -> None:
+        self.__snapshots: dict[Any, Snapshot] = {}
+
+    def load(self, id: Any) -> Snapshot | None:
+        return self.__snapshots.get(id)
+
+    def save(self, snapshot: Snapshot) -> None:
+        latest = self.__snapshots.get(snapshot.id)
+        if latest is None or latest.version <= snapshot.version:
+            self.__snapshots[snapshot.id] = snapshot
@@ -0,0 +1,333 @@
+import json
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing_extensions import Any, NoReturn, Self
+
+from ..eda.event import Event
+from .aggregate import EventSourcedAggregate
+from .errors import ConcurrencyError
+from .serializer import EventSerializer
+from .stream import EventStream, LazyEventStream, RecordedEvent
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS events (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    UNIQUE (stream_id, version)
+)
+"""
+
+_SELECT_EVENTS = "SELECT version, data FROM events WHERE stream_id = ? AND version > ? ORDER BY version"
+_SELECT_VERSION = "SELECT COALESCE(MAX(version), 0) FROM events WHERE stream_id = ?"
+_SELECT_MANY_EVENTS = (
+    "SELECT stream_id, version, data FROM events WHERE stream_id IN (SELECT value FROM json_each(?))"
+    " ORDER BY stream_id, version"
+)
+_SELECT_MANY_VERSIONS = (
+    "SELECT stream_id, MAX(version) FROM events WHERE stream_id IN (SELECT value FROM json_each(?)) GROUP BY stream_id"
+)
+_SELECT_ALL_EVENTS = (
+    "SELECT position, stream_id, version, data FROM events WHERE position > ? ORDER BY position LIMIT ?"
+)
+_INSERT_EVENT = "INSERT INTO events (stream_id, version, data) VALUES (?, ?, ?)"
+
+
+class SqliteConnectionPool:
+    """
+    A pool of SQLite connections that can be shared between threads, each connection being used by one thread at a
+    time. Connections are opened as needed, up to `size`, in WAL mode so that readers do not block the writer.
+    """
+
+    def __init__(self, database: str, size: int = 4, synchronous: str = "NORMAL") -> None:
+        """
+        Args:
+            database (str):
+                The path of the database file. An in-memory database (":memory:") is limited to a single connection.
+            size (int, optional): The maximum number of connections to open. Defaults to 4.
+            synchronous (str, optional):
+                The SQLite `synchronous` setting; "NORMAL" syncs to disk at WAL checkpoints rather than on every
+                commit. Defaults to "NORMAL".
+        """
+
+        self.__database = database
+        self.__synchronous = synchronous
+        self.__size = 1 if database == ":memory:" else size
+        self.__opened: list[sqlite3.Connection] = []
+        self.__idle: queue.LifoQueue[sqlite3.Connection | None] = queue.LifoQueue()
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection from the pool for the duration of the context, waiting for one to be returned if all
+        connections are in use.
+
+        Raises:
+            sqlite3.ProgrammingError: Occurs if the pool is closed, including while waiting for a connection.
+        """
+
+        if self.__closed:
+            self.__raise_closed()
+        try:
+            connection = self.__idle.get_nowait()
+        except queue.Empty:
+            connection = self.__open() or self.__idle.get()
+        if connection is None:
+            # The pool was closed, so pass the sentinel on to the next thread waiting for a connection
+            self.__idle.put(None)
+            self.__raise_closed()
+
+        try:
+            yield connection
+        finally:
+            with self.__lock:
+                self.__idle.put(None if self.__closed else connection)
+
+    def close(self) -> None:
+        "Closes all connections opened by the pool, after which no connection can be borrowed"
+
+        with self.__lock:
+            self.__closed = True
+            for connection in self.__opened:
+                connection.close()
+            self.__opened.clear()
+            while not self.__idle.empty():
+                self.__idle.get_nowait()
+
+    def __open(self) -> sqlite3.Connection | None:
+        with self.__lock:
+            if self.__closed:
+                self.__raise_closed()
+            if len(self.__opened) >= self.__size:
+                return None
+
+            # Transactions are managed explicitly by the Event Store
+            connection = sqlite3.connect(self.__database, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.__synchronous}")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self.__opened.append(connection)
+            return connection
+
+    @staticmethod
+    def __raise_closed() -> NoReturn:
+        raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+
+
+class SqliteEventStore:
+    """
+    Reference Event Store persisting Events to a SQLite database.
+
+    The changes of an Aggregate are inserted in a single transaction, after checking the version of its Event
+    Stream; a unique (stream_id, version) constraint also guards against concurrent writers. Statements are reused
+    from each connection's prepared statement cache.
+
+    Example:
+        ```
+        with SqliteEventStore("events.db", JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)) as store:
+            store.append(user)
+            user = User(event_stream=store.load(user.id))
+        ```
+    """
+
+    def __init__(self, database: str | SqliteConnectionPool, serializer: EventSerializer) -> None:
+        """
+        Args:
+            database (str | SqliteConnectionPool):
+                The path of the database file, or a connection pool to share between threads.
+            serializer (EventSerializer): Serializes the Events written to and read from the database.
+        """
+
+        self.__pool = SqliteConnectionPool(database) if isinstance(database, str) else database
+        self.__serializer = serializer
+
+        with self.__pool.connection() as connection:
+            connection.execute(_CREATE_TABLE)
+
+    def load(self, id: Any, after_version: int = 0) -> EventStream:
+        """
+        Loads an Event Stream from the Event Store for the provided Aggregate Id. Events are deserialized lazily as
+        the Event Stream is consumed.
+
+        Args:
+            id (Any): The Aggregate Id to load
+            after_version (int, optional): Only load the Events after this version. Defaults to 0.
+
+        Returns:
+            EventStream: The Event Stream for the Aggregate Id
+        """
+
+        with self.__pool.connection() as connection:
+            # Read the version from the same snapshot as the Events, as it may be read by a second query
+            connection.execute("BEGIN")
+            try:
+                rows = connection.execute(_SELECT_EVENTS, (str(id), after_version)).fetchall()
+                version = rows[-1][0] if rows else connection.execute(_SELECT_VERSION, (str(id),)).fetchone()[0]
+            finally:
+                connection.execute("COMMIT")
+
+        return LazyEventStream.from_trusted(version, self.__read(rows))
+
+    def load_many(self, ids: Iterable[Any]) -> dict[Any, EventStream]:
+        """
+        Loads the Event Streams of many Aggregates with a single query. Events are deserialized lazily as each Event
+        Stream is consumed.
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids to load
+
+        Returns:
+            dict[Any, EventStream]:
+                The Event Stream for each Aggregate Id; Aggregate Ids without any Events map to an empty Event Stream.
+        """
+
+        ids = list(ids)
+        streams: dict[str, list[tuple[int, bytes]]] = {}
+        with self.__pool.connection() as connection:
+            for stream_id, version, data in connection.execute(_SELECT_MANY_EVENTS, (self.__json_ids(ids),)):
+                streams.setdefault(stream_id, []).append((version, data))
+
+        result: dict[Any, EventStream] = {}
+        for id in ids:
+            rows = streams.get(str(id), [])
+            result[id] = LazyEventStream.from_trusted(rows[-1][0] if rows else 0, self.__read(rows))
+        return result
+
+    def append(self, aggregate: EventSourcedAggregate) -> None:
+        """
+        Inserts the new Events of the Aggregate in a single transaction.
+
+        Args:
+            aggregate (EventSourcedAggregate):
+                The Aggregate instance whose changes will be appended to the Event Store
+
+        Raises:
+            ConcurrencyError: Occurs if the version of the Aggregate does not match the version of its Event Stream.
+        """
+
+        self.append_many([aggregate])
+
+    def append_many(self, aggregates: Sequence[EventSourcedAggregate]) -> None:
+        """
+        Inserts the new Events of many Aggregates in a single transaction, so that either all of them are appended
+        or none of them are.
+
+        Args:
+            aggregates (Sequence[EventSourcedAggregate]):
+                The Aggregate instances whose changes will be appended to the Event Store
+
+        Raises:
+            ConcurrencyError:
+                Occurs if the version of any Aggregate does not match the version of its Event Stream, in which case
+                no Events are appended.
+        """
+
+        aggregates = [aggregate for aggregate in aggregates if aggregate.changes]
+        if not aggregates:
+            return
+
+        rows = [
+            (str(aggregate.id), version, self.__serializer.serialize(event))
+            for aggregate in aggregates
+            for version, event in enumerate(aggregate.changes, start=aggregate.version + 1)
+        ]
+        stream_ids = [str(aggregate.id) for aggregate in aggregates]
+
+        with self.__pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                versions = dict(connection.execute(_SELECT_MANY_VERSIONS, (self.__json_ids(stream_ids),)).fetchall())
+                for aggregate, stream_id in zip(aggregates, stream_ids):
+                    version = versions.get(stream_id, 0)
+                    if aggregate.version != version:
+                        raise ConcurrencyError(aggregate.id, aggregate.version, version)
+                    versions[stream_id] = version + len(aggregate.changes)
+
+                connection.executemany(_INSERT_EVENT, rows)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def get_version(self, id: Any) -> int:
+        """
+        Returns the current version of the Event Stream for a given Aggregate Id
+
+        Args:
+            id (Any): The Aggregate Id whose version to get
+
+        Returns:
+            int: The latest version number of the Aggregate
+        """
+
+        with self.__pool.connection() as connection:
+            return connection.execute(_SELECT_VERSION, (str(id),)).fetchone()[0]
+
+    def get_versions(self, ids: Iterable[Any]) -> dict[Any, int]:
+        """
+        Returns the current versions of the Event Streams for many Aggregate Ids with a single query
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids whose versions to get
+
+        Returns:
+            dict[Any, int]: The latest version number of each Aggregate, or 0 for Aggregate Ids without any Events
+        """
+
+        ids = list(ids)
+        with self.__pool.connection() as connection:
+            versions = dict(connection.execute(_SELECT_MANY_VERSIONS, (self.__json_ids(ids),)).fetchall())
+
+        return {id: versions.get(str(id), 0) for id in ids}
+
+    def read_all(self, after_position: int = 0, limit: int = 1000) -> list[RecordedEvent]:
+        """
+        Reads the Events of all Aggregates in the order they were appended.
+
+        The global position of each Event is its row's AUTOINCREMENT key. As appends hold the database's write lock
+        from their version check until they commit, Events become visible in order of their global position.
+
+        Args:
+            after_position (int, optional): Only read the Events after this global position. Defaults to 0.
+            limit (int, optional): The maximum number of Events to read. Defaults to 1000.
+
+        Returns:
+            list[RecordedEvent]: The Events read, in order of their global position
+        """
+
+        with self.__pool.connection() as connection:
+            rows = connection.execute(_SELECT_ALL_EVENTS, (after_position, limit)).fetchall()
+
+        deserialize = self.__serializer.deserialize
+        return [
+            RecordedEvent(position=position, stream_id=stream_id, version=version, event=deserialize(data))
+            for position, stream_id, version, data in rows
+        ]
+
+    def close(self) -> None:
+        "Closes the connections of the Event Store's connection pool"
+
+        self.__pool.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def __json_ids(ids: list[Any]) -> str:
+        "Encodes the Aggregate Ids as a JSON array, so any number of them can be bound to a single parameter"
+
+        return json.dumps([str(id) for id in ids])
+
+    def __read(self, rows: Sequence[tuple[int, bytes]]) -> Iterator[Event]:
+        deserialize = self.__serializer.deserialize
+        for _, data in rows:
+            yield deserialize(data)
@@ -1,7 +1,9 @@
+from collections.abc import Iterable, Sequence
 from typing_extensions import Any, Protocol
 
 from .aggregate import EventSourcedAggregate
-from .stream import EventStream
+from .snapshot import Snapshot
+from .stream import EventStream, RecordedEvent
 
 
 class EventStore(Protocol):
@@ -9,13 +11,16 @@ class EventStore(Protocol):
     Protocol for implementing an Event Store for Event-Sourced Aggregates.
     """
 
-    def load(self, id: Any) -> EventStream:
+    def load(self, id: Any, after_version: int = 0) -> EventStream:
         """
         Loads an Event Stream from the Event Store for the provided Aggregate Id, which can be used to recreate an
         Event Sourced Aggregate.
 
         Args:
             id (Any): The Aggregate Id to load
+            after_version (int, optional):
+                Only load the Events after this version, such as when the Aggregate is restored from a Snapshot.
+                Defaults to 0.
 
         Returns:
             EventStream: The Event Stream for the Aggregate Id
@@ -23,6 +28,21 @@ class EventStore(Protocol):
 
         ...
 
+    def load_many(self, ids: Iterable[Any]) -> dict[Any, EventStream]:
+        """
+        Loads the Event Streams of many Aggregates at once, such as when a command needs to reconcile a batch of
+        Aggregates.
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids to load
+
+        Returns:
+            dict[Any, EventStream]:
+                The Event Stream for each Aggregate Id; Aggregate Ids without any Events map to an empty Event Stream.
+        """
+
+        ...
+
     def append(self, aggregate: EventSourcedAggregate) -> None:
         """
         Updates the Event Store with the new Events from the Aggregate.
@@ -34,6 +54,18 @@ class EventStore(Protocol):
 
         ...
 
+    def append_many(self, aggregates: Sequence[EventSourcedAggregate]) -> None:
+        """
+        Updates the Event Store with the new Events from many Aggregates atomically, so that either all of the Events
+        are appended or none of them are.
+
+        Args:
+            aggregates (Sequence[EventSourcedAggregate]):
+                The Aggregate instances whose changes will be appended to the Event Store
+        """
+
+        ...
+
     def get_version(self, id: Any) -> int:
         """
         Returns the current version of the Event Stream for a given Aggregate Id
@@ -46,3 +78,97 @@ class EventStore(Protocol):
         """
 
         ...
+
+    def get_versions(self, ids: Iterable[Any]) -> dict[Any, int]:
+        """
+        Returns the current versions of the Event Streams for many Aggregate Ids at once
+
+        Args:
+            ids (Iterable[Any]): The Aggregate Ids whose versions to get
+
+        Returns:
+            dict[Any, int]: The latest version number of each Aggregate, or 0 for Aggregate Ids without any Events
+        """
+
+        ...
+
+
+class EventLog(Protocol):
+    """
+    Protocol for reading the Events of all Aggregates from an Event Store in a global order, such as for building
+    projections.
+    """
+
+    def read_all(self, after_position: int = 0, limit: int = 1000) -> list[RecordedEvent]:
+        """
+        Reads the Events of all Aggregates in order of their global position, which increases with each Event
+        appended to any Event Stream.
+
+        Args:
+            after_position (int, optional): Only read the Events after this global position. Defaults to 0.
+            limit (int, optional): The maximum number of Events to read. Defaults to 1000.
+
+        Returns:
+            list[RecordedEvent]: The Events read, in order of their global position
+        """
+
+        ...
+
+
+class CheckpointStore(Protocol):
+    """
+    Protocol for implementing a store of the global positions up to which subscriptions have handled Events.
+    """
+
+    def load(self, name: str) -> int:
+        """
+        Loads the checkpoint of a subscription.
+
+        Args:
+            name (str): The name of the subscription
+
+        Returns:
+            int: The global position of the last Event handled by the subscription, or 0 if none have been handled
+        """
+
+        ...
+
+    def save(self, name: str, position: int) -> None:
+        """
+        Saves the checkpoint of a subscription.
+
+        Args:
+            name (str): The name of the subscription
+            position (int): The global position of the last Event handled by the subscription
+        """
+
+        ...
+
+
+class SnapshotStore(Protocol):
+    """
+    Protocol for implementing a store of Snapshots for Event-Sourced Aggregates.
+    """
+
+    def load(self, id: Any) -> Snapshot | None:
+        """
+        Loads the latest Snapshot for the provided Aggregate Id.
+
+        Args:
+            id (Any): The Aggregate Id to load
+
+        Returns:
+            Snapshot | None: The latest Snapshot of the Aggregate, or None if no Snapshot has been taken
+        """
+
+        ...
+
+    def save(self, snapshot: Snapshot) -> None:
+        """
+        Saves a Snapshot of an Aggregate.
+
+        Args:
+            snapshot (Snapshot): The Snapshot to save
+        """
+
+        ...
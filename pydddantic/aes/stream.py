@@ -1,7 +1,7 @@
-from collections.abc import Iterator
-from typing_extensions import Generic, TypeVar
+from collections.abc import Iterable, Iterator
+from typing_extensions import Generic, Self, TypeVar
 
-from pydantic import NonNegativeInt
+from pydantic import NonNegativeInt, PositiveInt
 
 from ..eda.event import Event
 from ..value_object import ValueObject
@@ -22,3 +22,76 @@ class EventStream(ValueObject, Generic[TEvent]):
 
     def __iter__(self) -> Iterator[TEvent]:
         return iter(self.events)
+
+    @classmethod
+    def from_trusted(cls, version: int, events: Iterable[TEvent]) -> Self:
+        """
+        Creates an Event Stream from Events that are already valid instances, such as those deserialized by an Event
+        Store, without validating them again.
+
+        Args:
+            version (int): The current version of the Event Stream
+            events (Iterable[TEvent]): The Events of the Event Stream
+
+        Returns:
+            Self: The Event Stream
+        """
+
+        return cls.model_construct(version=version, events=events if isinstance(events, list) else list(events))
+
+
+class LazyEventStream(EventStream[TEvent]):
+    """
+    Event Stream wrapping an iterator of loaded events, such as raw records read from an Event Store, which are only
+    validated as they are consumed. This allows an Aggregate to be loaded without holding the entire stream of
+    events in memory at once.
+
+    NOTE: Unlike EventStream, a LazyEventStream can only be iterated once, and validation errors are raised while
+    iterating rather than when the stream is created.
+
+    Example:
+        ```
+        def read_records(id: UUID) -> Iterator[dict[str, Any]]:
+            for row in cursor.execute("SELECT data FROM events WHERE stream_id = ?", (str(id),)):
+                yield json.loads(row[0])
+
+        user = User(event_stream=LazyEventStream[UserCreatedEvent](version=version, events=read_records(id)))
+        ```
+    """
+
+    events: Iterable[TEvent]
+    "The Events loaded from the Event Store, validated as they are consumed."
+
+    @classmethod
+    def from_trusted(cls, version: int, events: Iterable[TEvent]) -> Self:
+        """
+        Creates a Lazy Event Stream from an iterator of Events that are already valid instances, such as those
+        deserialized by an Event Store, without validating them again as they are consumed.
+
+        Args:
+            version (int): The current version of the Event Stream
+            events (Iterable[TEvent]): The Events of the Event Stream
+
+        Returns:
+            Self: The Lazy Event Stream
+        """
+
+        return cls.model_construct(version=version, events=events)
+
+
+class RecordedEvent(ValueObject, Generic[TEvent]):
+    """
+    Value Object holding an Event read from the global log of an Event Store, along with where it was recorded.
+    """
+
+    position: PositiveInt
+    "The global position of the Event in the Event Store, increasing with each Event appended to any Event Stream"
+
+    stream_id: str
+    "The Aggregate Id of the Event Stream to which the Event was appended, as stored by the Event Store"
+
+    version: PositiveInt
+    "The version of the Event Stream after the Event was appended"
+
+    event: TEvent
+    "The recorded Event"
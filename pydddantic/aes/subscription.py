@@ -0,0 +1,111 @@
+import threading
+from collections.abc import Sequence
+from typing_extensions import Callable
+
+from .store import CheckpointStore, EventLog
+from .stream import RecordedEvent
+
+
+class CatchUpSubscription:
+    """
+    Feeds the Events of all Aggregates to a handler, such as a projection, in order of their global position.
+
+    The subscription starts from its saved checkpoint and catches up by reading the Event Log in large pages, saving
+    its checkpoint after each page is handled. Once caught up, `run` keeps polling the Event Log for newly appended
+    Events. Events are handled at least once: a page handled before a crash, but not yet checkpointed, is handled
+    again when the subscription resumes.
+
+    Example:
+        ```
+        def project(page: Sequence[RecordedEvent]) -> None:
+            for recorded in page:
+                user_names.apply(recorded.event)
+
+        subscription = CatchUpSubscription("user_names", event_store, project, checkpoint_store)
+        stop = threading.Event()
+        threading.Thread(target=subscription.run, args=(stop,)).start()
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        event_log: EventLog,
+        handler: Callable[[Sequence[RecordedEvent]], None],
+        checkpoint_store: CheckpointStore,
+        page_size: int = 1000,
+        poll_interval: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            name (str): The name of the subscription, under which its checkpoint is saved
+            event_log (EventLog): The Event Store from which to read Events
+            handler (Callable[[Sequence[RecordedEvent]], None]): Handles each page of Events read
+            checkpoint_store (CheckpointStore): The store from which to load and to which to save the checkpoint
+            page_size (int, optional): The maximum number of Events to read at once. Defaults to 1000.
+            poll_interval (float, optional):
+                The time to wait between reads once caught up, in seconds. Defaults to 0.5.
+        """
+
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        self.__name = name
+        self.__event_log = event_log
+        self.__handler = handler
+        self.__checkpoint_store = checkpoint_store
+        self.__page_size = page_size
+        self.__poll_interval = poll_interval
+        self.__position = checkpoint_store.load(name)
+
+    @property
+    def position(self) -> int:
+        "The global position of the last Event handled by the subscription"
+        return self.__position
+
+    def catch_up(self) -> int:
+        """
+        Handles all Events appended after the checkpoint, one page at a time, until the end of the Event Log.
+
+        Returns:
+            int: The number of Events handled
+        """
+
+        handled = 0
+        while True:
+            page = self.__event_log.read_all(self.__position, self.__page_size)
+            if page:
+                self.__handler(page)
+                self.__position = page[-1].position
+                self.__checkpoint_store.save(self.__name, self.__position)
+                handled += len(page)
+
+            if len(page) < self.__page_size:
+                return handled
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Catches up with the Event Log, then keeps handling newly appended Events until stopped.
+
+        Args:
+            stop (threading.Event): Set to stop the subscription
+        """
+
+        while not stop.is_set():
+            self.catch_up()
+            stop.wait(self.__poll_interval)
+
+
+class InMemoryCheckpointStore:
+    """
+    Reference Checkpoint Store keeping the checkpoint of each subscription in memory, such as for testing.
+    """
+
+    def __init__(self) -> None:
+        self.__checkpoints: dict[str, int] = {}
+
+    def load(self, name: str) -> int:
+        return self.__checkpoints.get(name, 0)
+
+    def save(self, name: str, position: int) -> None:
+        self.__checkpoints[name] = position
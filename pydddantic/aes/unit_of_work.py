@@ -0,0 +1,123 @@
+from collections.abc import Iterable
+from typing_extensions import Any, TypeVar
+
+from ..eda.event import Event
+from ..eda.message_bus import MessageBus
+from .aggregate import EventSourcedAggregate
+from .store import EventStore
+
+TAggregate = TypeVar("TAggregate", bound=EventSourcedAggregate)
+
+
+class UnitOfWork:
+    """
+    Tracks the Event-Sourced Aggregates loaded or added while handling a command, and commits all of their changes
+    to the Event Store at once.
+
+    On commit, the changes of every tracked Aggregate are appended in a single atomic write, with the version of each
+    Event Stream checked. The committed Events are then published to the Message Bus in one batch.
+
+    Example:
+        ```
+        uow = UnitOfWork(event_store)
+        for user in uow.load_many(User, user_ids):
+            user.deactivate()
+        uow.commit()
+        ```
+    """
+
+    def __init__(self, event_store: EventStore, message_bus: MessageBus | None = None) -> None:
+        """
+        Args:
+            event_store (EventStore): The Event Store from which to load and to which to append Aggregates
+            message_bus (MessageBus | None, optional):
+                The Message Bus on which to publish committed Events. Defaults to a new MessageBus instance.
+        """
+
+        self.__event_store = event_store
+        self.__message_bus = message_bus if message_bus is not None else MessageBus()
+        self.__aggregates: dict[str, EventSourcedAggregate] = {}
+
+    def load(self, aggregate_type: type[TAggregate], id: Any) -> TAggregate:
+        """
+        Loads an Aggregate from the Event Store and tracks it, or returns the tracked instance if it has already been
+        loaded or added.
+
+        Args:
+            aggregate_type (type[TAggregate]): The type of Aggregate to load
+            id (Any): The Aggregate Id to load
+
+        Returns:
+            TAggregate: The tracked Aggregate
+        """
+
+        return self.load_many(aggregate_type, [id])[0]
+
+    def load_many(self, aggregate_type: type[TAggregate], ids: Iterable[Any]) -> list[TAggregate]:
+        """
+        Loads many Aggregates from the Event Store at once and tracks them. Aggregates that have already been loaded
+        or added are not loaded again.
+
+        Args:
+            aggregate_type (type[TAggregate]): The type of Aggregate to load
+            ids (Iterable[Any]): The Aggregate Ids to load
+
+        Returns:
+            list[TAggregate]: The tracked Aggregates, in the order of the Aggregate Ids
+        """
+
+        ids = list(ids)
+        # Ids repeated, or given both as UUIDs and strings, are loaded once, as each Event Stream can only be read once
+        missing: dict[str, Any] = {}
+        for id in ids:
+            key = str(id)
+            if key not in self.__aggregates:
+                missing.setdefault(key, id)
+        if missing:
+            streams = self.__event_store.load_many(list(missing.values()))
+            for key, id in missing.items():
+                self.__aggregates[key] = aggregate_type(event_stream=streams[id])
+
+        return [self.__aggregates[str(id)] for id in ids]  # type: ignore[misc]
+
+    def add(self, aggregate: EventSourcedAggregate) -> None:
+        """
+        Tracks a new Aggregate, such as one just created by a command, so that it is appended on commit.
+
+        Args:
+            aggregate (EventSourcedAggregate): The Aggregate to track
+
+        Raises:
+            ValueError: Occurs if another instance of the Aggregate is already tracked.
+        """
+
+        tracked = self.__aggregates.setdefault(str(aggregate.id), aggregate)
+        if tracked is not aggregate:
+            raise ValueError(f"Another instance of Aggregate {aggregate.id} is already tracked")
+
+    def commit(self) -> None:
+        """
+        Appends the changes of all tracked Aggregates to the Event Store atomically, then publishes the committed
+        Events to the Message Bus.
+
+        The changes are cleared from the Aggregates once appended, before publishing, so that a failing subscriber
+        does not leave persisted Events looking uncommitted.
+
+        Raises:
+            ConcurrencyError:
+                Occurs if the version of any tracked Aggregate does not match the version of its Event Stream, in
+                which case nothing is appended or published.
+        """
+
+        aggregates = [aggregate for aggregate in self.__aggregates.values() if aggregate.changes]
+        if not aggregates:
+            return
+
+        self.__event_store.append_many(aggregates)
+
+        events: list[Event] = []
+        for aggregate in aggregates:
+            events.extend(aggregate.changes)
+            aggregate._commit_changes()
+
+        self.__message_bus.publish_many(events)
@@ -1,5 +1,10 @@
+from .async_message_bus import AsyncMessageBus
+from .async_subscriber import AsyncSubscriber
+from .codec import MessagePackCodec
 from .command import Command
+from .errors import CascadeLimitError, PublishError
 from .event import Event
 from .message import Message
 from .message_bus import MessageBus
-from .subscriber import Subscriber
+from .subscriber import BatchSubscriber, Subscriber
+from .upcaster import Upcaster, UpcasterRegistry
@@ -0,0 +1,169 @@
+import asyncio
+from contextvars import ContextVar
+from typing_extensions import Self
+
+from .async_subscriber import AsyncSubscriber
+from .errors import PublishError
+from .message import Message
+from .message_bus import _Outbox, _SubscriberIndex
+
+_index: ContextVar[_SubscriberIndex] = ContextVar("pydddantic_async_message_bus_index", default=_SubscriberIndex())
+_outbox: ContextVar[_Outbox | None] = ContextVar("pydddantic_async_message_bus_outbox", default=None)
+
+
+class AsyncMessageBus:
+    """
+    An asyncio Message Bus for publishing and subscribing to Domain Messages with coroutine handlers. All created
+    instances share the same subscribers within the current context; tasks inherit a copy of the subscribers when
+    they are created, so subscriptions made inside a task do not leak to other tasks.
+
+    When publishing, all matching subscribers are run concurrently, optionally limited to `max_concurrency`
+    handlers at a time. As with MessageBus, messages published by a handler are queued and published once the current
+    Message has been handled by all of its subscribers.
+
+    Example:
+        ```
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            await notifications.send(f"User created: {event}")
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](on_user_created)):
+            await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+        ```
+    """
+
+    def __init__(
+        self, max_concurrency: int | None = None, max_cascade_depth: int = 16, max_outbox_size: int = 10_000
+    ) -> None:
+        """
+        Args:
+            max_concurrency (int | None, optional):
+                The maximum number of subscribers to run at once for a published Message. May be None to run all
+                matching subscribers at once. Defaults to None.
+            max_cascade_depth (int, optional):
+                The maximum number of generations of messages published from within handlers, starting from the
+                originally published message. Defaults to 16.
+            max_outbox_size (int, optional):
+                The maximum number of messages that may be queued for publishing at once. Defaults to 10,000.
+        """
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.__max_concurrency = max_concurrency
+        self.__max_cascade_depth = max_cascade_depth
+        self.__max_outbox_size = max_outbox_size
+
+    async def publish(self, message: Message) -> None:
+        """
+        Publish a message to the Event Bus, and wait for all matching subscribers to handle it.
+
+        If called from within a handler, the message is queued and published after the current message has been
+        handled.
+
+        Args:
+            message (Message): A subclass of Event or Command to publish for subscribers to handle.
+
+        Raises:
+            RuntimeError: Occurs if an invalid subscriber is found.
+            PublishError: Occurs if one or more subscribers raised an exception; all other subscribers of the same
+                message still run, but queued messages are discarded.
+            CascadeLimitError: Occurs if queueing the message would exceed the cascade depth or outbox size limits.
+        """
+
+        outbox = _outbox.get()
+        if outbox is not None:
+            outbox.enqueue(message)
+            return
+
+        outbox = _Outbox()
+        outbox.max_depth = self.__max_cascade_depth
+        outbox.max_size = self.__max_outbox_size
+
+        token = _outbox.set(outbox)
+        try:
+            await self.__dispatch(outbox, message, 0)
+
+            queued = outbox.messages
+            while queued:
+                message, depth = queued.popleft()
+                await self.__dispatch(outbox, message, depth)
+
+        finally:
+            _outbox.reset(token)
+
+    def subscribe(self, *subscriber: AsyncSubscriber) -> Self:
+        """
+        Subscribe to messages published to the Event Bus.
+
+        Example:
+            AsyncMessageBus().subscribe(
+                AsyncSubscriber[UserCreated](self.__on_user_created),
+                AsyncSubscriber[UserUpdated](self.__on_user_updated),
+            )
+
+        Returns:
+            Self: Returns the instance of the AsyncMessageBus to allow for chaining.
+        """
+
+        if _outbox.get() is None:
+            _index.set(_index.get().extend(subscriber))
+        return self
+
+    def reset(self) -> Self:
+        """
+        Clears all subscribers from the Event Bus in the current context.
+
+        Returns:
+            Self: Returns the instance of the AsyncMessageBus to allow for chaining.
+        """
+
+        if _outbox.get() is None:
+            _index.set(_SubscriberIndex())
+        return self
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.reset()
+
+    async def __dispatch(self, outbox: _Outbox, message: Message, depth: int) -> None:
+        subscribers = _index.get().resolve(type(message))
+        if not subscribers:
+            return
+
+        outbox.depth = depth
+        if len(subscribers) == 1:
+            errors = await self.__run_one(subscribers[0], message)
+        else:
+            errors = await self.__run_all(subscribers, message)
+
+        if errors:
+            raise PublishError(message, errors)
+
+    @staticmethod
+    async def __run_one(subscriber: AsyncSubscriber, message: Message) -> list[Exception]:
+        try:
+            await subscriber._handle(message)
+        except Exception as e:
+            return [e]
+        return []
+
+    async def __run_all(self, subscribers: tuple[AsyncSubscriber, ...], message: Message) -> list[Exception]:
+        if self.__max_concurrency is None or self.__max_concurrency >= len(subscribers):
+            handlers = [subscriber._handle(message) for subscriber in subscribers]
+        else:
+            semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+            async def limited(subscriber: AsyncSubscriber) -> None:
+                async with semaphore:
+                    await subscriber._handle(message)
+
+            handlers = [limited(subscriber) for subscriber in subscribers]
+
+        results = await asyncio.gather(*handlers, return_exceptions=True)
+        for result in results:
+            # Cancellation and interpreter exits are not subscriber failures, so let them through as they are
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return [result for result in results if isinstance(result, Exception)]
@@ -0,0 +1,30 @@
+from collections.abc import Awaitable
+from typing_extensions import Callable, TypeVar
+
+from ..value import Value
+from .message import Message
+
+TMessage = TypeVar("TMessage", bound=Message)
+
+
+class AsyncSubscriber(Value[Callable[[TMessage], Awaitable[None]]]):
+    """
+    Create an asynchronous Domain Message Subscriber to handle a specific type of Domain Message with a coroutine
+    function. The Message type is specified via the Generic parameter. If a base Message type is used, the Subscriber
+    will also handle any subtype of that Message.
+
+    If a Generic parameter is not provided, a RuntimeError will be raised when the Async Message Bus encounters the
+    Subscriber.
+
+    Example:
+        ```
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            await notifications.send(f"User created: {event}")
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](on_user_created)):
+            await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+        ```
+    """
+
+    async def _handle(self, message: TMessage) -> None:
+        await self.root(message)
@@ -0,0 +1,400 @@
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing_extensions import Any, Callable
+from uuid import UUID
+
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+from .message import Message
+from .upcaster import UpcasterRegistry
+
+_EXT_TIMESTAMP = -1
+"The MessagePack extension type for timestamps"
+
+_EXT_UUID = 1
+"The extension type for UUIDs, stored as their 16 bytes"
+
+_SERIALIZATION_MODE = "msgpack"
+"The Pydantic serialization mode of Messages, in which UniqueIds are kept as UUIDs rather than dumped as strings"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_Packer = Callable[[Any, bytearray], None]
+
+
+def _pack_nil(value: None, buffer: bytearray) -> None:
+    buffer.append(0xC0)
+
+
+def _pack_bool(value: bool, buffer: bytearray) -> None:
+    buffer.append(0xC3 if value else 0xC2)
+
+
+def _pack_int(value: int, buffer: bytearray) -> None:
+    if 0 <= value < 0x80:
+        buffer.append(value)
+    elif -0x20 <= value < 0:
+        buffer.append(value & 0xFF)
+    elif value >= 0:
+        _pack_uint(value, buffer)
+    elif value >= -0x80:
+        buffer += struct.pack(">Bb", 0xD0, value)
+    elif value >= -0x8000:
+        buffer += struct.pack(">Bh", 0xD1, value)
+    elif value >= -0x80000000:
+        buffer += struct.pack(">Bi", 0xD2, value)
+    elif value >= -0x8000000000000000:
+        buffer += struct.pack(">Bq", 0xD3, value)
+    else:
+        _pack_big_int(value, buffer)
+
+
+def _pack_uint(value: int, buffer: bytearray) -> None:
+    if value <= 0xFF:
+        buffer += struct.pack(">BB", 0xCC, value)
+    elif value <= 0xFFFF:
+        buffer += struct.pack(">BH", 0xCD, value)
+    elif value <= 0xFFFFFFFF:
+        buffer += struct.pack(">BI", 0xCE, value)
+    elif value <= 0xFFFFFFFFFFFFFFFF:
+        buffer += struct.pack(">BQ", 0xCF, value)
+    else:
+        _pack_big_int(value, buffer)
+
+
+def _pack_big_int(value: int, buffer: bytearray) -> None:
+    # Integers beyond the 64 bits of MessagePack's are stored as their digits, like Decimals, which Pydantic parses
+    _pack_str(str(value), buffer)
+
+
+def _pack_float(value: float, buffer: bytearray) -> None:
+    buffer += struct.pack(">Bd", 0xCB, value)
+
+
+def _pack_str(value: str, buffer: bytearray) -> None:
+    data = value.encode()
+    length = len(data)
+    if length < 0x20:
+        buffer.append(0xA0 | length)
+    elif length <= 0xFF:
+        buffer += struct.pack(">BB", 0xD9, length)
+    elif length <= 0xFFFF:
+        buffer += struct.pack(">BH", 0xDA, length)
+    else:
+        buffer += struct.pack(">BI", 0xDB, length)
+    buffer += data
+
+
+def _pack_bytes(value: bytes, buffer: bytearray) -> None:
+    length = len(value)
+    if length <= 0xFF:
+        buffer += struct.pack(">BB", 0xC4, length)
+    elif length <= 0xFFFF:
+        buffer += struct.pack(">BH", 0xC5, length)
+    else:
+        buffer += struct.pack(">BI", 0xC6, length)
+    buffer += value
+
+
+def _pack_array(value: list | tuple | set | frozenset, buffer: bytearray) -> None:
+    length = len(value)
+    if length < 0x10:
+        buffer.append(0x90 | length)
+    elif length <= 0xFFFF:
+        buffer += struct.pack(">BH", 0xDC, length)
+    else:
+        buffer += struct.pack(">BI", 0xDD, length)
+    for item in value:
+        _pack(item, buffer)
+
+
+def _pack_map(value: dict, buffer: bytearray) -> None:
+    length = len(value)
+    if length < 0x10:
+        buffer.append(0x80 | length)
+    elif length <= 0xFFFF:
+        buffer += struct.pack(">BH", 0xDE, length)
+    else:
+        buffer += struct.pack(">BI", 0xDF, length)
+    for key, item in value.items():
+        _pack(key, buffer)
+        _pack(item, buffer)
+
+
+def _pack_uuid(value: UUID, buffer: bytearray) -> None:
+    buffer += struct.pack(">Bb", 0xD8, _EXT_UUID)
+    buffer += value.bytes
+
+
+def _pack_datetime(value: datetime, buffer: bytearray) -> None:
+    if value.tzinfo is None:
+        # Timestamps are instants in UTC, which would lose that the date and time are local
+        _pack_str(value.isoformat(), buffer)
+        return
+
+    delta = value - _EPOCH
+    seconds = delta.days * 86_400 + delta.seconds
+    buffer += struct.pack(">BBbIq", 0xC7, 12, _EXT_TIMESTAMP, delta.microseconds * 1000, seconds)
+
+
+def _pack_isoformat(value: date | time, buffer: bytearray) -> None:
+    _pack_str(value.isoformat(), buffer)
+
+
+def _pack_decimal(value: Decimal, buffer: bytearray) -> None:
+    _pack_str(str(value), buffer)
+
+
+def _pack_enum(value: Enum, buffer: bytearray) -> None:
+    _pack(value.value, buffer)
+
+
+def _pack_jsonable(value: Any, buffer: bytearray) -> None:
+    # Other types known to Pydantic, such as timedeltas, are stored as they would be in JSON, which Pydantic parses
+    _pack(to_jsonable_python(value), buffer)
+
+
+_packers: dict[type, _Packer] = {
+    type(None): _pack_nil,
+    bool: _pack_bool,
+    int: _pack_int,
+    float: _pack_float,
+    str: _pack_str,
+    bytes: _pack_bytes,
+    list: _pack_array,
+    tuple: _pack_array,
+    set: _pack_array,
+    frozenset: _pack_array,
+    dict: _pack_map,
+    UUID: _pack_uuid,
+    datetime: _pack_datetime,
+    date: _pack_isoformat,
+    time: _pack_isoformat,
+    Decimal: _pack_decimal,
+}
+
+# Checked in order for subclasses of the packed types, such as UniqueId or str-based Enums
+_subclass_packers: list[tuple[type, _Packer]] = [(Enum, _pack_enum)] + [
+    (packed_type, packer) for packed_type, packer in _packers.items() if packed_type is not type(None)
+]
+
+
+def _pack(value: Any, buffer: bytearray) -> None:
+    packer = _packers.get(type(value))
+    if packer is None:
+        for packed_type, subclass_packer in _subclass_packers:
+            if isinstance(value, packed_type):
+                packer = _packers[type(value)] = subclass_packer
+                break
+        else:
+            try:
+                to_jsonable_python(value)
+            except PydanticSerializationError:
+                raise TypeError(f"Cannot serialize values of type {type(value).__name__}") from None
+            packer = _packers[type(value)] = _pack_jsonable
+
+    packer(value, buffer)
+
+
+class _Unpacker:
+    """
+    Reads the values of a MessagePack buffer in a single pass.
+    """
+
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def read(self, size: int) -> bytes:
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.data):
+            raise ValueError("Unexpected end of MessagePack data")
+        return self.data[start : self.offset]
+
+    def unpack(self, format: struct.Struct) -> Any:
+        return format.unpack(self.read(format.size))[0]
+
+    def value(self) -> Any:
+        data, offset = self.data, self.offset
+        if offset >= len(data):
+            raise ValueError("Unexpected end of MessagePack data")
+        code = data[offset]
+        self.offset = offset + 1
+
+        # Inline the most common types, small integers and strings
+        if code < 0x80:
+            return code
+        if 0xA0 <= code < 0xC0:
+            return self.read(code & 0x1F).decode()
+
+        reader = _readers[code]
+        if reader is None:
+            raise ValueError(f"Unsupported MessagePack type 0x{code:02x}")
+        return reader(self, code)
+
+    def array(self, length: int) -> list:
+        return [self.value() for _ in range(length)]
+
+    def map(self, length: int) -> dict:
+        return {self.value(): self.value() for _ in range(length)}
+
+    def ext(self, length: int) -> Any:
+        ext_type = self.unpack(_INT8)
+        data = self.read(length)
+
+        if ext_type == _EXT_UUID and length == 16:
+            return UUID(bytes=data)
+        if ext_type == _EXT_TIMESTAMP and length == 12:
+            nanoseconds, seconds = struct.unpack(">Iq", data)
+            return _EPOCH + timedelta(seconds=seconds, microseconds=nanoseconds // 1000)
+        raise ValueError(f"Unsupported MessagePack extension type {ext_type} of length {length}")
+
+
+_INT8 = struct.Struct(">b")
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+
+_Reader = Callable[[_Unpacker, int], Any]
+
+_readers: list[_Reader | None] = [None] * 0x100
+"The functions reading each MessagePack type, indexed by the first byte of its values"
+
+
+def _register(codes: range | tuple[int, ...], reader: _Reader) -> None:
+    for code in codes:
+        _readers[code] = reader
+
+
+def _number(format: str) -> _Reader:
+    number = struct.Struct(format)
+    return lambda unpacker, code: unpacker.unpack(number)
+
+
+def _sized(size: struct.Struct, read: Callable[[_Unpacker, int], Any]) -> _Reader:
+    return lambda unpacker, code: read(unpacker, unpacker.unpack(size))
+
+
+def _fixed_ext(length: int) -> _Reader:
+    return lambda unpacker, code: unpacker.ext(length)
+
+
+def _read_str(unpacker: _Unpacker, length: int) -> str:
+    return unpacker.read(length).decode()
+
+
+_register(range(0x00, 0x80), lambda unpacker, code: code)
+_register(range(0xE0, 0x100), lambda unpacker, code: code - 0x100)
+_register(range(0x80, 0x90), lambda unpacker, code: unpacker.map(code & 0x0F))
+_register(range(0x90, 0xA0), lambda unpacker, code: unpacker.array(code & 0x0F))
+_register(range(0xA0, 0xC0), lambda unpacker, code: _read_str(unpacker, code & 0x1F))
+_register((0xC0,), lambda unpacker, code: None)
+_register((0xC2,), lambda unpacker, code: False)
+_register((0xC3,), lambda unpacker, code: True)
+
+for _code, _format in zip(range(0xCA, 0xD4), (">f", ">d", ">B", ">H", ">I", ">Q", ">b", ">h", ">i", ">q")):
+    _register((_code,), _number(_format))
+
+for _codes, _read in (
+    ((0xC4, 0xC5, 0xC6), _Unpacker.read),
+    ((0xC7, 0xC8, 0xC9), _Unpacker.ext),
+    ((0xD9, 0xDA, 0xDB), _read_str),
+):
+    for _code, _size in zip(_codes, (_UINT8, _UINT16, _UINT32)):
+        _register((_code,), _sized(_size, _read))
+
+for _codes, _read in (((0xDC, 0xDD), _Unpacker.array), ((0xDE, 0xDF), _Unpacker.map)):
+    for _code, _size in zip(_codes, (_UINT16, _UINT32)):
+        _register((_code,), _sized(_size, _read))
+
+for _code, _length in zip(range(0xD4, 0xD9), (1, 2, 4, 8, 16)):
+    _register((_code,), _fixed_ext(_length))
+
+
+class MessagePackCodec:
+    """
+    Serializes Messages to a compact binary form using the MessagePack format, so that any MessagePack library can
+    read them. Each Message is written as an array of its type tag, its schema version if later than 1, and a map of
+    its fields, with UUIDs (including UniqueIds) stored as 16 bytes and timezone-aware datetimes as MessagePack
+    timestamps. Other values MessagePack has no type for, such as timedeltas or integers beyond 64 bits, are stored as
+    they would be in JSON.
+
+    Messages are deserialized as the type registered under their type tag, so the codec needs no list of types and
+    can be used as the serializer of an Event Store, or to send Messages between processes. Messages serialized with
+    an older schema version are upcast by the given upcasters before being validated.
+
+    Example:
+        ```
+        codec = MessagePackCodec()
+        event = codec.deserialize(codec.serialize(UserCreatedEvent(id=uuid4(), name="Alice")))
+
+        store = FileEventStore("./events", codec)
+        ```
+    """
+
+    def __init__(self, upcasters: UpcasterRegistry | None = None) -> None:
+        """
+        Args:
+            upcasters (UpcasterRegistry | None, optional):
+                The upcasters converting Messages serialized with an older schema version. Defaults to None.
+        """
+
+        self.__upcasters = upcasters if upcasters is not None else UpcasterRegistry()
+
+    def serialize(self, message: Message) -> bytes:
+        """
+        Serializes a Message along with its type tag and schema version.
+
+        Args:
+            message (Message): The Message to serialize
+
+        Raises:
+            TypeError: Occurs if a field holds a value of a type that cannot be serialized.
+
+        Returns:
+            bytes: The serialized Message
+        """
+
+        schema_version = message.get_schema_version()
+        buffer = bytearray(b"\x92" if schema_version == 1 else b"\x93")
+        _pack_str(message.get_type_tag(), buffer)
+        if schema_version != 1:
+            _pack_int(schema_version, buffer)
+        _pack_map(message.__pydantic_serializer__.to_python(message, mode=_SERIALIZATION_MODE), buffer)
+        return bytes(buffer)
+
+    def deserialize(self, data: bytes | memoryview) -> Any:
+        """
+        Deserializes a Message serialized by `serialize`, as the type registered under its type tag.
+
+        Args:
+            data (bytes | memoryview): The serialized Message. Must not be retained after returning.
+
+        Raises:
+            ValueError:
+                Occurs if the data is not a serialized Message, its type tag is not registered, or it cannot be upcast
+                from its schema version.
+
+        Returns:
+            Message: The deserialized Message
+        """
+
+        unpacker = _Unpacker(bytes(data))
+        decoded = unpacker.value()
+        if unpacker.offset != len(unpacker.data):
+            raise ValueError("Unexpected data after the serialized Message")
+        if not (isinstance(decoded, list) and len(decoded) in (2, 3) and isinstance(decoded[0], str)):
+            raise ValueError("Data is not a serialized Message")
+
+        tag, fields = decoded[0], decoded[-1]
+        schema_version = decoded[1] if len(decoded) == 3 else 1
+
+        message_type = Message.resolve_type_tag(tag)
+        if schema_version != message_type.__schema_version__:
+            fields = self.__upcasters.upcast(tag, schema_version, fields)
+        return message_type.model_validate(fields)
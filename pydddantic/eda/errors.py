@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+
+from .message import Message
+
+
+class PublishError(Exception):
+    """
+    Raised when one or more subscribers fail while handling published Messages. The individual exceptions raised by
+    the subscribers are available via the `errors` attribute.
+    """
+
+    def __init__(self, message: Message | Sequence[Message], errors: Sequence[BaseException]) -> None:
+        messages = [message] if isinstance(message, Message) else list(message)
+        message_types = ", ".join(dict.fromkeys(type(message).__name__ for message in messages))
+        super().__init__(f"{len(errors)} subscriber(s) failed to handle {message_types}")
+
+        self.message = messages[0]
+        "The published Message, or the first of the published Messages"
+
+        self.messages = messages
+        "The published Messages"
+
+        self.errors = list(errors)
+        "The exceptions raised by the subscribers"
+
+
+class CascadeLimitError(RuntimeError):
+    """
+    Raised when messages published from within handlers exceed the limits of the Message Bus, such as when handlers
+    keep publishing messages that trigger each other.
+    """
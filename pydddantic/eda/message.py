@@ -1,12 +1,98 @@
 from abc import ABC
+from typing_extensions import Any, ClassVar
 
 from ..value_object import ValueObject
 
+_message_types: dict[str, type["Message"]] = {}
+
 
 class Message(ValueObject, ABC):
     """
     Abstract base class for a Domain Message, such as a Command or an Event.
     NOTE: This class is not meant to be subclassed directly by your project.
+
+    Every Message type is registered under a type tag when it is defined, so that serialized Messages can be
+    deserialized as the right type. The tag defaults to the module and qualified name of the class, but a stable tag
+    can be given as a class argument, so that the class can be renamed or moved without breaking stored Messages.
+
+    A schema version, starting at 1, can also be given as a class argument, and should be incremented whenever the
+    fields of the Message change in a way that requires stored Messages to be upcast (see `UpcasterRegistry`).
+
+    Example:
+        ```
+        class UserCreatedEvent(Event, tag="user.created", schema_version=2):
+            id: UUID
+            name: str
+
+        assert Message.resolve_type_tag("user.created") is UserCreatedEvent
+        ```
     """
 
-    ...
+    __message_tag__: ClassVar[str]
+    __schema_version__: ClassVar[int]
+
+    def __init_subclass__(cls, tag: str | None = None, schema_version: int = 1, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if schema_version < 1:
+            raise ValueError("schema_version must be at least 1")
+
+        cls.__message_tag__ = tag or f"{cls.__module__}.{cls.__qualname__}"
+        cls.__schema_version__ = schema_version
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Parametrized generic Messages share the type tag of their generic class
+        if cls.__pydantic_generic_metadata__["origin"] is not None:
+            return
+
+        registered = _message_types.setdefault(cls.__message_tag__, cls)
+        if registered is not cls:
+            # Allow a class to be redefined, such as when its module is reloaded
+            if (registered.__module__, registered.__qualname__) != (cls.__module__, cls.__qualname__):
+                raise TypeError(f"Type tag {cls.__message_tag__!r} is already used by {registered.__qualname__}")
+            _message_types[cls.__message_tag__] = cls
+
+    @classmethod
+    def get_type_tag(cls) -> str:
+        """
+        Returns the tag under which the Message type is registered.
+
+        Returns:
+            str: The type tag
+        """
+
+        return cls.__message_tag__
+
+    @classmethod
+    def get_schema_version(cls) -> int:
+        """
+        Returns the current schema version of the Message type.
+
+        Returns:
+            int: The schema version
+        """
+
+        return cls.__schema_version__
+
+    @staticmethod
+    def resolve_type_tag(tag: str) -> type["Message"]:
+        """
+        Returns the Message type registered under a type tag.
+
+        Args:
+            tag (str): The type tag
+
+        Raises:
+            ValueError: Occurs if no Message type is registered under the type tag.
+
+        Returns:
+            type[Message]: The Message type
+        """
+
+        try:
+            return _message_types[tag]
+        except KeyError:
+            raise ValueError(f"No Message type is registered under type tag {tag!r}") from None
@@ -1,19 +1,133 @@
+import os
 import threading
-from typing_extensions import Self
+from collections import deque
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent.futures import Executor
+from itertools import groupby
+from typing_extensions import Callable, Self
 
+from .errors import CascadeLimitError, PublishError
 from .message import Message
 from .subscriber import Subscriber
 
 
+class _SubscriberIndex:
+    """
+    An immutable set of subscribers, along with a lazily built lookup of the subscribers that handle each concrete
+    Message type. Changing the subscribers creates a new index, which discards any previously resolved lookups.
+    """
+
+    __slots__ = ("subscribers", "__dispatch")
+
+    def __init__(self, subscribers: tuple[Subscriber, ...] = ()) -> None:
+        self.subscribers = subscribers
+        self.__dispatch: dict[type[Message], tuple[Subscriber, ...]] = {}
+
+    def extend(self, subscribers: tuple[Subscriber, ...]) -> "_SubscriberIndex":
+        return _SubscriberIndex(self.subscribers + subscribers)
+
+    def resolve(self, message_type: type[Message]) -> tuple[Subscriber, ...]:
+        """
+        Returns the subscribers handling the given Message type, in the order they were subscribed.
+
+        Raises:
+            RuntimeError: Occurs if an invalid subscriber is found.
+        """
+
+        try:
+            return self.__dispatch[message_type]
+        except KeyError:
+            pass
+
+        matches = []
+        for subscriber in self.subscribers:
+            if (
+                not hasattr(subscriber, "__pydantic_generic_metadata__")
+                or not subscriber.__pydantic_generic_metadata__["args"]
+            ):
+                # TODO: Custom exception
+                raise RuntimeError(
+                    f"Subscriber {subscriber} is missing a generic type annotation for the event type it handles."
+                )
+
+            if issubclass(message_type, subscriber.__pydantic_generic_metadata__["args"]):
+                matches.append(subscriber)
+
+        resolved = self.__dispatch[message_type] = tuple(matches)
+        return resolved
+
+
+class _Outbox:
+    """
+    A bounded FIFO queue of messages published from within handlers, waiting to be published.
+    """
+
+    __slots__ = ("messages", "depth", "high_water", "max_depth", "max_size")
+
+    def __init__(self) -> None:
+        self.messages: deque[tuple[Message, int]] = deque()
+        self.depth = 0
+        self.high_water = 0
+        self.max_depth = 0
+        self.max_size = 0
+
+    def enqueue(self, message: Message) -> None:
+        """
+        Queues the message one generation deeper than the message currently being published.
+
+        Raises:
+            CascadeLimitError: Occurs if queueing the message would exceed the cascade depth or outbox size limits.
+        """
+
+        depth = self.depth + 1
+        if depth > self.max_depth:
+            raise CascadeLimitError(
+                f"Publishing {type(message).__name__} exceeds the maximum cascade depth of {self.max_depth}"
+            )
+
+        messages = self.messages
+        if len(messages) >= self.max_size:
+            raise CascadeLimitError(
+                f"Publishing {type(message).__name__} exceeds the maximum outbox size of {self.max_size}"
+            )
+
+        messages.append((message, depth))
+        if len(messages) > self.high_water:
+            self.high_water = len(messages)
+
+
+class _PublishState:
+    """
+    The per-thread state of the Message Bus.
+    """
+
+    __slots__ = ("index", "publishing", "outbox")
+
+    def __init__(self) -> None:
+        self.index = _SubscriberIndex()
+        self.publishing = False
+        self.outbox = _Outbox()
+
+
 class MessageBus:
     """
     A thread-local Message Bus for publishing and subscribing to Domain Messages. All created instances share
-    the same subscribers.
+    the same subscribers within a thread, as well as any shared subscribers registered for all threads.
 
-    This bus is not designed for any kind of concurrency, only one handler runs at a time. The goal isn't to
+    By default, this bus is not designed for any kind of concurrency, only one handler runs at a time. The goal isn't to
     enable parallelization, but rather to separate tasks conceptually in order to help enforce the Single
     Responsibility Principle enable Eventual Consistency between Aggregates and/or Contexts.
 
+    Messages published by a handler while another Message is being published are queued, and are published in the
+    order they were queued once the current Message has been handled by all of its subscribers. The cascade of
+    queued messages is bounded by `max_cascade_depth` and `max_outbox_size` of the bus which started publishing.
+
+    Optionally, an `executor` may be provided to run independent subscribers in parallel, such as for CPU-heavy
+    projections. Each subscriber receives the published messages in order for each partition returned by
+    `partition_key` (e.g. the aggregate id), while different subscribers and partitions run in parallel. Publishing
+    returns once every subscriber has finished. When using a `ProcessPoolExecutor`, handlers and messages must be
+    picklable, and handlers run in the worker processes.
+
     Example:
         ```
         def on_user_created(event: UserCreatedEvent) -> None:
@@ -25,56 +139,117 @@ class MessageBus:
     """
 
     __local = threading.local()
+    __shared = _SubscriberIndex()
+    __shared_lock = threading.Lock()
 
-    @property
-    def __subscribers(self) -> list[Subscriber]:
-        if not hasattr(self.__local, "subscribers"):
-            self.__local.subscribers = []
-        return self.__local.subscribers
+    def __init__(
+        self,
+        max_cascade_depth: int = 16,
+        max_outbox_size: int = 10_000,
+        executor: Executor | None = None,
+        partition_key: Callable[[Message], Hashable] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_cascade_depth (int, optional):
+                The maximum number of generations of messages published from within handlers, starting from the
+                originally published message. Defaults to 16.
+            max_outbox_size (int, optional):
+                The maximum number of messages that may be queued for publishing at once. Defaults to 10,000.
+            executor (Executor | None, optional):
+                The executor used to run subscribers in parallel. May be None to run subscribers one at a time in the
+                publishing thread. Defaults to None.
+            partition_key (Callable[[Message], Hashable] | None, optional):
+                When using an executor, returns the key of the partition a message belongs to. Messages of the same
+                partition are handled in order by each subscriber. May be None to handle all messages in order.
+                Defaults to None.
+        """
+
+        self.__max_cascade_depth = max_cascade_depth
+        self.__max_outbox_size = max_outbox_size
+        self.__executor = executor
+        self.__partition_key = partition_key
 
     @property
-    def __publishing(self) -> bool:
-        if not hasattr(self.__local, "publishing"):
-            self.__local.publishing = False
-        return self.__local.publishing
+    def __state(self) -> _PublishState:
+        try:
+            return self.__local.state
+        except AttributeError:
+            state = self.__local.state = _PublishState()
+            return state
 
-    @__publishing.setter
-    def __publishing(self, value: bool) -> None:
-        self.__local.publishing = value
+    @property
+    def outbox_high_water(self) -> int:
+        "The largest number of messages that have been queued at once for publishing in the current thread"
+        return self.__state.outbox.high_water
 
     def publish(self, message: Message) -> None:
         """
         Publish a message to the Event Bus.
 
+        Subscribers for each concrete Message type are resolved once and cached until the subscribers change, so the
+        cost of publishing depends on the number of matching subscribers rather than the number subscribed.
+
+        If called from within a handler, the message is queued and published after the current message has been
+        handled.
+
         Args:
             message (Message): A subclass of Event or Command to publish for subscribers to handle.
 
         Raises:
             RuntimeError: Occurs if an invalid subscriber is found.
+            CascadeLimitError: Occurs if queueing the message would exceed the cascade depth or outbox size limits.
+            PublishError: Occurs if subscribers run by the executor raised an exception.
         """
 
-        if self.__publishing:
-            # TODO: What should we do here?
+        state = self.__state
+        if state.publishing:
+            state.outbox.enqueue(message)
             return
 
         try:
-            self.__publishing = True
+            self.__begin(state)
+            self.__dispatch(state, message, 0)
+            self.__drain(state)
+        finally:
+            self.__end(state)
+
+    def publish_many(self, messages: Iterable[Message]) -> None:
+        """
+        Publish several messages to the Event Bus at once.
+
+        Consecutive messages of the same concrete type are grouped, and the subscribers for each type are resolved
+        once per group. Batch subscribers receive all the messages of a group in a single call, while other
+        subscribers receive them one at a time. Groups are handled in the order given, so that every subscriber,
+        including those subscribed to a base type, receives the messages in the order they were published.
+
+        If called from within a handler, the messages are queued and published after the current message has been
+        handled.
 
-            for subscriber in self.__subscribers:
-                if (
-                    not hasattr(subscriber, "__pydantic_generic_metadata__")
-                    or not subscriber.__pydantic_generic_metadata__["args"]
-                ):
-                    # TODO: Custom exception
-                    raise RuntimeError(
-                        f"Subscriber {subscriber} is missing a generic type annotation for the event type it handles."
-                    )
+        Args:
+            messages (Iterable[Message]): Subclasses of Event or Command to publish for subscribers to handle.
 
-                if isinstance(message, subscriber.__pydantic_generic_metadata__["args"]):
-                    subscriber._handle(message)
+        Raises:
+            RuntimeError: Occurs if an invalid subscriber is found.
+            CascadeLimitError: Occurs if queueing the messages would exceed the cascade depth or outbox size limits.
+            PublishError: Occurs if subscribers run by the executor raised an exception.
+        """
 
+        state = self.__state
+        if state.publishing:
+            for message in messages:
+                state.outbox.enqueue(message)
+            return
+
+        try:
+            self.__begin(state)
+            if self.__executor is not None:
+                self.__dispatch_to_executor(state, list(messages), 0)
+            else:
+                self.__dispatch_groups(state, messages)
+            self.__drain(state)
         finally:
-            self.__publishing = False
+            self.__end(state)
 
     def subscribe(self, *subscriber: Subscriber) -> Self:
         """
@@ -90,20 +265,57 @@ class MessageBus:
             Self: Returns the instance of the MessageBus to allow for chaining.
         """
 
-        if not self.__publishing:
-            self.__subscribers.extend(subscriber)
+        state = self.__state
+        if not state.publishing:
+            state.index = state.index.extend(subscriber)
         return self
 
     def reset(self) -> Self:
         """
-        Clears all subscribers from the Event Bus.
+        Clears all subscribers of the current thread from the Event Bus. Shared subscribers are not affected.
+
+        Returns:
+            Self: Returns the instance of the MessageBus to allow for chaining.
+        """
+
+        state = self.__state
+        if not state.publishing:
+            state.index = _SubscriberIndex()
+        return self
+
+    def subscribe_shared(self, *subscriber: Subscriber) -> Self:
+        """
+        Subscribe to messages published to the Event Bus from any thread. Shared subscribers are handled before the
+        subscribers of the publishing thread.
+
+        Shared subscribers are stored in a process-wide, copy-on-write registry, so that they only need to be
+        subscribed once (e.g. at application startup) rather than in each thread, and publishing never needs to
+        acquire a lock to read them.
+
+        Example:
+            MessageBus().subscribe_shared(
+                Subscriber[UserCreated](on_user_created),
+                Subscriber[UserUpdated](on_user_updated),
+            )
+
+        Returns:
+            Self: Returns the instance of the MessageBus to allow for chaining.
+        """
+
+        with MessageBus.__shared_lock:
+            MessageBus.__shared = MessageBus.__shared.extend(subscriber)
+        return self
+
+    def reset_shared(self) -> Self:
+        """
+        Clears all shared subscribers from the Event Bus. Subscribers of each thread are not affected.
 
         Returns:
             Self: Returns the instance of the MessageBus to allow for chaining.
         """
 
-        if not self.__publishing:
-            self.__subscribers.clear()
+        with MessageBus.__shared_lock:
+            MessageBus.__shared = _SubscriberIndex()
         return self
 
     def __enter__(self) -> Self:
@@ -111,3 +323,135 @@ class MessageBus:
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.reset()
+
+    @staticmethod
+    def __resolve(state: _PublishState, message_type: type[Message]) -> tuple[Subscriber, ...]:
+        shared = MessageBus.__shared.resolve(message_type)
+        local = state.index.resolve(message_type)
+        return shared + local if shared and local else shared or local
+
+    def __begin(self, state: _PublishState) -> None:
+        state.publishing = True
+        state.outbox.max_depth = self.__max_cascade_depth
+        state.outbox.max_size = self.__max_outbox_size
+
+    def __drain(self, state: _PublishState) -> None:
+        queued = state.outbox.messages
+        if self.__executor is None:
+            while queued:
+                message, depth = queued.popleft()
+                self.__dispatch(state, message, depth)
+            return
+
+        # Dispatch each generation of queued messages to the executor at once
+        while queued:
+            depth = queued[0][1]
+            generation = []
+            while queued and queued[0][1] == depth:
+                generation.append(queued.popleft()[0])
+            self.__dispatch_to_executor(state, generation, depth)
+
+    @staticmethod
+    def __end(state: _PublishState) -> None:
+        state.outbox.messages.clear()
+        state.outbox.depth = 0
+        state.publishing = False
+
+    def __dispatch(self, state: _PublishState, message: Message, depth: int) -> None:
+        if self.__executor is not None:
+            self.__dispatch_to_executor(state, (message,), depth)
+            return
+
+        state.outbox.depth = depth
+        for subscriber in self.__resolve(state, type(message)):
+            subscriber._handle(message)
+
+    def __dispatch_groups(self, state: _PublishState, messages: Iterable[Message]) -> None:
+        # Only contiguous runs of the same type are grouped, so that every subscriber receives the messages in order
+        for message_type, run in groupby(messages, type):
+            group = list(run)
+            for subscriber in self.__resolve(state, message_type):
+                subscriber._handle_many(group)
+
+    def __partition(
+        self, state: _PublishState, messages: Sequence[Message]
+    ) -> dict[tuple[int, Hashable], tuple[Subscriber, list[Message]]]:
+        resolved: dict[type[Message], tuple[Subscriber, ...]] = {}
+        partitions: dict[tuple[int, Hashable], tuple[Subscriber, list[Message]]] = {}
+        partition_key = self.__partition_key
+
+        for message in messages:
+            message_type = type(message)
+            try:
+                subscribers = resolved[message_type]
+            except KeyError:
+                subscribers = resolved[message_type] = self.__resolve(state, message_type)
+
+            key = partition_key(message) if partition_key is not None and subscribers else None
+            for subscriber in subscribers:
+                try:
+                    partitions[id(subscriber), key][1].append(message)
+                except KeyError:
+                    partitions[id(subscriber), key] = (subscriber, [message])
+
+        return partitions
+
+    def __dispatch_to_executor(self, state: _PublishState, messages: Sequence[Message], depth: int) -> None:
+        partitions = self.__partition(state, messages)
+
+        outbox = state.outbox
+        outbox.depth = depth
+        origin = (os.getpid(), threading.get_ident())
+        futures = [
+            self.__executor.submit(
+                MessageBus._handle_in_worker, subscriber, partition, depth, outbox.max_depth, outbox.max_size, origin
+            )
+            for subscriber, partition in partitions.values()
+        ]
+
+        queued: list[Message] = []
+        errors: list[BaseException] = []
+        for future in futures:
+            try:
+                queued.extend(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise PublishError(messages, errors)
+
+        for message in queued:
+            outbox.enqueue(message)
+
+    @staticmethod
+    def _handle_in_worker(
+        subscriber: Subscriber,
+        messages: Sequence[Message],
+        depth: int,
+        max_depth: int,
+        max_size: int,
+        origin: tuple[int, int],
+    ) -> list[Message]:
+        """
+        Runs a subscriber for a partition of messages on an executor worker, returning the messages published by the
+        subscriber so that they can be queued by the publishing thread.
+        """
+
+        if (os.getpid(), threading.get_ident()) == origin:
+            # The executor ran the subscriber in the publishing thread, which already queues published messages
+            subscriber._handle_many(messages)
+            return []
+
+        bus = MessageBus(max_cascade_depth=max_depth, max_outbox_size=max_size)
+        state = bus.__state
+
+        # A forked worker process may have inherited the state of the publishing thread
+        bus.__end(state)
+
+        try:
+            bus.__begin(state)
+            state.outbox.depth = depth
+            subscriber._handle_many(messages)
+            return [message for message, _ in state.outbox.messages]
+        finally:
+            bus.__end(state)
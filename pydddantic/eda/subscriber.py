@@ -1,4 +1,5 @@
-from typing_extensions import Callable, TypeVar
+from collections.abc import Sequence
+from typing_extensions import Any, Callable, TypeVar
 
 from ..value import Value
 from .message import Message
@@ -26,3 +27,47 @@ class Subscriber(Value[Callable[[TMessage], None]]):
 
     def _handle(self, message: TMessage) -> None:
         self.root(message)
+
+    def _handle_many(self, messages: Sequence[TMessage]) -> None:
+        for message in messages:
+            self._handle(message)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Parametrized generic classes cannot be pickled by reference, so they are re-parametrized when unpickled,
+        # such as when sent to a ProcessPoolExecutor by the Message Bus
+        metadata = self.__pydantic_generic_metadata__
+        if metadata["origin"] is None:
+            return type(self), (self.root,)
+        return _parametrized_subscriber, (metadata["origin"], metadata["args"], self.root)
+
+
+class BatchSubscriber(Subscriber[TMessage]):
+    """
+    Create a Domain Message Subscriber that handles Domain Messages in batches, such as a projection performing a
+    single bulk write. When messages are published with `MessageBus.publish_many`, the handler is called once for each
+    concrete Message type with all of the published messages of that type; messages published individually are passed
+    to the handler as a batch of one.
+
+    Example:
+        ```
+        def on_users_created(events: Sequence[UserCreatedEvent]) -> None:
+            users_table.insert_many(events)
+
+        with MessageBus().subscribe(BatchSubscriber[UserCreatedEvent](on_users_created)):
+            MessageBus().publish_many(UserCreatedEvent(id=uuid4(), name=name) for name in ("Alice", "Bob"))
+        ```
+    """
+
+    root: Callable[[Sequence[TMessage]], None]
+
+    def _handle(self, message: TMessage) -> None:
+        self.root((message,))
+
+    def _handle_many(self, messages: Sequence[TMessage]) -> None:
+        self.root(messages)
+
+
+def _parametrized_subscriber(
+    origin: type[Subscriber], args: tuple[Any, ...], handler: Callable[..., None]
+) -> Subscriber:
+    return origin[args](handler)
@@ -0,0 +1,141 @@
+import threading
+from collections.abc import Iterable, Iterator
+from typing_extensions import Any, Callable, Self, overload
+
+from .message import Message
+
+Upcaster = Callable[[dict[str, Any]], dict[str, Any]]
+"A function converting the fields of a serialized Message from one schema version to the next"
+
+
+class UpcasterRegistry:
+    """
+    Registry of the upcasters converting serialized Messages from older schema versions to the current schema of
+    their Message type, so that stored Messages never need to be rewritten.
+
+    Each upcaster converts the fields of a Message type from one schema version to the next. When a Message of an
+    older schema version is deserialized, the upcasters from its version to the current version are composed into a
+    single chain, which is cached for every later Message of the same type and version. Messages of the current
+    schema version are deserialized without any upcasting.
+
+    Example:
+        ```
+        class UserCreatedEvent(Event, tag="user.created", schema_version=2):
+            id: UUID
+            full_name: str
+
+        upcasters = UpcasterRegistry()
+
+        @upcasters.register(UserCreatedEvent, from_version=1)
+        def _rename_name(fields: dict[str, Any]) -> dict[str, Any]:
+            fields["full_name"] = fields.pop("name")
+            return fields
+
+        codec = MessagePackCodec(upcasters)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.__upcasters: dict[tuple[str, int], Upcaster] = {}
+        self.__chains: dict[tuple[str, int], Upcaster] = {}
+        self.__lock = threading.Lock()
+
+    @overload
+    def register(self, message_type: str | type[Message], from_version: int) -> Callable[[Upcaster], Upcaster]: ...
+
+    @overload
+    def register(self, message_type: str | type[Message], from_version: int, upcaster: Upcaster) -> Self: ...
+
+    def register(self, message_type: str | type[Message], from_version: int, upcaster: Upcaster | None = None) -> Any:
+        """
+        Registers an upcaster converting the fields of a Message type from a schema version to the next. May be used
+        as a decorator when the upcaster is omitted.
+
+        Args:
+            message_type (str | type[Message]): The Message type, or its type tag
+            from_version (int): The schema version from which the upcaster converts the fields
+            upcaster (Upcaster | None, optional): The upcaster. Defaults to None.
+
+        Raises:
+            ValueError: Occurs if an upcaster is already registered for the Message type and schema version.
+
+        Returns:
+            Self: Returns the instance of the UpcasterRegistry to allow for chaining, or a decorator registering the
+                upcaster if omitted.
+        """
+
+        if upcaster is None:
+
+            def decorator(upcaster: Upcaster) -> Upcaster:
+                self.register(message_type, from_version, upcaster)
+                return upcaster
+
+            return decorator
+
+        tag = message_type if isinstance(message_type, str) else message_type.get_type_tag()
+        with self.__lock:
+            if self.__upcasters.setdefault((tag, from_version), upcaster) is not upcaster:
+                raise ValueError(f"An upcaster is already registered for {tag} schema version {from_version}")
+            self.__chains.clear()
+
+        return self
+
+    def upcast(self, tag: str, schema_version: int, fields: dict[str, Any]) -> dict[str, Any]:
+        """
+        Converts the fields of a serialized Message to the current schema version of its Message type.
+
+        Args:
+            tag (str): The type tag of the Message
+            schema_version (int): The schema version with which the Message was serialized
+            fields (dict[str, Any]): The serialized fields of the Message
+
+        Raises:
+            ValueError: Occurs if an upcaster is missing from the chain to the current schema version.
+
+        Returns:
+            dict[str, Any]: The fields of the Message in its current schema
+        """
+
+        try:
+            chain = self.__chains[(tag, schema_version)]
+        except KeyError:
+            chain = self.__compose(tag, schema_version)
+        return chain(fields)
+
+    def read(self, records: Iterable[tuple[str, int, dict[str, Any]]]) -> Iterator[Message]:
+        """
+        Validates serialized Messages one at a time as they are read, upcasting the fields of those serialized with
+        an older schema version. Can be used to feed raw records to a `LazyEventStream`.
+
+        Args:
+            records (Iterable[tuple[str, int, dict[str, Any]]]):
+                The type tag, schema version and fields of each serialized Message
+
+        Yields:
+            Message: The validated Messages
+        """
+
+        for tag, schema_version, fields in records:
+            message_type = Message.resolve_type_tag(tag)
+            if schema_version != message_type.__schema_version__:
+                fields = self.upcast(tag, schema_version, fields)
+            yield message_type.model_validate(fields)
+
+    def __compose(self, tag: str, schema_version: int) -> Upcaster:
+        current_version = Message.resolve_type_tag(tag).get_schema_version()
+        if schema_version > current_version:
+            raise ValueError(f"{tag} schema version {schema_version} is newer than the current {current_version}")
+
+        with self.__lock:
+            try:
+                steps = [self.__upcasters[(tag, version)] for version in range(schema_version, current_version)]
+            except KeyError as e:
+                raise ValueError(f"No upcaster is registered for {tag} schema version {e.args[0][1]}") from None
+
+            def chain(fields: dict[str, Any]) -> dict[str, Any]:
+                for step in steps:
+                    fields = step(fields)
+                return fields
+
+            self.__chains[(tag, schema_version)] = chain
+            return chain
@@ -1,12 +1,43 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Iterable
 from typing import Any  # Cannot be imported from typing_extensions when used in a Pydantic model
-from typing_extensions import Annotated, ClassVar, Hashable
+from typing_extensions import Annotated, Callable, ClassVar, Hashable, NoReturn
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from pydantic.fields import FieldInfo
 
+_UNSET = object()
+
+
+def _changed_fields(previous: dict[str, Any], current: dict[str, Any]) -> set[str]:
+    # Unchanged fields are most often the very same object, which spares comparing large containers item by item
+    return {
+        name for name, value in current.items() if value is not (old := previous.get(name, _UNSET)) and value != old
+    }
+
+
+def _mark_dirty(entity: Entity, names: Iterable[str]) -> None:
+    try:
+        entity._Entity__dirty.update(names)
+    except AttributeError:
+        object.__setattr__(entity, "_Entity__dirty", set(names))
+
+
+def _tracking_setattr(set_attribute: Callable[[Any, str, Any], None]) -> Callable[[Any, str, Any], None]:
+    def __setattr__(self: Entity, name: str, value: Any) -> None:
+        if not type(self).__track_changes__:
+            set_attribute(self, name, value)
+            return
+
+        # Compare every field, as validators may change other fields than the one assigned
+        previous = self.__dict__.copy()
+        set_attribute(self, name, value)
+        _mark_dirty(self, _changed_fields(previous, self.__dict__))
+
+    return __setattr__
+
 
 class Entity(BaseModel, Hashable, ABC):
     """
@@ -15,15 +46,32 @@ class Entity(BaseModel, Hashable, ABC):
 
     When re-typing your Entity class' id field, use the IdField annotation to ensure it remains immutable.
 
+    Entity classes can opt into tracking the fields changed since their last checkpoint with the `track_changes`
+    class argument, which is inherited by their subclasses. Fields changed by assignment or `update()` are then
+    reported by `get_dirty_fields()` and dumped by `dump_dirty_fields()`, until `mark_clean()` sets a new
+    checkpoint. Changes made inside a field's value, such as appending to a list, are not tracked.
+
     Example:
         ```
         from typing_extensions import Annotated
 
-        class User(Entity):
+        class User(Entity, track_changes=True):
             id: Annotated[UUID, Entity.IdField]
+            name: str
+
+        user.name = "Bob"
+        repository.save_partial(user.id, user.dump_dirty_fields())
+        user.mark_clean()
         ```
     """
 
+    __slots__ = ("__hash", "__dirty")
+
+    __track_changes__: ClassVar[bool] = False
+
+    __field_aliases__: ClassVar[dict[str, str]]
+    __frozen_fields__: ClassVar[frozenset[str]]
+
     IdField: ClassVar[FieldInfo] = Field(frozen=True)
     """
     Use this to annotate a re-typed id field to ensure it remains immutable.
@@ -49,6 +97,136 @@ class Entity(BaseModel, Hashable, ABC):
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        try:
+            return self.__hash
+        except AttributeError:
+            object.__setattr__(self, "_Entity__hash", hash(self.id))
+            return self.__hash
+
+    def update(self, **changes: Any) -> set[str]:
+        """
+        Updates several fields at once, validating the fields merged with the changes in a single pass rather than
+        once per assignment, so that model validators only check the end state. The changes are applied all or
+        nothing: if any of them is invalid, none are applied. Fields derived from the changes by validators are
+        updated as well.
+
+        Example:
+            ```
+            changed = user.update(name="Bob", email="bob@example.com")
+            ```
+
+        Args:
+            **changes (Any): The new values, by field name
+
+        Raises:
+            ValueError: Occurs if a change is not for a field of the Entity.
+            ValidationError: Occurs if the Entity or a changed field is frozen, or if the changes are invalid.
+
+        Returns:
+            set[str]: The names of the fields whose values changed
+        """
+
+        cls = type(self)
+        if not changes.keys() <= cls.__pydantic_fields__.keys() or not changes.keys().isdisjoint(cls.__frozen_fields__):
+            self.__reject(changes)
+
+        current = self.__dict__
+        data = {**current, **changes}
+        if cls.__field_aliases__:
+            # Fields with an alias are expected by their alias as input
+            data = {cls.__field_aliases__.get(name, name): value for name, value in data.items()}
+        validated = self.__pydantic_validator__.validate_python(data).__dict__
+
+        # Apply every field that changed, including those derived from the changes by model validators
+        changed = _changed_fields(current, validated)
+        updated = {**current, **{name: validated[name] for name in changed}}
+        object.__setattr__(self, "__dict__", updated)
+        self.__pydantic_fields_set__.update(changes)
+        if cls.__track_changes__:
+            _mark_dirty(self, changed)
+        return changed
+
+    def get_dirty_fields(self) -> frozenset[str]:
+        """
+        Returns the names of the fields changed since the last checkpoint (see `mark_clean()`), or since the Entity
+        was created.
+
+        Raises:
+            TypeError: Occurs if the Entity class does not track changes.
+
+        Returns:
+            frozenset[str]: The names of the changed fields
+        """
+
+        self.__check_tracking()
+        try:
+            return frozenset(self.__dirty)
+        except AttributeError:
+            return frozenset()
+
+    def dump_dirty_fields(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Dumps only the fields changed since the last checkpoint, such as to persist them as a partial update.
+
+        Args:
+            **kwargs (Any): The arguments of `model_dump`, other than `include`
+
+        Raises:
+            TypeError: Occurs if the Entity class does not track changes.
+
+        Returns:
+            dict[str, Any]: The changed fields, as dumped by `model_dump`
+        """
+
+        return self.model_dump(include=set(self.get_dirty_fields()), **kwargs)
+
+    def mark_clean(self) -> None:
+        """
+        Sets a new checkpoint, from which changed fields are tracked, such as once the Entity has been persisted.
+
+        Raises:
+            TypeError: Occurs if the Entity class does not track changes.
+        """
+
+        self.__check_tracking()
+        object.__setattr__(self, "_Entity__dirty", set())
+
+    def __check_tracking(self) -> None:
+        if not type(self).__track_changes__:
+            raise TypeError(f"{type(self).__qualname__} does not track changes")
+
+    def __reject(self, changes: dict[str, Any]) -> NoReturn:
+        cls = type(self)
+        frozen = cls.model_config.get("frozen", False)
+        for name, value in changes.items():
+            if name not in cls.__pydantic_fields__:
+                raise ValueError(f'"{cls.__name__}" object has no field "{name}"')
+            if frozen or name in cls.__frozen_fields__:
+                error_type = "frozen_instance" if frozen else "frozen_field"
+                raise ValidationError.from_exception_data(
+                    cls.__name__, [{"type": error_type, "loc": (name,), "input": value}]
+                )
+
+    def __init_subclass__(cls, track_changes: bool | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        tracked = cls.__track_changes__
+        if track_changes is not None:
+            cls.__track_changes__ = track_changes
+        if track_changes and not tracked:
+            cls.__setattr__ = _tracking_setattr(cls.__setattr__)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Lookups for update(), which validates the fields merged with its changes
+        fields = cls.__pydantic_fields__
+        cls.__field_aliases__ = {
+            name: field.validation_alias for name, field in fields.items() if isinstance(field.validation_alias, str)
+        }
+        cls.__frozen_fields__ = frozenset(
+            name for name, field in fields.items() if field.frozen or cls.model_config.get("frozen", False)
+        )
 
     model_config = ConfigDict(validate_assignment=True)
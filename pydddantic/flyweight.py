@@ -0,0 +1,175 @@
+import threading
+from collections import OrderedDict
+from typing_extensions import Any, Callable, NamedTuple
+from weakref import WeakValueDictionary
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+_EXACT_TYPES = frozenset({str, int, bool, bytes, type(None)})
+"The types whose equal values cannot be told apart, and so need no comparison of their representations"
+
+
+def _key(value: Any) -> tuple[Any, ...]:
+    if value.__class__ in _EXACT_TYPES:
+        return value.__class__, value
+    return value.__class__, value, repr(value)
+
+
+class FlyweightStats(NamedTuple):
+    "Statistics of a `FlyweightCache`, in the manner of `functools.lru_cache`'s `cache_info()`"
+
+    hits: int
+    "The number of constructions and validations that returned a shared instance"
+
+    misses: int
+    "The number of constructions and validations that created a new shared instance"
+
+    size: int
+    "The number of shared instances still alive"
+
+    maxsize: int
+    "The number of most recently used shared instances kept alive by the cache"
+
+
+class FlyweightCache:
+    """
+    Cache of the shared instances of a flyweight Value or Value Object class (see `ValueObject`).
+
+    Shared instances are looked up by the input they were validated from, so that repeated input is not validated
+    again, and by their fields, so that different input validating to equal fields still yields the same instance.
+    Inputs and fields are only deemed the same if they also have the same type and representation, as equal values
+    can still differ, such as `Decimal("1.0")` and `Decimal("1.00")`, or datetimes in different time zones.
+    The most recently used instances are kept alive up to the maximum size of the cache, while older instances are
+    only referenced weakly, and remain shared for as long as they are referenced elsewhere.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.__maxsize = maxsize
+        self.__recent: OrderedDict[int, Any] = OrderedDict()
+        self.__by_input: WeakValueDictionary[tuple[Any, ...], Any] = WeakValueDictionary()
+        self.__by_fields: WeakValueDictionary[tuple[Any, ...], Any] = WeakValueDictionary()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def validate(self, data: Any, validator: Callable[[Any], Any]) -> Any:
+        """
+        Returns the shared instance for the input, validating the input only if it has not been seen before.
+
+        Args:
+            data (Any): The input to validate
+            validator (Callable[[Any], Any]): The function validating the input into a new instance
+
+        Returns:
+            Any: The shared instance, or a new instance whose fields are not hashable
+        """
+
+        try:
+            input_key = _key(data)
+            instance = self.__by_input.get(input_key)
+        except TypeError:
+            # Unhashable input, such as the dictionary of fields of a Value Object, can only be shared once validated
+            input_key = instance = None
+
+        if instance is None:
+            return self.__share(validator(data), input_key)
+
+        with self.__lock:
+            self.__hits += 1
+            try:
+                self.__recent.move_to_end(id(instance))
+            except KeyError:
+                # The instance was evicted from the most recently used, but is still referenced elsewhere
+                self.__remember(instance)
+        return instance
+
+    def stats(self) -> FlyweightStats:
+        """
+        Returns the hit and miss statistics of the cache.
+
+        Returns:
+            FlyweightStats: The statistics
+        """
+
+        with self.__lock:
+            return FlyweightStats(self.__hits, self.__misses, len(self.__by_fields), self.__maxsize)
+
+    def clear(self) -> None:
+        "Clears the cache and its statistics. Instances already shared stay equal to later ones, but not identical."
+
+        with self.__lock:
+            self.__recent.clear()
+            self.__by_input.clear()
+            self.__by_fields.clear()
+            self.__hits = self.__misses = 0
+
+    def __share(self, instance: Any, input_key: tuple[Any, ...] | None) -> Any:
+        try:
+            fields_key = tuple(_key(value) for value in instance.__dict__.values())
+            hash(fields_key)
+        except TypeError:
+            return instance
+
+        with self.__lock:
+            shared = self.__by_fields.get(fields_key)
+            if shared is None:
+                shared = self.__by_fields[fields_key] = instance
+                self.__misses += 1
+            else:
+                self.__hits += 1
+
+            if input_key is not None:
+                self.__by_input[input_key] = shared
+            self.__remember(shared)
+        return shared
+
+    def __remember(self, instance: Any) -> None:
+        self.__recent[id(instance)] = instance
+        self.__recent.move_to_end(id(instance))
+        if len(self.__recent) > self.__maxsize:
+            self.__recent.popitem(last=False)
+
+
+def enable_flyweights(
+    cls: type, flyweight: bool | int | None, new: Callable[..., Any], init: Callable[..., None]
+) -> None:
+    """
+    Sets up the flyweight mode of a Value or Value Object class, if requested by its `flyweight` class argument, or
+    inherited from its base class. Each flyweight class shares its instances in a cache of its own.
+
+    Args:
+        cls (type): The Value or Value Object class
+        flyweight (bool | int | None):
+            Whether to share instances, or the number of most recently used instances to keep. None to inherit the
+            mode of the base class.
+        new (Callable[..., Any]): The `__new__` method returning shared instances
+        init (Callable[..., None]): The `__init__` method skipping the validation of shared instances
+    """
+
+    if flyweight is None:
+        inherited = cls.__flyweights__
+        flyweight = False if inherited is None else inherited.stats().maxsize
+
+    cls.__flyweights__ = None
+    if flyweight is False:
+        return
+
+    cls.__flyweights__ = FlyweightCache() if flyweight is True else FlyweightCache(flyweight)
+    cls.__new__ = staticmethod(new)
+    cls.__init__ = init
+    cls.__get_pydantic_core_schema__ = classmethod(_flyweight_schema)
+
+
+def _flyweight_schema(cls: Any, source: type[Any], handler: GetCoreSchemaHandler) -> CoreSchema:
+    schema = handler(source)
+
+    # The class' own validator is left as is, as it validates instances in place when called from __init__. Only
+    # instances validated as fields of other models are shared, as well as those constructed (see __new__).
+    if not cls.__pydantic_complete__ or cls.__flyweights__ is None:
+        return schema
+
+    return core_schema.no_info_wrap_validator_function(cls.__flyweights__.validate, schema)
@@ -1,40 +1,228 @@
-from abc import ABC
-from typing_extensions import Self
-from uuid import UUID, uuid4
+import os
+import threading
+import time
+from abc import ABC, ABCMeta
+from datetime import datetime, timezone
+from typing_extensions import Any, Self, TypeVar
+from uuid import UUID, SafeUUID
+from weakref import WeakValueDictionary
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
+TUniqueId = TypeVar("TUniqueId", bound="UniqueId")
+
+_new = object.__new__
+_set_attribute = object.__setattr__
+
+_interned: WeakValueDictionary[tuple[type, int], "UniqueId"] = WeakValueDictionary()
+
+
+def _serialize(value: UUID, info: core_schema.SerializationInfo) -> str | UUID:
+    # UniqueIds are dumped as strings, but kept as UUIDs for serializers with a mode of their own, such as the
+    # MessagePackCodec, which stores UUIDs as their bytes
+    return str(value) if info.mode in ("python", "json") else value
+
+
+def _as_v4(value: int) -> int:
+    "Sets the variant and version bits of a random 128-bit integer, as `uuid.uuid4` does"
+
+    return value & ~(0xC000 << 48) & ~(0xF000 << 64) | (0x8000 << 48) | (4 << 76)
+
+
+def _create(cls: type[TUniqueId], value: int, is_safe: SafeUUID) -> TUniqueId:
+    "Creates an id by setting the attributes of the UUID directly, as `UUID.__init__` would after parsing its input"
+
+    instance = _new(cls)
+    _set_attribute(instance, "int", value)
+    _set_attribute(instance, "is_safe", is_safe)
+    return instance
+
+
+def _random_v4() -> int:
+    return _as_v4(int.from_bytes(os.urandom(16), "big"))
+
+
+_COUNTER_BITS = 42
+"The 12 bits of `rand_a` and the 30 leading bits of `rand_b` hold a counter, leaving 32 random bits"
+
+_ordered_lock = threading.Lock()
+_last_timestamp = 0
+_last_counter = 0
+
+
+def _next_v7() -> int:
+    """
+    Returns the 128-bit integer value of a new UUIDv7, as per RFC 9562. Ids generated in the same millisecond keep
+    their order through a counter, which is seeded randomly every millisecond. Should the counter overflow, or the
+    clock go backwards, the timestamp of the last id is carried forward instead.
+    """
+
+    global _last_timestamp, _last_counter
+
+    random = int.from_bytes(os.urandom(10), "big")
+    timestamp = time.time_ns() // 1_000_000
+    with _ordered_lock:
+        if timestamp > _last_timestamp:
+            # Leave the leading bit of the counter clear, so that it cannot overflow in the same millisecond
+            counter = random >> 39
+        else:
+            timestamp = _last_timestamp
+            counter = _last_counter + 1
+            if counter >> _COUNTER_BITS:
+                timestamp += 1
+                counter = random >> 39
+        _last_timestamp = timestamp
+        _last_counter = counter
+
+    rand_a = counter >> 30
+    rand_b = (counter & 0x3FFFFFFF) << 32 | random & 0xFFFFFFFF
+    return timestamp << 80 | 7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+
+
+class _UniqueIdMeta(ABCMeta):
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> type:
+        # Every id type must declare its slots, or each of its ids gets a __dict__ after all
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class UniqueId(UUID, ABC, metaclass=_UniqueIdMeta):
+    """
+    Abstract base class for the unique id of an Entity or Aggregate, validated and serialized as a UUID.
+
+    Ids are the most numerous objects of a domain model, so their hash is computed once, then cached in a slot.
+    Id types get no `__dict__`, including subclasses that do not declare `__slots__`.
+
+    Example:
+        ```
+        class UserId(UniqueId): ...
+
+        user_id = UserId.generate()
+        ```
+    """
+
+    __slots__ = ("__hash",)
 
-class UniqueId(UUID, ABC):
     def __init__(self, uuid: str | UUID):
         if isinstance(uuid, UUID):
-            super().__init__(bytes=uuid.bytes)
+            # Copy the value of the UUID as is, rather than serializing it to bytes and parsing them back
+            _set_attribute(self, "int", uuid.int)
+            _set_attribute(self, "is_safe", uuid.is_safe)
         else:
             super().__init__(uuid)
 
     @classmethod
     def generate(cls) -> Self:
-        return cls(uuid4())
+        return cls._from_int(_random_v4())
+
+    @classmethod
+    def generate_ordered(cls) -> Self:
+        """
+        Generates a new time-ordered id (UUIDv7), whose leading bits are the millisecond at which it was generated.
+        Ids generated by the same process sort in the order in which they were generated, so that they are inserted
+        at the end of B-tree and LSM indexes rather than at random.
+
+        Returns:
+            Self: The generated id
+        """
+
+        return _create(cls, _next_v7(), SafeUUID.unknown)
+
+    @property
+    def timestamp(self) -> datetime:
+        """
+        The time at which a time-ordered id (UUIDv7) was generated, to the millisecond.
+
+        Raises:
+            ValueError: Occurs if the id is not a UUIDv7.
+
+        Returns:
+            datetime: The UTC time at which the id was generated
+        """
+
+        if self.version != 7:
+            raise ValueError(f"Only UUIDv7 ids have a timestamp, not UUIDv{self.version} ids")
+        return datetime.fromtimestamp((self.int >> 80) / 1000, timezone.utc)
+
+    @classmethod
+    def generate_many(cls, count: int) -> list[Self]:
+        """
+        Generates many new random ids at once, drawing the random bytes for all of them in a single call.
+
+        Args:
+            count (int): The number of ids to generate
+
+        Returns:
+            list[Self]: The generated ids
+        """
+
+        data = os.urandom(16 * count)
+        unknown = SafeUUID.unknown
+        return [_create(cls, _as_v4(int.from_bytes(data[i : i + 16], "big")), unknown) for i in range(0, len(data), 16)]
+
+    @classmethod
+    def from_bytes_array(cls, data: bytes | bytearray | memoryview) -> list[Self]:
+        """
+        Creates ids from the concatenated 16-byte big-endian representations of their UUIDs, such as a column of
+        ids read from storage.
+
+        Args:
+            data (bytes | bytearray | memoryview): The concatenated bytes of the ids
+
+        Raises:
+            ValueError: Occurs if the length of the data is not a multiple of 16 bytes.
+
+        Returns:
+            list[Self]: The ids
+        """
+
+        data = bytes(data)
+        if len(data) % 16:
+            raise ValueError("The length of the data must be a multiple of 16 bytes")
+
+        unknown = SafeUUID.unknown
+        return [_create(cls, int.from_bytes(data[i : i + 16], "big"), unknown) for i in range(0, len(data), 16)]
+
+    @classmethod
+    def _from_int(cls, value: int) -> Self:
+        "Creates an id from the 128-bit integer value of its UUID, without validating it"
+
+        return _create(cls, value, SafeUUID.unknown)
+
+    @classmethod
+    def _from_uuid(cls, uuid: UUID) -> Self:
+        return uuid if isinstance(uuid, cls) else _create(cls, uuid.int, uuid.is_safe)
+
+    @classmethod
+    def intern(cls, uuid: str | UUID) -> Self:
+        """
+        Returns the interned instance of the id, so that repeated ids, such as those loaded from storage, share a
+        single object. Interned ids are released once no longer referenced.
+
+        Args:
+            uuid (str | UUID): The id to intern
+
+        Returns:
+            Self: The interned instance of the id
+        """
+
+        if isinstance(uuid, cls):
+            return _interned.setdefault((cls, uuid.int), uuid)
+
+        key = (cls, uuid.int if isinstance(uuid, UUID) else UUID(uuid).int)
+        interned = _interned.get(key)
+        if interned is None:
+            interned = _interned.setdefault(key, cls(uuid))
+        return interned
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type: type[object], handler: GetCoreSchemaHandler) -> CoreSchema:
-        # TODO: Not sure this is the correct way to do this, but it works for now.
-        return core_schema.json_or_python_schema(
-            json_schema=core_schema.str_schema(),
-            python_schema=core_schema.union_schema(
-                [
-                    core_schema.is_instance_schema(UUID),
-                    core_schema.chain_schema(
-                        [
-                            core_schema.str_schema(),
-                            # Accept the UUID as already validated by its own type
-                            core_schema.no_info_plain_validator_function(lambda x: x),
-                        ]
-                    ),
-                ]
-            ),
-            serialization=core_schema.plain_serializer_function_ser_schema(lambda x: str(x)),
+        # Parse and validate the UUID natively, then only wrap its value in the id type
+        return core_schema.no_info_after_validator_function(
+            cls._from_uuid,
+            core_schema.uuid_schema(),
+            serialization=core_schema.plain_serializer_function_ser_schema(_serialize, info_arg=True),
         )
 
     def __eq__(self, other: str | UUID) -> bool:
@@ -45,4 +233,8 @@ class UniqueId(UUID, ABC):
         return super().__eq__(other)
 
     def __hash__(self):
-        return hash(self.int)
+        try:
+            return self.__hash
+        except AttributeError:
+            object.__setattr__(self, "_UniqueId__hash", hash(self.int))
+            return self.__hash
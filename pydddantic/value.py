@@ -1,25 +1,199 @@
 from __future__ import annotations
 
-from abc import ABC
-from typing_extensions import TypeVar
+from abc import ABC, ABCMeta
+from operator import attrgetter
+from typing_extensions import Any, ClassVar, Generic, NoReturn, Self, TypeVar, get_args, get_origin, get_type_hints
 
-from pydantic import ConfigDict, RootModel
+from pydantic import ConfigDict, GetCoreSchemaHandler, RootModel, TypeAdapter, ValidationError
+from pydantic_core import CoreSchema, PydanticUndefined, SchemaValidator, core_schema
+
+from .flyweight import FlyweightCache, FlyweightStats, enable_flyweights
 
 T = TypeVar("T")
 
 
+def _flyweight_new(cls: Any, /, root: Any = PydanticUndefined, **data: Any) -> Any:
+    if cls.__flyweights__ is None or root is PydanticUndefined:
+        # Instances created by model_construct, copies and unpickling, as well as Values constructed from keyword
+        # arguments, are filled in once created
+        return object.__new__(cls)
+    return cls.__flyweights__.validate(root, cls.__pydantic_validator__.validate_python)
+
+
+def _flyweight_init(self: Any, /, root: Any = PydanticUndefined, **data: Any) -> None:
+    # Shared instances returned by __new__ are already validated
+    if not hasattr(self, "__pydantic_fields_set__"):
+        RootModel.__init__(self, root, **data)
+
+
+_flyweight_init.__pydantic_base_init__ = True  # type: ignore[attr-defined]
+
+
 class Value(RootModel[T], ABC):
     """
     Abstract base class for a simple immutable Value Type using Pydantic's RootModel (including any Pydantic
     validators).
+
+    Like Value Objects, Value classes can opt into sharing their instances with the `flyweight` class argument (see
+    `ValueObject`), such as for codes repeated many times over in stored Events.
+
+    Example:
+        ```
+        class CurrencyCode(Value[str], flyweight=True): ...
+
+        assert CurrencyCode("CAD") is CurrencyCode("CAD")
+        ```
     """
 
+    __slots__ = ("__hash",)
+
+    __flyweights__: ClassVar[FlyweightCache | None] = None
+
     model_config = ConfigDict(frozen=True)
 
+    def __init_subclass__(cls, flyweight: bool | int | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        enable_flyweights(cls, flyweight, _flyweight_new, _flyweight_init)
+
     def __str__(self) -> str:
         return str(self.root)
 
     def __eq__(self, other: T | Value[T]) -> bool:
-        if isinstance(other, Value):
+        # Values are most often compared to Values of the same class, so check for those before any isinstance check
+        if other.__class__ is self.__class__ or isinstance(other, Value):
+            return self.root == other.root
+        return self.root == other
+
+    def __hash__(self) -> int:
+        # Hashing the root alone keeps the hash consistent with Values being equal to their raw root value
+        try:
+            return self.__hash
+        except AttributeError:
+            object.__setattr__(self, "_Value__hash", hash(self.root))
+            return self.__hash
+
+    @classmethod
+    def get_flyweight_stats(cls) -> FlyweightStats:
+        """
+        Returns the statistics of the cache of shared instances of a flyweight Value class.
+
+        Raises:
+            TypeError: Occurs if the class does not share its instances.
+
+        Returns:
+            FlyweightStats: The hits, misses and size of the cache
+        """
+
+        if cls.__flyweights__ is None:
+            raise TypeError(f"{cls.__qualname__} is not a flyweight class")
+        return cls.__flyweights__.stats()
+
+
+class _SlimValueMeta(ABCMeta):
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> type:
+        # Every subclass must declare its slots, or its instances get a __dict__ after all
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class SlimValue(Generic[T], metaclass=_SlimValueMeta):
+    """
+    Abstract base class for a lightweight immutable Value Type, for Values held in memory by the million, such as in
+    read models. Slim Values store their root value in a slot rather than as the fields of a Pydantic model, and so
+    take a fraction of the memory of a `Value`.
+
+    Slim Values validate their root value on construction, compare and convert to strings like a `Value`, and can be
+    used as the types of Pydantic fields, but do not support Pydantic model validators or `model_*` methods.
+
+    Example:
+        ```
+        class BirdCount(SlimValue[int]): ...
+
+        class BirdFamily(SlimValue[str]):
+            root: Annotated[str, StringConstraints(max_length=50, to_upper=True)]
+
+        assert BirdFamily("corvidae") == "CORVIDAE"
+        ```
+    """
+
+    __slots__ = ("root",)
+
+    __root_type__: ClassVar[Any]
+    __root_validator__: ClassVar[SchemaValidator]
+
+    root: T
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        root_type = get_type_hints(cls, include_extras=True)["root"]
+        if isinstance(root_type, TypeVar):
+            root_type = next(
+                (
+                    get_args(base)[0]
+                    for base in cls.__dict__.get("__orig_bases__", ())
+                    if isinstance(get_origin(base), type) and issubclass(get_origin(base), SlimValue)
+                ),
+                root_type,
+            )
+
+        # Generic subclasses are only validated once their root type is given
+        if not isinstance(root_type, TypeVar):
+            cls.__root_type__ = root_type
+            cls.__root_validator__ = TypeAdapter(root_type).validator
+
+    def __init__(self, root: T) -> None:
+        object.__setattr__(self, "root", self.__root_validator__.validate_python(root))
+
+    @classmethod
+    def _from_root(cls, root: T) -> Self:
+        "Creates a Slim Value from an already validated root value"
+
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "root", root)
+        return instance
+
+    @classmethod
+    def _to_root(cls, value: Any) -> Any:
+        return value.root if isinstance(value, cls) else value
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: type[object], handler: GetCoreSchemaHandler) -> CoreSchema:
+        # Validate the root value natively, then only wrap it in the Slim Value
+        root_schema = handler(cls.__root_type__)
+        from_root_schema = core_schema.no_info_after_validator_function(cls._from_root, root_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_root_schema,
+            python_schema=core_schema.no_info_before_validator_function(cls._to_root, from_root_schema),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                attrgetter("root"), return_schema=root_schema
+            ),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise ValidationError.from_exception_data(
+            type(self).__name__, [{"type": "frozen_instance", "loc": (name,), "input": value}]
+        )
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise ValidationError.from_exception_data(
+            type(self).__name__, [{"type": "frozen_instance", "loc": (name,), "input": None}]
+        )
+
+    def __reduce__(self) -> tuple[type[Self], tuple[T]]:
+        return type(self), (self.root,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.root!r})"
+
+    def __str__(self) -> str:
+        return str(self.root)
+
+    def __eq__(self, other: T | SlimValue[T] | Value[T]) -> bool:
+        if other.__class__ is self.__class__ or isinstance(other, (SlimValue, Value)):
             return self.root == other.root
         return self.root == other
+
+    def __hash__(self) -> int:
+        # Unlike Value, the hash is not cached, as an extra slot would cost more memory than most hashes save
+        return hash(self.root)
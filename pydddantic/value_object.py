@@ -1,11 +1,131 @@
+import operator
 from abc import ABC
+from typing_extensions import Any, Callable, ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
+from .flyweight import FlyweightCache, FlyweightStats, enable_flyweights
+
+
+def _make_eq(getter: Callable[[dict[str, Any]], Any]) -> Callable[[Any, Any], bool]:
+    def __eq__(self: Any, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            try:
+                return self is other or getter(self.__dict__) == getter(other.__dict__)
+            except KeyError:
+                pass  # A field is missing from the __dict__ of a copy, which only the generic comparison handles
+        return BaseModel.__eq__(self, other)
+
+    return __eq__
+
+
+def _make_hash(getter: Callable[[dict[str, Any]], Any], memoize: bool) -> Callable[[Any], int]:
+    if not memoize:
+        return lambda self: hash(getter(self.__dict__))
+
+    def __hash__(self: Any) -> int:
+        try:
+            return self._ValueObject__hash
+        except AttributeError:
+            object.__setattr__(self, "_ValueObject__hash", hash(getter(self.__dict__)))
+            return self._ValueObject__hash
+
+    return __hash__
+
+
+_generated_code = {_make_eq(None).__code__, _make_hash(None, True).__code__, _make_hash(None, False).__code__}
+
+
+def _is_generated(method: Any) -> bool:
+    return getattr(method, "__code__", None) in _generated_code
+
+
+def _flyweight_new(cls: Any, /, **data: Any) -> Any:
+    if cls.__flyweights__ is None or not data:
+        # Instances created by model_construct, copies and unpickling are filled in once created
+        return object.__new__(cls)
+    return cls.__flyweights__.validate(data, cls.__pydantic_validator__.validate_python)
+
+
+def _flyweight_init(self: Any, /, **data: Any) -> None:
+    # Shared instances returned by __new__ are already validated
+    if not hasattr(self, "__pydantic_fields_set__"):
+        BaseModel.__init__(self, **data)
+
+
+_flyweight_init.__pydantic_base_init__ = True  # type: ignore[attr-defined]
+
 
 class ValueObject(BaseModel, ABC):
     """
     Abstract base class for an immutable Value Object using Pydantic's BaseModel.
+
+    Equality and hash functions are generated for each Value Object class from its fields when the class is created,
+    so that Value Objects can be compared and used as dictionary keys cheaply. The hash is computed once, then cached
+    on the instance. Value Object classes defining their own `__eq__` or `__hash__` keep them.
+
+    Value Object classes can also opt into sharing their instances (flyweights) with the `flyweight` class argument,
+    which is useful for Value Objects repeated many times over, such as in the Events of a large Event Stream.
+    Constructing or validating (as a field of another model) a flyweight Value Object returns the shared instance
+    with the same fields. The `flyweight` argument can be `True`, or the number of most recently used instances to
+    keep alive (1024 by default), beyond which instances are only shared for as long as they are referenced. The
+    flyweight mode is inherited by subclasses, which share their instances in a cache of their own, unless they opt
+    out with `flyweight=False`.
+
+    Example:
+        ```
+        class Money(ValueObject, flyweight=True):
+            amount: Decimal
+            currency: str
+
+        assert Money(amount=1, currency="CAD") is Money(amount=1, currency="CAD")
+        print(Money.get_flyweight_stats())
+        ```
     """
 
+    __slots__ = ("__hash",)
+
+    __flyweights__: ClassVar[FlyweightCache | None] = None
+
     model_config = ConfigDict(frozen=True)
+
+    def __init_subclass__(cls, flyweight: bool | int | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        enable_flyweights(cls, flyweight, _flyweight_new, _flyweight_init)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        fields = tuple(cls.__pydantic_fields__)
+        getter = operator.itemgetter(*fields) if fields else lambda _: ()
+
+        # The generated equality only compares fields, so leave Pydantic's own to classes with private or extra data
+        if cls.__private_attributes__ or cls.model_config.get("extra") == "allow":
+            if _is_generated(cls.__eq__):
+                cls.__eq__ = BaseModel.__eq__
+        elif cls.__eq__ is BaseModel.__eq__ or _is_generated(cls.__eq__):
+            cls.__eq__ = _make_eq(getter)
+
+        # A class defining __eq__ alone is left without a hash by Python, but Value Objects are hashed by their fields
+        if (cls.__hash__ is None and "__eq__" in cls.__dict__) or _is_generated(cls.__hash__):
+            cls.__hash__ = _make_hash(getter, memoize=bool(cls.model_config.get("frozen")))
+
+    @classmethod
+    def get_flyweight_stats(cls) -> FlyweightStats:
+        """
+        Returns the statistics of the cache of shared instances of a flyweight Value Object class.
+
+        Raises:
+            TypeError: Occurs if the class does not share its instances.
+
+        Returns:
+            FlyweightStats: The hits, misses and size of the cache
+        """
+
+        if cls.__flyweights__ is None:
+            raise TypeError(f"{cls.__qualname__} is not a flyweight class")
+        return cls.__flyweights__.stats()
+
+
+ValueObject.__hash__ = _make_hash(lambda _: (), memoize=True)
@@ -0,0 +1,219 @@
+from typing_extensions import Annotated, Any, Self
+from uuid import UUID, uuid4
+
+from pydddantic import AggregateRoot, ConcurrencyError, Event, EventSourcedAggregate, EventStream, event_handler
+
+
+class _UserState(AggregateRoot):
+    id: Annotated[UUID, AggregateRoot.IdField]
+    name: str
+
+
+class UserEvent(Event):
+    id: UUID
+
+
+class UserCreatedEvent(UserEvent):
+    name: str
+
+
+class UserNameChangedEvent(UserEvent):
+    old_name: str
+    new_name: str
+
+
+class User(EventSourcedAggregate):
+    _state: _UserState
+
+    @property
+    def id(self) -> UUID:
+        return self._state.id
+
+    @property
+    def name(self) -> str:
+        return self._state.name
+
+    @classmethod
+    def create(cls, name: str) -> Self:
+        user = cls()
+        user._apply(UserCreatedEvent(id=uuid4(), name=name))
+        return user
+
+    def change_name(self, new_name: str) -> None:
+        self._apply(UserNameChangedEvent(id=self.id, old_name=self.name, new_name=new_name))
+
+    @event_handler
+    def _user_created(self, event: UserCreatedEvent) -> None:
+        self._state = _UserState(id=event.id, name=event.name)
+
+    @event_handler
+    def _user_name_changed(self, event: UserNameChangedEvent) -> None:
+        self._state.name = event.new_name
+
+
+class EventStoreContract:
+    """
+    Tests shared by every Event Store, mixed into the test case of each Event Store, which opens the store under test
+    with `open_store`.
+    """
+
+    def open_store(self) -> Any:
+        raise NotImplementedError
+
+    def test_should_load_appended_events(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        user.change_name("Bob")
+
+        # When
+        store.append(user)
+        loaded = User(event_stream=store.load(user.id))
+
+        # Expect
+        self.assertEqual("Bob", loaded.name)
+        self.assertEqual(2, loaded.version)
+        self.assertEqual(2, store.get_version(user.id))
+
+    def test_should_load_empty_stream_for_unknown_id(self):
+        # Given
+        store = self.open_store()
+
+        # When
+        stream = store.load(uuid4())
+
+        # Expect
+        self.assertEqual(0, stream.version)
+        self.assertEqual([], list(stream))
+
+    def test_should_load_only_events_after_version(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        user.change_name("Bob")
+        user.change_name("Carol")
+        store.append(user)
+
+        # When
+        stream = store.load(user.id, after_version=2)
+        current = store.load(user.id, after_version=3)
+
+        # Expect
+        self.assertEqual(3, stream.version)
+        self.assertEqual(["Carol"], [event.new_name for event in stream])
+        self.assertEqual(3, current.version)
+        self.assertEqual([], list(current))
+
+    def test_should_append_changes_of_loaded_aggregate(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        store.append(user)
+
+        loaded = User(event_stream=store.load(user.id))
+        loaded.change_name("Bob")
+
+        # When
+        store.append(loaded)
+
+        # Expect
+        self.assertEqual("Bob", User(event_stream=store.load(user.id)).name)
+        self.assertEqual(2, store.get_version(user.id))
+
+    def test_should_raise_when_aggregate_version_is_stale(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        store.append(user)
+
+        first = User(event_stream=store.load(user.id))
+        second = User(event_stream=store.load(user.id))
+        first.change_name("Bob")
+        second.change_name("Carol")
+        store.append(first)
+
+        # Expect
+        with self.assertRaises(ConcurrencyError) as exc:
+            store.append(second)
+
+        self.assertEqual(1, exc.exception.expected_version)
+        self.assertEqual(2, exc.exception.actual_version)
+        self.assertEqual("Bob", User(event_stream=store.load(user.id)).name)
+
+    def test_should_append_nothing_when_any_aggregate_is_stale(self):
+        # Given
+        store = self.open_store()
+        alice = User.create(name="Alice")
+        store.append(alice)
+        bob = User.create(name="Bob")
+
+        # Expect
+        with self.assertRaises(ConcurrencyError):
+            store.append_many([bob, alice])
+
+        self.assertEqual(0, store.get_version(bob.id))
+
+    def test_should_load_many_aggregates_at_once(self):
+        # Given
+        store = self.open_store()
+        users = [User.create(name=name) for name in ("Alice", "Bob", "Carol")]
+        for user in users:
+            user.change_name(user.name.upper())
+            store.append(user)
+        unknown = uuid4()
+
+        # When
+        streams = store.load_many([user.id for user in users] + [unknown])
+
+        # Expect
+        self.assertEqual([user.id for user in users] + [unknown], list(streams))
+        for user in users:
+            self.assertEqual(user.name, User(event_stream=streams[user.id]).name)
+        self.assertEqual(0, streams[unknown].version)
+        self.assertEqual([], list(streams[unknown]))
+
+    def test_should_get_versions_of_many_aggregates_at_once(self):
+        # Given
+        store = self.open_store()
+        alice = User.create(name="Alice")
+        bob = User.create(name="Bob")
+        bob.change_name("Robert")
+        store.append(alice)
+        store.append(bob)
+        unknown = uuid4()
+
+        # When
+        versions = store.get_versions([alice.id, bob.id, unknown])
+
+        # Expect
+        self.assertEqual({alice.id: 1, bob.id: 2, unknown: 0}, versions)
+
+    def test_should_read_all_events_in_order_of_global_position(self):
+        # Given
+        store = self.open_store()
+        alice = User.create(name="Alice")
+        bob = User.create(name="Bob")
+        store.append_many([alice, bob])
+        loaded = User(event_stream=store.load(alice.id))
+        loaded.change_name("Alicia")
+        store.append(loaded)
+
+        # When
+        recorded = store.read_all()
+        after_first = store.read_all(after_position=recorded[0].position, limit=1)
+
+        # Expect
+        self.assertEqual(
+            [(str(alice.id), 1), (str(bob.id), 1), (str(alice.id), 2)],
+            [(event.stream_id, event.version) for event in recorded],
+        )
+        self.assertEqual(sorted({event.position for event in recorded}), [event.position for event in recorded])
+        self.assertIsInstance(recorded[2].event, UserNameChangedEvent)
+        self.assertEqual([recorded[1]], after_first)
+
+    def test_loaded_stream_should_be_an_event_stream(self):
+        # Given
+        store = self.open_store()
+
+        # Expect
+        self.assertIsInstance(store.load(uuid4()), EventStream)
@@ -0,0 +1,91 @@
+import tempfile
+import threading
+import time
+import unittest
+
+from pydddantic import CatchUpSubscription, FileEventStore, InMemoryCheckpointStore, JsonEventSerializer, RecordedEvent
+
+from .fixtures import User, UserCreatedEvent, UserNameChangedEvent
+
+
+class CatchUpSubscriptionTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = FileEventStore(directory.name, JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent))
+        self.addCleanup(self.store.close)
+        self.checkpoints = InMemoryCheckpointStore()
+        self.pages: list[list[RecordedEvent]] = []
+
+    def subscribe(self, **kwargs) -> CatchUpSubscription:
+        return CatchUpSubscription(
+            "users", self.store, lambda page: self.pages.append(list(page)), self.checkpoints, **kwargs
+        )
+
+    def append_users(self, *names: str) -> None:
+        for name in names:
+            self.store.append(User.create(name=name))
+
+    def test_should_catch_up_in_pages_and_save_checkpoint(self):
+        # Given
+        self.append_users("Alice", "Bob", "Carol", "Dave", "Eve")
+        subscription = self.subscribe(page_size=2)
+
+        # When
+        handled = subscription.catch_up()
+
+        # Expect
+        self.assertEqual(5, handled)
+        self.assertEqual([2, 2, 1], [len(page) for page in self.pages])
+        self.assertEqual(self.pages[-1][-1].position, self.checkpoints.load("users"))
+        self.assertEqual(self.pages[-1][-1].position, subscription.position)
+
+    def test_should_resume_from_checkpoint(self):
+        # Given
+        self.append_users("Alice", "Bob")
+        self.subscribe().catch_up()
+        self.append_users("Carol")
+        self.pages.clear()
+
+        # When
+        handled = self.subscribe().catch_up()
+
+        # Expect
+        self.assertEqual(1, handled)
+        self.assertEqual(["Carol"], [recorded.event.name for recorded in self.pages[0]])
+
+    def test_should_handle_nothing_when_caught_up(self):
+        # Given
+        self.append_users("Alice")
+        subscription = self.subscribe()
+        subscription.catch_up()
+
+        # When
+        handled = subscription.catch_up()
+
+        # Expect
+        self.assertEqual(0, handled)
+        self.assertEqual(1, len(self.pages))
+
+    def test_should_tail_events_appended_while_running(self):
+        # Given
+        subscription = self.subscribe(poll_interval=0.01)
+        stop = threading.Event()
+        thread = threading.Thread(target=subscription.run, args=(stop,))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+
+        # When
+        self.append_users("Alice")
+        deadline = time.monotonic() + 5
+        while not self.pages and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Expect
+        self.assertEqual(["Alice"], [recorded.event.name for page in self.pages for recorded in page])
+
+    def test_should_raise_for_invalid_page_size(self):
+        # Expect
+        with self.assertRaises(ValueError):
+            self.subscribe(page_size=0)
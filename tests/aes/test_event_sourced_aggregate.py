@@ -1,9 +1,20 @@
 import unittest
+from collections.abc import Iterator
 from functools import singledispatchmethod
 from typing_extensions import Annotated, Self
 from uuid import UUID, uuid4
 
-from pydddantic import AggregateRoot, Event, EventSourcedAggregate, EventStream, MessageBus
+from pydantic import ValidationError
+
+from pydddantic import (
+    AggregateRoot,
+    Event,
+    EventSourcedAggregate,
+    EventStream,
+    LazyEventStream,
+    MessageBus,
+    event_handler,
+)
 
 
 class _UserState(AggregateRoot):
@@ -61,6 +72,35 @@ class User(EventSourcedAggregate):
         self.__state.name = event.new_name
 
 
+class UserNicknameChangedEvent(UserNameChangedEvent): ...
+
+
+class UserDeletedEvent(UserEvent): ...
+
+
+class DecoratedUser(EventSourcedAggregate):
+    _state: _UserState
+
+    @property
+    def id(self) -> UUID:
+        return self._state.id
+
+    @property
+    def name(self) -> str:
+        return self._state.name
+
+    def change_name(self, new_name: str) -> None:
+        self._apply(UserNameChangedEvent(id=self.id, old_name=self.name, new_name=new_name))
+
+    @event_handler
+    def _user_created(self, event: UserCreatedEvent) -> None:
+        self._state = _UserState(id=event.id, name=event.name)
+
+    @event_handler(UserNameChangedEvent)
+    def _user_name_changed(self, event) -> None:
+        self._state.name = event.new_name
+
+
 class EventSourcedAggregateTests(unittest.TestCase):
     def test_new_aggregate_version_should_be_zero(self):
         # Given
@@ -117,3 +157,192 @@ class EventSourcedAggregateTests(unittest.TestCase):
         # Expect
         self.assertEqual(2, len(changes))
         self.assertEqual(1, len(user.changes))
+
+    def test_should_replay_events_with_decorated_handlers(self):
+        # Given
+        id = uuid4()
+
+        # When
+        user = DecoratedUser(
+            event_stream=EventStream(
+                version=2,
+                events=[
+                    UserCreatedEvent(id=id, name="Alice"),
+                    UserNameChangedEvent(id=id, old_name="Alice", new_name="Bob"),
+                ],
+            )
+        )
+
+        # Expect
+        self.assertEqual("Bob", user.name)
+        self.assertEqual(2, user.version)
+
+    def test_should_apply_events_with_decorated_handlers(self):
+        # Given
+        user = DecoratedUser(event_stream=EventStream(version=1, events=[UserCreatedEvent(id=uuid4(), name="Alice")]))
+
+        # When
+        user.change_name("Bob")
+
+        # Expect
+        self.assertEqual("Bob", user.name)
+        self.assertEqual(1, len(user.changes))
+
+    def test_decorated_handler_should_handle_subtypes_of_its_event_type(self):
+        # Given
+        id = uuid4()
+
+        # When
+        user = DecoratedUser(
+            event_stream=EventStream(
+                version=2,
+                events=[
+                    UserCreatedEvent(id=id, name="Alice"),
+                    UserNicknameChangedEvent(id=id, old_name="Alice", new_name="Al"),
+                ],
+            )
+        )
+
+        # Expect
+        self.assertEqual("Al", user.name)
+
+    def test_decorated_handlers_should_be_inherited_and_overridable(self):
+        # Given
+        class AuditedUser(DecoratedUser):
+            @event_handler
+            def _user_nickname_changed(self, event: UserNicknameChangedEvent) -> None:
+                self._state.name = f"{event.new_name} ({event.old_name})"
+
+        id = uuid4()
+
+        # When
+        user = AuditedUser(
+            event_stream=EventStream(
+                version=2,
+                events=[
+                    UserCreatedEvent(id=id, name="Alice"),
+                    UserNicknameChangedEvent(id=id, old_name="Alice", new_name="Al"),
+                ],
+            )
+        )
+
+        # Expect
+        self.assertEqual("Al (Alice)", user.name)
+
+    def test_decorated_handlers_overridden_without_decorator_should_still_handle_their_event_type(self):
+        # Given
+        class UpperCaseUser(DecoratedUser):
+            def _user_name_changed(self, event) -> None:
+                self._state.name = event.new_name.upper()
+
+        id = uuid4()
+        event_stream = EventStream(
+            version=2,
+            events=[
+                UserCreatedEvent(id=id, name="Alice"),
+                UserNameChangedEvent(id=id, old_name="Alice", new_name="Al"),
+            ],
+        )
+
+        # When
+        user = UpperCaseUser(event_stream=event_stream)
+        base_user = DecoratedUser(event_stream=event_stream)
+
+        # Expect
+        self.assertEqual("AL", user.name)
+        self.assertEqual("Al", base_user.name)
+
+    def test_should_raise_for_unhandled_event_type(self):
+        # Given
+        id = uuid4()
+
+        # Expect
+        with self.assertRaises(NotImplementedError):
+            DecoratedUser(
+                event_stream=EventStream(
+                    version=2, events=[UserCreatedEvent(id=id, name="Alice"), UserDeletedEvent(id=id)]
+                )
+            )
+
+    def test_decorated_handler_without_event_annotation_should_raise(self):
+        # Expect
+        with self.assertRaises(TypeError):
+
+            class InvalidUser(DecoratedUser):
+                @event_handler
+                def _user_deleted(self, event) -> None: ...
+
+    def test_should_apply_events_from_lazy_stream_as_they_are_read(self):
+        # Given
+        id = uuid4()
+        log = []
+
+        def read_records() -> Iterator[dict]:
+            log.append("read created")
+            yield {"id": str(id), "name": "Alice"}
+            log.append("read changed")
+            yield {"id": str(id), "old_name": "Alice", "new_name": "Bob"}
+
+        class LoggedUser(DecoratedUser):
+            def _apply(self, event: Event) -> None:
+                raise AssertionError("Loaded events should not be recorded as changes")
+
+            @event_handler
+            def _logged_user_created(self, event: UserCreatedEvent) -> None:
+                log.append("applied created")
+                self._user_created(event)
+
+            @event_handler
+            def _logged_user_name_changed(self, event: UserNameChangedEvent) -> None:
+                log.append("applied changed")
+                self._user_name_changed(event)
+
+        # When
+        user = LoggedUser(
+            event_stream=LazyEventStream[UserCreatedEvent | UserNameChangedEvent](version=2, events=read_records())
+        )
+
+        # Expect
+        self.assertEqual("Bob", user.name)
+        self.assertEqual(2, user.version)
+        self.assertEqual(["read created", "applied created", "read changed", "applied changed"], log)
+
+    def test_lazy_stream_should_raise_validation_errors_when_read(self):
+        # Given
+        stream = LazyEventStream[UserCreatedEvent](version=1, events=iter([{"id": "not-a-uuid", "name": "Alice"}]))
+
+        # Expect
+        with self.assertRaises(ValidationError):
+            User(event_stream=stream)
+
+    def test_should_load_from_trusted_event_stream_without_copying_events(self):
+        # Given
+        events = [
+            UserCreatedEvent(id=uuid4(), name="Alice"),
+            UserNameChangedEvent(id=uuid4(), old_name="Alice", new_name="Bob"),
+        ]
+
+        # When
+        stream = EventStream.from_trusted(2, events)
+        user = User(event_stream=stream)
+
+        # Expect
+        self.assertIs(events, stream.events)
+        self.assertEqual("Bob", user.name)
+        self.assertEqual(2, user.version)
+
+    def test_should_load_from_trusted_lazy_event_stream_as_events_are_read(self):
+        # Given
+        events = iter(
+            [
+                UserCreatedEvent(id=uuid4(), name="Alice"),
+                UserNameChangedEvent(id=uuid4(), old_name="Alice", new_name="Bob"),
+            ]
+        )
+
+        # When
+        user = User(event_stream=LazyEventStream.from_trusted(2, events))
+
+        # Expect
+        self.assertEqual("Bob", user.name)
+        self.assertEqual([], list(events))
@@ -0,0 +1,154 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+from pydddantic import FileEventStore, JsonEventSerializer, MessagePackCodec
+
+from .fixtures import EventStoreContract, User, UserCreatedEvent, UserEvent, UserNameChangedEvent
+
+
+class FileEventStoreTests(EventStoreContract, unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.serializer = JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)
+
+    def open_store(self, **kwargs) -> FileEventStore:
+        store = FileEventStore(self.directory, self.serializer, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_should_rebuild_index_when_reopened(self):
+        # Given
+        store = self.open_store(segment_size=256)
+        users = [User.create(name=name) for name in ("Alice", "Bob", "Carol")]
+        for user in users:
+            user.change_name(user.name.upper())
+            store.append(user)
+        recorded = store.read_all()
+        store.close()
+
+        # When
+        reopened = self.open_store()
+
+        # Expect
+        self.assertGreater(len(list(self.directory.glob("*.log"))), 1)
+        for user in users:
+            self.assertEqual(2, reopened.get_version(user.id))
+            self.assertEqual(user.name, User(event_stream=reopened.load(user.id)).name)
+        self.assertEqual(recorded, reopened.read_all())
+
+    def test_should_truncate_torn_write_when_reopened(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        store.append(user)
+        store.close()
+
+        segment = next(self.directory.glob("*.log"))
+        with open(segment, "ab") as file:
+            file.write(b"\x10\x00\x00\x00torn")
+
+        # When
+        reopened = self.open_store()
+        loaded = User(event_stream=reopened.load(user.id))
+        loaded.change_name("Bob")
+        reopened.append(loaded)
+
+        # Expect
+        self.assertEqual("Bob", User(event_stream=reopened.load(user.id)).name)
+
+    def test_should_discard_interrupted_append_of_many_aggregates_when_reopened(self):
+        # Given
+        store = self.open_store()
+        alice = User.create(name="Alice")
+        store.append(alice)
+        carol = User(event_stream=store.load(alice.id))
+        carol.change_name("Carol")
+        bob = User.create(name="Bob")
+        store.append_many([carol, bob])
+        store.close()
+
+        segment = next(self.directory.glob("*.log"))
+        os.truncate(segment, segment.stat().st_size - 1)
+
+        # When
+        reopened = self.open_store()
+
+        # Expect
+        self.assertEqual({alice.id: 1, bob.id: 0}, reopened.get_versions([alice.id, bob.id]))
+        self.assertEqual("Alice", User(event_stream=reopened.load(alice.id)).name)
+
+    def test_should_discard_append_when_fsync_fails(self):
+        # Given
+        store = self.open_store()
+        alice = User.create(name="Alice")
+        store.append(alice)
+        segment = next(self.directory.glob("*.log"))
+        size = segment.stat().st_size
+        bob = User.create(name="Bob")
+
+        # When
+        with patch("pydddantic.aes.file_store.os.fsync", side_effect=OSError("disk failure")):
+            with self.assertRaises(OSError):
+                store.append(bob)
+
+        # Expect
+        self.assertEqual(size, segment.stat().st_size)
+        self.assertEqual(0, store.get_version(bob.id))
+        store.append(bob)
+        self.assertEqual({alice.id: 1, bob.id: 1}, self.open_store().get_versions([alice.id, bob.id]))
+
+    def test_should_read_events_loaded_before_later_appends(self):
+        # Given
+        store = self.open_store(fsync_every=0)
+        user = User.create(name="Alice")
+        store.append(user)
+        stream = store.load(user.id)
+
+        # When
+        for i in range(100):
+            other = User.create(name=f"User {i}")
+            store.append(other)
+
+        # Expect
+        self.assertEqual("Alice", User(event_stream=stream).name)
+
+    def test_should_load_events_serialized_with_message_pack_codec(self):
+        # Given
+        store = FileEventStore(self.directory, MessagePackCodec())
+        self.addCleanup(store.close)
+        user = User.create(name="Alice")
+        user.change_name("Bob")
+
+        # When
+        store.append(user)
+        loaded = User(event_stream=store.load(user.id))
+
+        # Expect
+        self.assertEqual("Bob", loaded.name)
+
+    def test_serializer_should_deserialize_event_from_a_view_of_a_larger_buffer(self):
+        # Given
+        event = UserNameChangedEvent(id=uuid4(), old_name="Alice", new_name="Bob")
+        data = self.serializer.serialize(event)
+        buffer = b"\x00" * 8 + data + b"\x00" * 8
+
+        # When
+        with memoryview(buffer)[8 : 8 + len(data)] as view:
+            deserialized = self.serializer.deserialize(view)
+
+        # Expect
+        self.assertEqual(event, deserialized)
+
+    def test_serializer_should_raise_for_unregistered_event_type(self):
+        # Given
+        class UserDeletedEvent(UserEvent): ...
+
+        # Expect
+        with self.assertRaises(ValueError):
+            self.serializer.serialize(UserDeletedEvent(id=uuid4()))
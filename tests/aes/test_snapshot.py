@@ -0,0 +1,194 @@
+import time
+import unittest
+from functools import singledispatchmethod
+from typing_extensions import Annotated, Any
+from uuid import UUID, uuid4
+
+from pydddantic import (
+    AggregateRoot,
+    Event,
+    EventCountPolicy,
+    EventSourcedAggregate,
+    EventStream,
+    InMemorySnapshotStore,
+    ReplayTimePolicy,
+    Snapshot,
+    SnapshotLoader,
+)
+
+
+class _CounterState(AggregateRoot):
+    id: Annotated[UUID, AggregateRoot.IdField]
+    count: int
+
+
+class CounterEvent(Event):
+    id: UUID
+
+
+class CounterCreatedEvent(CounterEvent): ...
+
+
+class CounterIncrementedEvent(CounterEvent): ...
+
+
+class Counter(EventSourcedAggregate):
+    _state: _CounterState
+
+    @property
+    def id(self) -> UUID:
+        return self._state.id
+
+    @property
+    def count(self) -> int:
+        return self._state.count
+
+    @singledispatchmethod
+    def _mutate(self, event: CounterEvent) -> None:
+        raise NotImplementedError(f"Unhandled event type '{type(event)}'")
+
+    @_mutate.register
+    def _counter_created(self, event: CounterCreatedEvent) -> None:
+        self._state = _CounterState(id=event.id, count=0)
+
+    @_mutate.register
+    def _counter_incremented(self, event: CounterIncrementedEvent) -> None:
+        self._state.count += 1
+
+    def _take_snapshot(self) -> Any:
+        return self._state.model_dump()
+
+    def _restore_snapshot(self, state: Any) -> None:
+        self._state = _CounterState.model_validate(state)
+
+
+class _EventStore:
+    def __init__(self, id: UUID, increments: int) -> None:
+        self.events = [CounterCreatedEvent(id=id), *[CounterIncrementedEvent(id=id) for _ in range(increments)]]
+        self.loaded_after: list[int] = []
+
+    def load(self, id: Any, after_version: int = 0) -> EventStream:
+        self.loaded_after.append(after_version)
+        return EventStream(version=len(self.events), events=self.events[after_version:])
+
+
+class SnapshotTests(unittest.TestCase):
+    def test_should_restore_aggregate_from_snapshot_and_later_events(self):
+        # Given
+        id = uuid4()
+        snapshot = Snapshot(id=id, version=6, state={"id": id, "count": 5})
+
+        # When
+        counter = Counter(
+            event_stream=EventStream(
+                version=8, events=[CounterIncrementedEvent(id=id), CounterIncrementedEvent(id=id)]
+            ),
+            snapshot=snapshot,
+        )
+
+        # Expect
+        self.assertEqual(7, counter.count)
+        self.assertEqual(8, counter.version)
+        self.assertEqual(0, len(counter.changes))
+
+    def test_version_should_be_set_by_snapshot_without_event_stream(self):
+        # Given
+        id = uuid4()
+
+        # When
+        counter = Counter(snapshot=Snapshot(id=id, version=6, state={"id": id, "count": 5}))
+
+        # Expect
+        self.assertEqual(6, counter.version)
+
+    def test_loader_should_take_snapshot_according_to_policy(self):
+        # Given
+        id = uuid4()
+        event_store = _EventStore(id, increments=9)
+        snapshot_store = InMemorySnapshotStore()
+        loader = SnapshotLoader(Counter, event_store, snapshot_store, EventCountPolicy(every=10))
+
+        # When
+        counter = loader.load(id)
+
+        # Expect
+        self.assertEqual(9, counter.count)
+        snapshot = snapshot_store.load(id)
+        assert snapshot is not None
+        self.assertEqual(10, snapshot.version)
+        self.assertEqual({"id": id, "count": 9}, snapshot.state)
+
+    def test_loader_should_only_replay_events_after_snapshot(self):
+        # Given
+        id = uuid4()
+        event_store = _EventStore(id, increments=9)
+        snapshot_store = InMemorySnapshotStore()
+        loader = SnapshotLoader(Counter, event_store, snapshot_store, EventCountPolicy(every=10))
+        loader.load(id)
+        event_store.events.append(CounterIncrementedEvent(id=id))
+
+        # When
+        counter = loader.load(id)
+
+        # Expect
+        self.assertEqual([0, 10], event_store.loaded_after)
+        self.assertEqual(10, counter.count)
+        self.assertEqual(11, counter.version)
+
+    def test_loader_should_not_take_snapshot_before_policy_threshold(self):
+        # Given
+        id = uuid4()
+        snapshot_store = InMemorySnapshotStore()
+        loader = SnapshotLoader(Counter, _EventStore(id, increments=8), snapshot_store, EventCountPolicy(every=10))
+
+        # When
+        loader.load(id)
+
+        # Expect
+        self.assertIsNone(snapshot_store.load(id))
+
+    def test_replay_time_policy_should_snapshot_slow_replays(self):
+        # Given
+        policy = ReplayTimePolicy(threshold_seconds=0.1)
+
+        # Expect
+        self.assertTrue(policy.should_snapshot(events_replayed=100, replay_seconds=0.2))
+        self.assertFalse(policy.should_snapshot(events_replayed=100, replay_seconds=0.05))
+        self.assertFalse(policy.should_snapshot(events_replayed=0, replay_seconds=0.2))
+
+    def test_loader_should_take_snapshot_when_replay_exceeds_time_threshold(self):
+        # Given
+        id = uuid4()
+
+        class SlowCounter(Counter):
+            def _restore_snapshot(self, state: Any) -> None:
+                time.sleep(0.01)
+                super()._restore_snapshot(state)
+
+        snapshot_store = InMemorySnapshotStore()
+        snapshot_store.save(Snapshot(id=id, version=1, state={"id": id, "count": 0}))
+        loader = SnapshotLoader(
+            SlowCounter, _EventStore(id, increments=1), snapshot_store, ReplayTimePolicy(threshold_seconds=0.001)
+        )
+
+        # When
+        loader.load(id)
+
+        # Expect
+        snapshot = snapshot_store.load(id)
+        assert snapshot is not None
+        self.assertEqual(2, snapshot.version)
+
+    def test_in_memory_store_should_keep_latest_snapshot(self):
+        # Given
+        id = uuid4()
+        store = InMemorySnapshotStore()
+
+        # When
+        store.save(Snapshot(id=id, version=10, state={}))
+        store.save(Snapshot(id=id, version=5, state={}))
+
+        # Expect
+        snapshot = store.load(id)
+        assert snapshot is not None
+        self.assertEqual(10, snapshot.version)
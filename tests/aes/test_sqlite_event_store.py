@@ -0,0 +1,133 @@
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+from pydddantic import ConcurrencyError, JsonEventSerializer, SqliteConnectionPool, SqliteEventStore
+
+from .fixtures import EventStoreContract, User, UserCreatedEvent, UserNameChangedEvent
+
+
+class SqliteEventStoreTests(EventStoreContract, unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database = f"{directory.name}/events.db"
+        self.serializer = JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)
+
+    def open_store(self, database: str | SqliteConnectionPool | None = None) -> SqliteEventStore:
+        store = SqliteEventStore(database or self.database, self.serializer)
+        self.addCleanup(store.close)
+        return store
+
+    def test_should_load_version_consistent_with_events_despite_concurrent_append(self):
+        # Given
+        pool = SqliteConnectionPool(self.database, size=1)
+        store = self.open_store(pool)
+        writer = self.open_store()
+        user = User.create(name="Alice")
+        store.append(user)
+        loaded = User(event_stream=store.load(user.id))
+        loaded.change_name("Bob")
+
+        def append_while_reading_version(statement: str) -> None:
+            if statement.startswith("SELECT COALESCE(MAX(version)") and loaded.changes:
+                writer.append(loaded)
+                loaded._commit_changes()
+
+        with pool.connection() as connection:
+            connection.set_trace_callback(append_while_reading_version)
+
+        # When
+        stream = store.load(user.id, after_version=1)
+
+        # Expect
+        self.assertEqual([], list(stream))
+        self.assertEqual(1, stream.version)
+        self.assertEqual(2, store.get_version(user.id))
+
+    def test_should_persist_events_when_reopened(self):
+        # Given
+        store = self.open_store()
+        user = User.create(name="Alice")
+        user.change_name("Bob")
+        store.append(user)
+        store.close()
+
+        # When
+        reopened = self.open_store()
+
+        # Expect
+        self.assertEqual(2, reopened.get_version(user.id))
+        self.assertEqual("Bob", User(event_stream=reopened.load(user.id)).name)
+
+    def test_should_allow_only_one_concurrent_append_of_the_same_version(self):
+        # Given
+        store = self.open_store(SqliteConnectionPool(self.database, size=8))
+        user = User.create(name="Alice")
+        store.append(user)
+
+        barrier = threading.Barrier(8)
+        errors: list[Exception] = []
+
+        def change_name(name: str) -> None:
+            loaded = User(event_stream=store.load(user.id))
+            loaded.change_name(name)
+            barrier.wait()
+            try:
+                store.append(loaded)
+            except ConcurrencyError as e:
+                errors.append(e)
+
+        # When
+        threads = [threading.Thread(target=change_name, args=(f"User {i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Expect
+        self.assertEqual(7, len(errors))
+        self.assertEqual(2, store.get_version(user.id))
+
+    def test_should_use_a_single_connection_for_in_memory_database(self):
+        # Given
+        store = self.open_store(":memory:")
+        user = User.create(name="Alice")
+
+        # When
+        store.append(user)
+
+        # Expect
+        self.assertEqual("Alice", User(event_stream=store.load(user.id)).name)
+
+    def test_closed_pool_should_not_lend_connections(self):
+        # Given
+        pool = SqliteConnectionPool(self.database, size=1)
+        borrowed = threading.Event()
+        errors: list[Exception] = []
+
+        def wait_for_connection() -> None:
+            borrowed.wait()
+            try:
+                with pool.connection():
+                    pass
+            except sqlite3.ProgrammingError as e:
+                errors.append(e)
+
+        waiting = threading.Thread(target=wait_for_connection)
+        waiting.start()
+
+        # When
+        with pool.connection():
+            borrowed.set()
+            time.sleep(0.05)
+            pool.close()
+        waiting.join()
+
+        # Expect
+        self.assertEqual(1, len(errors))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            with pool.connection():
+                pass
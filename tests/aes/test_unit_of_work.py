@@ -0,0 +1,172 @@
+import tempfile
+import unittest
+
+from pydddantic import ConcurrencyError, JsonEventSerializer, MessageBus, SqliteEventStore, Subscriber, UnitOfWork
+
+from .fixtures import User, UserCreatedEvent, UserEvent, UserNameChangedEvent
+
+
+class UnitOfWorkTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = SqliteEventStore(
+            f"{directory.name}/events.db", JsonEventSerializer(UserCreatedEvent, UserNameChangedEvent)
+        )
+        self.addCleanup(self.store.close)
+        self.message_bus = MessageBus()
+        self.addCleanup(self.message_bus.reset)
+
+    def test_should_commit_changes_of_all_tracked_aggregates(self):
+        # Given
+        alice = User.create(name="Alice")
+        bob = User.create(name="Bob")
+        self.store.append_many([alice, bob])
+
+        uow = UnitOfWork(self.store, self.message_bus)
+        for user in uow.load_many(User, [alice.id, bob.id]):
+            user.change_name(user.name.upper())
+        carol = User.create(name="Carol")
+        uow.add(carol)
+
+        # When
+        uow.commit()
+
+        # Expect
+        self.assertEqual({alice.id: 2, bob.id: 2, carol.id: 1}, self.store.get_versions([alice.id, bob.id, carol.id]))
+        self.assertEqual("ALICE", User(event_stream=self.store.load(alice.id)).name)
+
+    def test_should_return_tracked_instance_when_loaded_again(self):
+        # Given
+        alice = User.create(name="Alice")
+        self.store.append(alice)
+        uow = UnitOfWork(self.store, self.message_bus)
+
+        # When
+        first = uow.load(User, alice.id)
+        second = uow.load(User, alice.id)
+
+        # Expect
+        self.assertIs(first, second)
+
+    def test_should_load_repeated_ids_once(self):
+        # Given
+        alice = User.create(name="Alice")
+        self.store.append(alice)
+        uow = UnitOfWork(self.store, self.message_bus)
+
+        # When
+        users = uow.load_many(User, [alice.id, str(alice.id), alice.id])
+
+        # Expect
+        self.assertIs(users[0], users[1])
+        self.assertIs(users[0], users[2])
+        self.assertEqual("Alice", users[0].name)
+
+    def test_should_publish_committed_events_and_clear_changes(self):
+        # Given
+        published: list[UserEvent] = []
+        self.message_bus.subscribe(Subscriber[UserEvent](published.append))
+
+        uow = UnitOfWork(self.store, self.message_bus)
+        alice = User.create(name="Alice")
+        alice.change_name("Alicia")
+        uow.add(alice)
+
+        # When
+        uow.commit()
+
+        # Expect
+        self.assertEqual([UserCreatedEvent, UserNameChangedEvent], [type(event) for event in published])
+        self.assertEqual([], list(alice.changes))
+        self.assertEqual(2, alice.version)
+
+    def test_should_publish_events_of_mixed_types_in_append_order(self):
+        # Given
+        published: list[UserEvent] = []
+        self.message_bus.subscribe(Subscriber[UserEvent](published.append))
+
+        uow = UnitOfWork(self.store, self.message_bus)
+        alice = User.create(name="Alice")
+        alice.change_name("Alicia")
+        bob = User.create(name="Bob")
+        bob.change_name("Robert")
+        uow.add(alice)
+        uow.add(bob)
+
+        # When
+        uow.commit()
+
+        # Expect
+        self.assertEqual(
+            [
+                (UserCreatedEvent, alice.id),
+                (UserNameChangedEvent, alice.id),
+                (UserCreatedEvent, bob.id),
+                (UserNameChangedEvent, bob.id),
+            ],
+            [(type(event), event.id) for event in published],
+        )
+
+    def test_should_append_further_changes_after_commit(self):
+        # Given
+        uow = UnitOfWork(self.store, self.message_bus)
+        alice = User.create(name="Alice")
+        uow.add(alice)
+        uow.commit()
+
+        # When
+        alice.change_name("Alicia")
+        uow.commit()
+
+        # Expect
+        self.assertEqual("Alicia", User(event_stream=self.store.load(alice.id)).name)
+
+    def test_should_append_nothing_when_any_aggregate_is_stale(self):
+        # Given
+        alice = User.create(name="Alice")
+        bob = User.create(name="Bob")
+        self.store.append_many([alice, bob])
+
+        uow = UnitOfWork(self.store, self.message_bus)
+        for user in uow.load_many(User, [alice.id, bob.id]):
+            user.change_name(user.name.upper())
+
+        concurrent = User(event_stream=self.store.load(bob.id))
+        concurrent.change_name("Robert")
+        self.store.append(concurrent)
+
+        # Expect
+        with self.assertRaises(ConcurrencyError):
+            uow.commit()
+
+        self.assertEqual(1, self.store.get_version(alice.id))
+        self.assertEqual(1, len(uow.load(User, alice.id).changes))
+
+    def test_should_clear_changes_when_subscriber_fails(self):
+        # Given
+        def fail(event: UserEvent) -> None:
+            raise ValueError(event)
+
+        self.message_bus.subscribe(Subscriber[UserEvent](fail))
+        uow = UnitOfWork(self.store, self.message_bus)
+        alice = User.create(name="Alice")
+        uow.add(alice)
+
+        # Expect
+        with self.assertRaises(ValueError):
+            uow.commit()
+
+        self.assertEqual(1, self.store.get_version(alice.id))
+        self.assertEqual([], list(alice.changes))
+
+    def test_should_raise_when_adding_another_instance_of_tracked_aggregate(self):
+        # Given
+        alice = User.create(name="Alice")
+        self.store.append(alice)
+        uow = UnitOfWork(self.store, self.message_bus)
+        uow.load(User, alice.id)
+
+        # Expect
+        with self.assertRaises(ValueError):
+            uow.add(alice)
@@ -0,0 +1,212 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+from pydddantic.eda import AsyncMessageBus, AsyncSubscriber, CascadeLimitError, Event, PublishError
+
+
+class UserEvent(Event):
+    id: UUID
+
+
+class UserCreatedEvent(UserEvent):
+    name: str
+
+
+class UserNameChangedEvent(UserEvent):
+    old_name: str
+    new_name: str
+
+
+class AsyncMessageBusTests(unittest.IsolatedAsyncioTestCase):
+    async def test_should_receive_subscribed_event(self):
+        # Given
+        mock_subscriber = AsyncMock()
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created)):
+
+            # When
+            await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_awaited_once()
+
+    async def test_should_receive_all_events_derived_from_subscribed_base_event(self):
+        # Given
+        mock_subscriber = AsyncMock()
+        id = uuid4()
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserEvent](mock_subscriber.on_any_user_event)):
+
+            # When
+            await AsyncMessageBus().publish(UserCreatedEvent(id=id, name="Alice"))
+            await AsyncMessageBus().publish(UserNameChangedEvent(id=id, old_name="Alice", new_name="Bob"))
+
+        # Expect
+        self.assertEqual(2, mock_subscriber.on_any_user_event.await_count)
+
+    async def test_should_not_receive_events_not_subscribed_to(self):
+        # Given
+        mock_subscriber = AsyncMock()
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created)):
+
+            # When
+            await AsyncMessageBus().publish(UserNameChangedEvent(id=uuid4(), old_name="Alice", new_name="Bob"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_not_awaited()
+
+    async def test_should_raise_if_subscription_missing_generic_param_for_event_type(self):
+        # Given
+        mock_subscriber = AsyncMock()
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber(mock_subscriber.on_any_event)):
+
+            # Expect
+            with self.assertRaises(RuntimeError):
+                await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+    async def test_should_run_subscribers_concurrently(self):
+        # Given
+        started = 0
+        all_started = asyncio.Event()
+
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+
+        with AsyncMessageBus().subscribe(*[AsyncSubscriber[UserCreatedEvent](on_user_created) for _ in range(3)]):
+
+            # When
+            await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertEqual(3, started)
+
+    async def test_should_limit_concurrently_running_subscribers(self):
+        # Given
+        running = 0
+        max_running = 0
+
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        with AsyncMessageBus().subscribe(*[AsyncSubscriber[UserCreatedEvent](on_user_created) for _ in range(5)]):
+
+            # When
+            await AsyncMessageBus(max_concurrency=2).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertEqual(2, max_running)
+
+    async def test_should_aggregate_subscriber_errors_after_running_all_subscribers(self):
+        # Given
+        mock_subscriber = AsyncMock()
+        mock_subscriber.on_user_created.side_effect = ValueError("first")
+        mock_subscriber.on_any_user_event.side_effect = KeyError("second")
+        event = UserCreatedEvent(id=uuid4(), name="Alice")
+
+        with AsyncMessageBus().subscribe(
+            AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created),
+            AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created_ok),
+            AsyncSubscriber[UserEvent](mock_subscriber.on_any_user_event),
+        ):
+
+            # When
+            with self.assertRaises(PublishError) as exc:
+                await AsyncMessageBus().publish(event)
+
+        # Expect
+        mock_subscriber.on_user_created_ok.assert_awaited_once()
+        self.assertIs(event, exc.exception.message)
+        self.assertEqual([ValueError, KeyError], [type(e) for e in exc.exception.errors])
+
+    async def test_should_propagate_cancellation_of_a_subscriber_instead_of_aggregating_it(self):
+        # Given
+        mock_subscriber = AsyncMock()
+        mock_subscriber.on_user_created.side_effect = asyncio.CancelledError()
+
+        with AsyncMessageBus().subscribe(
+            AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created),
+            AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created_ok),
+        ):
+
+            # When
+            with self.assertRaises(asyncio.CancelledError):
+                await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created_ok.assert_awaited_once()
+
+    async def test_subscriptions_should_be_isolated_between_tasks(self):
+        # Given
+        mock_subscriber = AsyncMock()
+
+        async def subscribe_in_task() -> None:
+            AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created))
+
+        # When
+        await asyncio.create_task(subscribe_in_task())
+        await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_not_awaited()
+
+    async def test_should_clear_subscribers_on_exiting_with_block(self):
+        # Given
+        mock_subscriber = AsyncMock()
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](mock_subscriber.on_user_created)):
+            pass
+
+        # When
+        await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_not_awaited()
+
+    async def test_should_publish_messages_published_by_handlers_after_current_message(self):
+        # Given
+        handled = []
+
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            await AsyncMessageBus().publish(UserNameChangedEvent(id=event.id, old_name=event.name, new_name="Bob"))
+            handled.append("created")
+
+        async def on_any_user_event(event: UserEvent) -> None:
+            handled.append(type(event).__name__)
+
+        with AsyncMessageBus().subscribe(
+            AsyncSubscriber[UserCreatedEvent](on_user_created),
+            AsyncSubscriber[UserEvent](on_any_user_event),
+        ):
+
+            # When
+            await AsyncMessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertEqual(3, len(handled))
+        self.assertEqual("UserNameChangedEvent", handled[-1])
+
+    async def test_should_raise_when_cascade_exceeds_max_depth(self):
+        # Given
+        async def on_user_created(event: UserCreatedEvent) -> None:
+            await AsyncMessageBus().publish(UserCreatedEvent(id=event.id, name=event.name))
+
+        with AsyncMessageBus().subscribe(AsyncSubscriber[UserCreatedEvent](on_user_created)):
+
+            # When
+            with self.assertRaises(PublishError) as exc:
+                await AsyncMessageBus(max_cascade_depth=3).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertIsInstance(exc.exception.errors[0], CascadeLimitError)
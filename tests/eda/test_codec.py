@@ -0,0 +1,154 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID, uuid4
+
+from pydddantic import Command, Event, Message, MessagePackCodec, UniqueId, ValueObject
+
+
+class Plan(Enum):
+    FREE = "free"
+    PRO = "pro"
+
+
+class Address(ValueObject):
+    street: str
+    city: str
+
+
+class UserCreatedEvent(Event, tag="test.user.created"):
+    id: UUID
+    name: str
+
+
+class UserProfileUpdatedEvent(Event, tag="test.user.profile_updated"):
+    id: UUID
+    age: int
+    balance: Decimal
+    score: float
+    birthday: date
+    last_seen: datetime | None
+    plan: Plan
+    address: Address
+    tags: list[str]
+    avatar: bytes
+    counts: dict[str, int]
+
+
+class UserId(UniqueId): ...
+
+
+class UserSessionEndedEvent(Event, tag="test.user.session_ended"):
+    user_id: UserId
+    duration: timedelta
+    bytes_sent: int
+    bytes_refunded: int
+
+
+class CreateUserCommand(Command):
+    name: str
+
+
+class MessageTypeRegistryTests(unittest.TestCase):
+    def test_should_register_message_types_under_given_tag(self):
+        # Expect
+        self.assertEqual("test.user.created", UserCreatedEvent.get_type_tag())
+        self.assertIs(UserCreatedEvent, Message.resolve_type_tag("test.user.created"))
+
+    def test_should_register_message_types_under_qualified_name_by_default(self):
+        # Expect
+        self.assertEqual(f"{__name__}.CreateUserCommand", CreateUserCommand.get_type_tag())
+        self.assertIs(CreateUserCommand, Message.resolve_type_tag(f"{__name__}.CreateUserCommand"))
+
+    def test_should_raise_when_tag_is_already_used_by_another_type(self):
+        # Expect
+        with self.assertRaises(TypeError):
+
+            class OtherEvent(Event, tag="test.user.created"): ...
+
+    def test_should_raise_for_unregistered_tag(self):
+        # Expect
+        with self.assertRaises(ValueError):
+            Message.resolve_type_tag("test.unknown")
+
+
+class MessagePackCodecTests(unittest.TestCase):
+    def setUp(self):
+        self.codec = MessagePackCodec()
+
+    def test_should_deserialize_serialized_message_as_its_type(self):
+        # Given
+        event = UserProfileUpdatedEvent(
+            id=uuid4(),
+            age=-70_000,
+            balance=Decimal("10.50"),
+            score=0.5,
+            birthday=date(1990, 1, 31),
+            last_seen=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=-5))),
+            plan=Plan.PRO,
+            address=Address(street="1 Main St", city="Springfield"),
+            tags=["a" * 40, "b"],
+            avatar=b"\x00" * 300,
+            counts={"logins": 2**40},
+        )
+
+        # When
+        deserialized = self.codec.deserialize(self.codec.serialize(event))
+
+        # Expect
+        self.assertIsInstance(deserialized, UserProfileUpdatedEvent)
+        self.assertEqual(event, deserialized)
+
+    def test_should_deserialize_ids_durations_and_big_integers(self):
+        # Given
+        event = UserSessionEndedEvent(
+            user_id=UserId.generate(),
+            duration=timedelta(days=-1, microseconds=5),
+            bytes_sent=2**64,
+            bytes_refunded=-(2**70),
+        )
+
+        # When
+        data = self.codec.serialize(event)
+        deserialized = self.codec.deserialize(data)
+
+        # Expect
+        self.assertEqual(event, deserialized)
+        self.assertIsInstance(deserialized.user_id, UserId)
+        self.assertIn(event.user_id.bytes, data)
+        self.assertNotIn(str(event.user_id).encode(), data)
+
+    def test_should_deserialize_from_memoryview(self):
+        # Given
+        command = CreateUserCommand(name="Alice")
+
+        # When
+        deserialized = self.codec.deserialize(memoryview(self.codec.serialize(command)))
+
+        # Expect
+        self.assertEqual(command, deserialized)
+
+    def test_should_serialize_more_compactly_than_json(self):
+        # Given
+        event = UserCreatedEvent(id=uuid4(), name="Alice")
+
+        # Expect
+        self.assertLess(len(self.codec.serialize(event)), len(event.model_dump_json()))
+
+    def test_should_raise_for_truncated_data(self):
+        # Given
+        data = self.codec.serialize(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        with self.assertRaises(ValueError):
+            self.codec.deserialize(data[:-1])
+
+    def test_should_raise_for_unserializable_value(self):
+        # Given
+        class UnserializableEvent(Event):
+            value: object
+
+        # Expect
+        with self.assertRaises(TypeError):
+            self.codec.serialize(UnserializableEvent(value=object()))
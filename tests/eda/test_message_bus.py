@@ -1,8 +1,11 @@
+import pickle
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
-from pydddantic.eda import Event, MessageBus, Subscriber
+from pydddantic.eda import BatchSubscriber, CascadeLimitError, Event, MessageBus, PublishError, Subscriber
 
 
 class UserEvent(Event):
@@ -18,6 +21,9 @@ class UserNameChangedEvent(UserEvent):
     new_name: str
 
 
+def on_any_user_event(event: UserEvent) -> None: ...
+
+
 class MessageBusTests(unittest.TestCase):
     def test_should_receive_subscribed_event(self):
         # Given
@@ -105,3 +111,413 @@ class MessageBusTests(unittest.TestCase):
         # Expect
         mock_subscriber.on_user_created.assert_called_once()
         mock_subscriber.on_user_name_changed.assert_not_called()
+
+    def test_should_receive_events_when_subscribed_after_event_type_was_published(self):
+        # Given
+        mock_subscriber = MagicMock()
+        id = uuid4()
+
+        with MessageBus().subscribe(Subscriber[UserCreatedEvent](mock_subscriber.on_user_created)):
+            MessageBus().publish(UserCreatedEvent(id=id, name="Alice"))
+
+            # When
+            MessageBus().subscribe(Subscriber[UserEvent](mock_subscriber.on_any_user_event))
+            MessageBus().publish(UserCreatedEvent(id=id, name="Bob"))
+
+        # Expect
+        self.assertEqual(2, mock_subscriber.on_user_created.call_count)
+        mock_subscriber.on_any_user_event.assert_called_once()
+
+    def test_should_call_subscribers_in_order_subscribed(self):
+        # Given
+        mock_subscriber = MagicMock()
+        event = UserCreatedEvent(id=uuid4(), name="Alice")
+
+        with MessageBus().subscribe(
+            Subscriber[UserEvent](mock_subscriber.first),
+            Subscriber[UserCreatedEvent](mock_subscriber.second),
+            Subscriber[UserEvent](mock_subscriber.third),
+        ):
+
+            # When
+            MessageBus().publish(event)
+
+        # Expect
+        self.assertEqual(["first", "second", "third"], [name for name, *_ in mock_subscriber.mock_calls])
+
+    def test_should_publish_messages_published_by_handlers_after_current_message(self):
+        # Given
+        handled = []
+        id = uuid4()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            MessageBus().publish(UserNameChangedEvent(id=event.id, old_name=event.name, new_name="Bob"))
+            handled.append("created")
+
+        def on_any_user_event(event: UserEvent) -> None:
+            handled.append(type(event).__name__)
+
+        with MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](on_user_created),
+            Subscriber[UserEvent](on_any_user_event),
+        ):
+
+            # When
+            MessageBus().publish(UserCreatedEvent(id=id, name="Alice"))
+
+        # Expect
+        self.assertEqual(["created", "UserCreatedEvent", "UserNameChangedEvent"], handled)
+
+    def test_should_publish_cascading_messages_breadth_first(self):
+        # Given
+        handled = []
+        id = uuid4()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            handled.append(event.name)
+            if event.name == "root":
+                MessageBus().publish(UserCreatedEvent(id=id, name="child1"))
+                MessageBus().publish(UserCreatedEvent(id=id, name="child2"))
+            elif event.name == "child1":
+                MessageBus().publish(UserCreatedEvent(id=id, name="grandchild"))
+
+        with MessageBus().subscribe(Subscriber[UserCreatedEvent](on_user_created)) as bus:
+
+            # When
+            bus.publish(UserCreatedEvent(id=id, name="root"))
+
+        # Expect
+        self.assertEqual(["root", "child1", "child2", "grandchild"], handled)
+        self.assertGreaterEqual(bus.outbox_high_water, 2)
+
+    def test_should_raise_when_cascade_exceeds_max_depth(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            mock_subscriber.on_user_created(event)
+            MessageBus().publish(UserCreatedEvent(id=event.id, name=event.name))
+
+        with MessageBus().subscribe(Subscriber[UserCreatedEvent](on_user_created)):
+
+            # Expect
+            with self.assertRaises(CascadeLimitError):
+                MessageBus(max_cascade_depth=3).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        self.assertEqual(4, mock_subscriber.on_user_created.call_count)
+
+    def test_should_raise_when_outbox_exceeds_max_size(self):
+        # Given
+        def on_user_created(event: UserCreatedEvent) -> None:
+            for _ in range(3):
+                MessageBus().publish(UserNameChangedEvent(id=event.id, old_name=event.name, new_name="Bob"))
+
+        with MessageBus().subscribe(Subscriber[UserCreatedEvent](on_user_created)):
+
+            # Expect
+            with self.assertRaises(CascadeLimitError):
+                MessageBus(max_outbox_size=2).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+    def test_should_discard_queued_messages_when_a_handler_fails(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            MessageBus().publish(UserNameChangedEvent(id=event.id, old_name=event.name, new_name="Bob"))
+            raise ValueError()
+
+        with MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](on_user_created),
+            Subscriber[UserNameChangedEvent](mock_subscriber.on_user_name_changed),
+        ):
+            with self.assertRaises(ValueError):
+                MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+            # When
+            MessageBus().publish(UserEvent(id=uuid4()))
+
+        # Expect
+        mock_subscriber.on_user_name_changed.assert_not_called()
+
+    def test_publish_many_should_pass_consecutive_messages_of_each_type_to_batch_subscribers_in_one_call(self):
+        # Given
+        mock_subscriber = MagicMock()
+        id = uuid4()
+        created = [UserCreatedEvent(id=id, name="Alice"), UserCreatedEvent(id=id, name="Bob")]
+        changed = [UserNameChangedEvent(id=id, old_name="Alice", new_name="Bob")]
+
+        with MessageBus().subscribe(BatchSubscriber[UserEvent](mock_subscriber.on_user_events)):
+
+            # When
+            MessageBus().publish_many([created[0], created[1], changed[0]])
+
+        # Expect
+        self.assertEqual(2, mock_subscriber.on_user_events.call_count)
+        self.assertEqual(created, list(mock_subscriber.on_user_events.call_args_list[0].args[0]))
+        self.assertEqual(changed, list(mock_subscriber.on_user_events.call_args_list[1].args[0]))
+
+    def test_publish_many_should_pass_messages_to_subscribers_one_at_a_time(self):
+        # Given
+        mock_subscriber = MagicMock()
+        id = uuid4()
+
+        with MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](mock_subscriber.on_user_created),
+            Subscriber[UserNameChangedEvent](mock_subscriber.on_user_name_changed),
+        ):
+
+            # When
+            MessageBus().publish_many(
+                [
+                    UserCreatedEvent(id=id, name="Alice"),
+                    UserCreatedEvent(id=id, name="Bob"),
+                    UserNameChangedEvent(id=id, old_name="Alice", new_name="Bob"),
+                ]
+            )
+
+        # Expect
+        self.assertEqual(2, mock_subscriber.on_user_created.call_count)
+        mock_subscriber.on_user_name_changed.assert_called_once()
+
+    def test_publish_many_should_keep_the_order_of_interleaved_types_for_base_type_subscribers(self):
+        # Given
+        handled: list[str] = []
+        batches: list[list[str]] = []
+        id = uuid4()
+        events = [
+            UserCreatedEvent(id=id, name="Alice"),
+            UserNameChangedEvent(id=id, old_name="Alice", new_name="Bob"),
+            UserCreatedEvent(id=id, name="Carol"),
+            UserNameChangedEvent(id=id, old_name="Carol", new_name="Dave"),
+        ]
+
+        def name(event: UserEvent) -> str:
+            return event.name if isinstance(event, UserCreatedEvent) else event.new_name
+
+        with MessageBus().subscribe(
+            Subscriber[UserEvent](lambda event: handled.append(name(event))),
+            BatchSubscriber[UserEvent](lambda events: batches.append([name(event) for event in events])),
+        ):
+
+            # When
+            MessageBus().publish_many(events)
+
+        # Expect
+        self.assertEqual(["Alice", "Bob", "Carol", "Dave"], handled)
+        self.assertEqual(["Alice", "Bob", "Carol", "Dave"], [name for batch in batches for name in batch])
+
+    def test_batch_subscriber_should_receive_individually_published_message_as_batch_of_one(self):
+        # Given
+        mock_subscriber = MagicMock()
+        event = UserCreatedEvent(id=uuid4(), name="Alice")
+
+        with MessageBus().subscribe(BatchSubscriber[UserCreatedEvent](mock_subscriber.on_users_created)):
+
+            # When
+            MessageBus().publish(event)
+
+        # Expect
+        mock_subscriber.on_users_created.assert_called_once()
+        self.assertEqual([event], list(mock_subscriber.on_users_created.call_args.args[0]))
+
+    def test_publish_many_from_handler_should_queue_messages(self):
+        # Given
+        handled = []
+        id = uuid4()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            handled.append(event.name)
+            MessageBus().publish_many(
+                [
+                    UserNameChangedEvent(id=id, old_name=event.name, new_name="Bob"),
+                    UserNameChangedEvent(id=id, old_name="Bob", new_name="Carol"),
+                ]
+            )
+
+        def on_user_name_changed(event: UserNameChangedEvent) -> None:
+            handled.append(event.new_name)
+
+        with MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](on_user_created),
+            Subscriber[UserNameChangedEvent](on_user_name_changed),
+        ):
+
+            # When
+            MessageBus().publish(UserCreatedEvent(id=id, name="Alice"))
+
+        # Expect
+        self.assertEqual(["Alice", "Bob", "Carol"], handled)
+
+    def test_shared_subscribers_should_receive_events_published_from_any_thread(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        MessageBus().subscribe_shared(Subscriber[UserCreatedEvent](mock_subscriber.on_user_created))
+        self.addCleanup(MessageBus().reset_shared)
+
+        # When
+        thread = threading.Thread(target=lambda: MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice")))
+        thread.start()
+        thread.join()
+
+        # Expect
+        mock_subscriber.on_user_created.assert_called_once()
+
+    def test_should_call_shared_subscribers_before_thread_subscribers(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        MessageBus().subscribe_shared(Subscriber[UserEvent](mock_subscriber.shared))
+        self.addCleanup(MessageBus().reset_shared)
+
+        with MessageBus().subscribe(Subscriber[UserCreatedEvent](mock_subscriber.local)):
+
+            # When
+            MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertEqual(["shared", "local"], [name for name, *_ in mock_subscriber.mock_calls])
+
+    def test_reset_should_not_clear_shared_subscribers(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        MessageBus().subscribe_shared(Subscriber[UserCreatedEvent](mock_subscriber.on_user_created))
+        self.addCleanup(MessageBus().reset_shared)
+
+        # When
+        MessageBus().reset()
+        MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_called_once()
+
+    def test_reset_shared_should_clear_shared_subscribers(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        MessageBus().subscribe_shared(Subscriber[UserCreatedEvent](mock_subscriber.on_user_created))
+        MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # When
+        MessageBus().reset_shared()
+        MessageBus().publish(UserCreatedEvent(id=uuid4(), name="Bob"))
+
+        # Expect
+        mock_subscriber.on_user_created.assert_called_once()
+
+
+class MessageBusExecutorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        MessageBus().reset()
+
+    def test_should_run_subscribers_in_parallel(self):
+        # Given
+        barrier = threading.Barrier(2, timeout=5)
+        threads = set()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            threads.add(threading.get_ident())
+            barrier.wait()
+
+        MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](on_user_created),
+            Subscriber[UserCreatedEvent](on_user_created),
+        )
+
+        # When
+        MessageBus(executor=self.executor).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        self.assertEqual(2, len(threads))
+
+    def test_should_handle_messages_of_the_same_partition_in_order(self):
+        # Given
+        ids = [uuid4(), uuid4(), uuid4()]
+        handled: dict[UUID, list[str]] = {id: [] for id in ids}
+        events = [UserNameChangedEvent(id=id, old_name=str(i), new_name=str(i + 1)) for i in range(20) for id in ids]
+
+        def on_user_name_changed(event: UserNameChangedEvent) -> None:
+            handled[event.id].append(event.new_name)
+
+        MessageBus().subscribe(Subscriber[UserNameChangedEvent](on_user_name_changed))
+
+        # When
+        MessageBus(executor=self.executor, partition_key=lambda message: message.id).publish_many(events)
+
+        # Expect
+        for id in ids:
+            self.assertEqual([str(i + 1) for i in range(20)], handled[id])
+
+    def test_should_pass_each_partition_to_batch_subscribers(self):
+        # Given
+        mock_subscriber = MagicMock()
+        id1, id2 = uuid4(), uuid4()
+
+        MessageBus().subscribe(BatchSubscriber[UserEvent](mock_subscriber.on_user_events))
+
+        # When
+        MessageBus(executor=self.executor, partition_key=lambda message: message.id).publish_many(
+            [
+                UserCreatedEvent(id=id1, name="Alice"),
+                UserCreatedEvent(id=id2, name="Bob"),
+                UserNameChangedEvent(id=id1, old_name="Alice", new_name="Carol"),
+            ]
+        )
+
+        # Expect
+        batches = sorted([list(call.args[0]) for call in mock_subscriber.on_user_events.call_args_list], key=len)
+        self.assertEqual([id2], [event.id for event in batches[0]])
+        self.assertEqual([UserCreatedEvent, UserNameChangedEvent], [type(event) for event in batches[1]])
+
+    def test_should_raise_publish_error_with_all_subscriber_errors(self):
+        # Given
+        mock_subscriber = MagicMock()
+        mock_subscriber.on_user_created.side_effect = ValueError()
+
+        MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](mock_subscriber.on_user_created),
+            Subscriber[UserCreatedEvent](mock_subscriber.on_user_created),
+            Subscriber[UserCreatedEvent](mock_subscriber.on_user_created_ok),
+        )
+
+        # When
+        with self.assertRaises(PublishError) as exc:
+            MessageBus(executor=self.executor).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_created_ok.assert_called_once()
+        self.assertEqual([ValueError, ValueError], [type(e) for e in exc.exception.errors])
+
+    def test_should_publish_messages_published_by_handlers_on_workers(self):
+        # Given
+        mock_subscriber = MagicMock()
+
+        def on_user_created(event: UserCreatedEvent) -> None:
+            MessageBus().publish(UserNameChangedEvent(id=event.id, old_name=event.name, new_name="Bob"))
+
+        MessageBus().subscribe(
+            Subscriber[UserCreatedEvent](on_user_created),
+            Subscriber[UserNameChangedEvent](mock_subscriber.on_user_name_changed),
+        )
+
+        # When
+        MessageBus(executor=self.executor).publish(UserCreatedEvent(id=uuid4(), name="Alice"))
+
+        # Expect
+        mock_subscriber.on_user_name_changed.assert_called_once()
+
+    def test_subscriber_should_be_picklable_for_process_pools(self):
+        # Given
+        subscriber = Subscriber[UserEvent](on_any_user_event)
+
+        # When
+        unpickled = pickle.loads(pickle.dumps(subscriber))
+
+        # Expect
+        self.assertIs(type(subscriber), type(unpickled))
+        self.assertIs(on_any_user_event, unpickled.root)
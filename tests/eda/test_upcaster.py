@@ -0,0 +1,136 @@
+import unittest
+from typing_extensions import Any
+
+from pydddantic import Event, JsonEventSerializer, MessagePackCodec, UpcasterRegistry
+
+
+class UserRegisteredEvent(Event, tag="test.user.registered", schema_version=3):
+    full_name: str
+    email: str
+
+
+def _split_name(fields: dict[str, Any]) -> dict[str, Any]:
+    fields["full_name"] = f"{fields.pop('first_name')} {fields.pop('last_name')}"
+    return fields
+
+
+def _add_email(fields: dict[str, Any]) -> dict[str, Any]:
+    return {**fields, "email": "unknown"}
+
+
+def _pack_short_str(value: str) -> bytes:
+    return bytes([0xA0 | len(value)]) + value.encode()
+
+
+def pack_record(tag: str, schema_version: int, fields: dict[str, str]) -> bytes:
+    "Packs a short MessagePack record by hand, as written by an older version of the codec"
+
+    data = bytes([0x93]) + _pack_short_str(tag) + bytes([schema_version]) + bytes([0x80 | len(fields)])
+    for key, value in fields.items():
+        data += _pack_short_str(key) + _pack_short_str(value)
+    return data
+
+
+class UpcasterRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.upcasters = UpcasterRegistry()
+        self.upcasters.register(UserRegisteredEvent, 1, _split_name).register("test.user.registered", 2, _add_email)
+
+    def test_should_upcast_fields_through_chain_to_current_version(self):
+        # When
+        fields = self.upcasters.upcast("test.user.registered", 1, {"first_name": "Ada", "last_name": "Lovelace"})
+
+        # Expect
+        self.assertEqual({"full_name": "Ada Lovelace", "email": "unknown"}, fields)
+
+    def test_should_upcast_from_intermediate_version(self):
+        # When
+        fields = self.upcasters.upcast("test.user.registered", 2, {"full_name": "Ada Lovelace"})
+
+        # Expect
+        self.assertEqual({"full_name": "Ada Lovelace", "email": "unknown"}, fields)
+
+    def test_should_not_upcast_current_version(self):
+        # Given
+        fields = {"full_name": "Ada Lovelace", "email": "ada@example.com"}
+
+        # Expect
+        self.assertIs(fields, self.upcasters.upcast("test.user.registered", 3, fields))
+
+    def test_should_register_upcaster_with_decorator(self):
+        # Given
+        upcasters = UpcasterRegistry()
+
+        @upcasters.register(UserRegisteredEvent, from_version=2)
+        def add_email(fields: dict[str, Any]) -> dict[str, Any]:
+            return {**fields, "email": "unknown"}
+
+        # When
+        fields = upcasters.upcast("test.user.registered", 2, {"full_name": "Ada Lovelace"})
+
+        # Expect
+        self.assertEqual("unknown", fields["email"])
+
+    def test_should_raise_when_upcaster_is_missing_from_chain(self):
+        # Given
+        upcasters = UpcasterRegistry().register(UserRegisteredEvent, 2, _add_email)
+
+        # Expect
+        with self.assertRaises(ValueError):
+            upcasters.upcast("test.user.registered", 1, {"first_name": "Ada", "last_name": "Lovelace"})
+
+    def test_should_raise_when_upcaster_is_registered_twice(self):
+        # Expect
+        with self.assertRaises(ValueError):
+            self.upcasters.register(UserRegisteredEvent, 1, _add_email)
+
+    def test_should_read_records_lazily(self):
+        # Given
+        records = iter(
+            [
+                ("test.user.registered", 1, {"first_name": "Ada", "last_name": "Lovelace"}),
+                ("test.user.registered", 3, {"full_name": "Grace Hopper", "email": "grace@example.com"}),
+            ]
+        )
+
+        # When
+        messages = self.upcasters.read(records)
+        first = next(messages)
+
+        # Expect
+        self.assertEqual(
+            UserRegisteredEvent(full_name="Ada Lovelace", email="unknown", occurred_at=first.occurred_at), first
+        )
+        self.assertEqual("Grace Hopper", next(messages).full_name)
+
+    def test_codec_should_upcast_records_of_older_schema_versions(self):
+        # Given
+        codec = MessagePackCodec(self.upcasters)
+        data = pack_record("test.user.registered", 1, {"first_name": "Ada", "last_name": "Lovelace"})
+
+        # When
+        event = codec.deserialize(data)
+
+        # Expect
+        self.assertEqual("Ada Lovelace", event.full_name)
+        self.assertEqual("unknown", event.email)
+
+    def test_codec_should_round_trip_current_schema_version(self):
+        # Given
+        codec = MessagePackCodec(self.upcasters)
+        event = UserRegisteredEvent(full_name="Ada Lovelace", email="ada@example.com")
+
+        # Expect
+        self.assertEqual(event, codec.deserialize(codec.serialize(event)))
+
+    def test_json_serializer_should_upcast_records_of_older_schema_versions(self):
+        # Given
+        serializer = JsonEventSerializer(UserRegisteredEvent, upcasters=self.upcasters)
+        data = b'UserRegisteredEvent@2\n{"full_name": "Ada Lovelace"}'
+
+        # When
+        event = serializer.deserialize(data)
+
+        # Expect
+        self.assertEqual("unknown", event.email)
+        self.assertEqual(event, serializer.deserialize(serializer.serialize(event)))
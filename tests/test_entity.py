@@ -1,8 +1,8 @@
-from typing_extensions import Annotated, Hashable
+from typing_extensions import Annotated, Any, Hashable, Self
 from unittest import TestCase
 from uuid import UUID, uuid4
 
-from pydantic import Field, ValidationError
+from pydantic import Field, ValidationError, model_validator
 
 from pydddantic import Entity
 
@@ -133,3 +133,245 @@ class EntityTests(TestCase):
 
         # Expect
         self.assertEqual(hash(alice), hash(bob))
+
+    def test_entity_hash_should_be_unchanged_by_field_assignment(self):
+        # Given
+        class User(Entity):
+            name: str
+
+        alice = User(id=uuid4(), name="Alice")
+        expected = hash(alice)
+
+        # When
+        alice.name = "Alicia"
+
+        # Expect
+        self.assertEqual(expected, hash(alice))
+        self.assertEqual(hash(alice.id), hash(alice))
+
+    def test_copied_entity_should_hash_its_own_id(self):
+        # Given
+        class User(Entity):
+            name: str
+
+        alice = User(id=uuid4(), name="Alice")
+        hash(alice)
+
+        # When
+        copy = alice.model_copy(update={"id": uuid4()})
+
+        # Expect
+        self.assertEqual(hash(copy.id), hash(copy))
+
+    def test_entity_should_update_several_fields_at_once(self):
+        # Given
+        class User(Entity):
+            name: str
+            email: str
+            age: int
+
+        user = User(id=uuid4(), name="Alice", email="alice@example.com", age=30)
+
+        # When
+        changed = user.update(name="Bob", email="alice@example.com", age="31")
+
+        # Expect
+        self.assertEqual({"name", "age"}, changed)
+        self.assertEqual("Bob", user.name)
+        self.assertEqual(31, user.age)
+        self.assertEqual({"id", "name", "email", "age"}, user.model_fields_set)
+
+    def test_entity_update_should_apply_nothing_if_a_change_is_invalid(self):
+        # Given
+        class User(Entity):
+            name: str
+            age: int
+
+        user = User(id=uuid4(), name="Alice", age=30)
+
+        # Expect
+        with self.assertRaises(ValidationError) as exc:
+            user.update(name="Bob", age="thirty")
+
+        self.assertEqual("age", exc.exception.errors()[0]["loc"][0])
+        self.assertEqual("Alice", user.name)
+        self.assertEqual(30, user.age)
+
+    def test_entity_update_should_apply_fields_derived_by_model_validators(self):
+        # Given
+        class User(Entity):
+            first_name: str
+            last_name: str
+            full_name: str = ""
+
+            @model_validator(mode="before")
+            @classmethod
+            def derive_full_name(cls, data: Any) -> Any:
+                return {**data, "full_name": f"{data['first_name']} {data['last_name']}"}
+
+        user = User(id=uuid4(), first_name="Alice", last_name="Smith")
+
+        # When
+        changed = user.update(first_name="Bob")
+
+        # Expect
+        self.assertEqual({"first_name", "full_name"}, changed)
+        self.assertEqual("Bob Smith", user.full_name)
+
+    def test_entity_update_should_apply_nothing_if_a_model_validator_fails(self):
+        # Given
+        class Booking(Entity):
+            start: int
+            end: int
+
+            @model_validator(mode="after")
+            def check_period(self) -> Self:
+                if self.start > self.end:
+                    raise ValueError("start must not be after end")
+                return self
+
+        booking = Booking(id=uuid4(), start=1, end=5)
+
+        # Expect
+        with self.assertRaises(ValidationError):
+            booking.update(end=10, start=20)
+
+        self.assertEqual((1, 5), (booking.start, booking.end))
+
+    def test_entity_update_should_only_validate_the_end_state_of_dependent_fields(self):
+        # Given
+        class Booking(Entity):
+            start: int
+            end: int
+
+            @model_validator(mode="after")
+            def check_period(self) -> Self:
+                if self.start > self.end:
+                    raise ValueError("start must not be after end")
+                return self
+
+        booking = Booking(id=uuid4(), start=1, end=5)
+
+        # When
+        changed = booking.update(start=20, end=30)
+
+        # Expect
+        self.assertEqual({"start", "end"}, changed)
+        self.assertEqual((20, 30), (booking.start, booking.end))
+
+    def test_entity_update_should_reject_frozen_and_unknown_fields(self):
+        # Given
+        class User(Entity):
+            name: str
+
+        user = User(id=uuid4(), name="Alice")
+
+        # Expect
+        with self.assertRaises(ValidationError) as exc:
+            user.update(id=uuid4(), name="Bob")
+
+        self.assertEqual("frozen_field", exc.exception.errors()[0]["type"])
+        with self.assertRaises(ValueError):
+            user.update(nickname="Al")
+        self.assertEqual("Alice", user.name)
+
+    def test_entity_update_should_validate_fields_with_an_alias(self):
+        # Given
+        class User(Entity):
+            name: str = Field(alias="fullName")
+
+        user = User(id=uuid4(), fullName="Alice")
+
+        # When
+        user.update(name="Bob")
+
+        # Expect
+        self.assertEqual("Bob", user.name)
+
+    def test_entity_should_track_changed_fields(self):
+        # Given
+        class User(Entity, track_changes=True):
+            name: str
+            email: str
+            age: int
+
+        user = User(id=uuid4(), name="Alice", email="alice@example.com", age=30)
+
+        # When
+        user.name = "Bob"
+        user.email = "alice@example.com"
+        user.update(age=31)
+
+        # Expect
+        self.assertEqual({"name", "age"}, user.get_dirty_fields())
+        self.assertEqual({"name": "Bob", "age": 31}, user.dump_dirty_fields())
+
+    def test_entity_should_track_changes_from_its_last_checkpoint(self):
+        # Given
+        class User(Entity, track_changes=True):
+            name: str
+            age: int
+
+        user = User(id=uuid4(), name="Alice", age=30)
+        user.name = "Bob"
+
+        # When
+        user.mark_clean()
+        user.age = 31
+
+        # Expect
+        self.assertEqual({"age"}, user.get_dirty_fields())
+        self.assertEqual({"age": 31}, user.dump_dirty_fields())
+
+    def test_entity_should_track_fields_changed_by_validators(self):
+        # Given
+        class User(Entity, track_changes=True):
+            first_name: str
+            last_name: str
+            full_name: str = ""
+
+            @model_validator(mode="before")
+            @classmethod
+            def derive_full_name(cls, data: Any) -> Any:
+                return {**data, "full_name": f"{data['first_name']} {data['last_name']}"}
+
+        user = User(id=uuid4(), first_name="Alice", last_name="Smith")
+
+        # When
+        user.first_name = "Bob"
+        assigned = user.get_dirty_fields()
+        user.mark_clean()
+        user.update(last_name="Jones")
+
+        # Expect
+        self.assertEqual({"first_name", "full_name"}, assigned)
+        self.assertEqual({"last_name": "Jones", "full_name": "Bob Jones"}, user.dump_dirty_fields())
+
+    def test_entity_subclasses_should_inherit_change_tracking(self):
+        # Given
+        class User(Entity, track_changes=True):
+            name: str
+
+        class Admin(User):
+            role: str
+
+        admin = Admin(id=uuid4(), name="Alice", role="owner")
+
+        # When
+        admin.role = "editor"
+
+        # Expect
+        self.assertEqual({"role"}, admin.get_dirty_fields())
+
+    def test_entity_should_not_track_changes_unless_opted_in(self):
+        # Given
+        class User(Entity):
+            name: str
+
+        user = User(id=uuid4(), name="Alice")
+
+        # Expect
+        with self.assertRaises(TypeError):
+            user.get_dirty_fields()
+        with self.assertRaises(TypeError):
+            user.mark_clean()
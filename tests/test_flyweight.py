@@ -0,0 +1,155 @@
+import gc
+from copy import deepcopy
+from decimal import Decimal
+from unittest import TestCase
+
+from pydddantic import Event, FlyweightCache, FlyweightStats, Value, ValueObject
+
+
+class FlyweightTests(TestCase):
+    def test_flyweight_values_should_be_shared(self):
+        # Given
+        class CurrencyCode(Value[str], flyweight=True): ...
+
+        # When
+        code1 = CurrencyCode("CAD")
+        code2 = CurrencyCode("CAD")
+        code3 = CurrencyCode("USD")
+
+        # Expect
+        self.assertIs(code1, code2)
+        self.assertIsNot(code1, code3)
+        self.assertEqual(FlyweightStats(hits=1, misses=2, size=2, maxsize=1024), CurrencyCode.get_flyweight_stats())
+
+    def test_flyweight_value_objects_should_be_shared(self):
+        # Given
+        class Money(ValueObject, flyweight=True):
+            amount: int
+            currency: str
+
+        # When
+        money1 = Money(amount=1, currency="CAD")
+        money2 = Money(amount="1", currency="CAD")
+
+        # Expect
+        self.assertIs(money1, money2)
+        self.assertEqual(1, Money.get_flyweight_stats().hits)
+
+    def test_flyweights_validated_as_fields_should_be_shared(self):
+        # Given
+        class CurrencyCode(Value[str], flyweight=True): ...
+
+        class Money(ValueObject, flyweight=True):
+            amount: int
+            currency: CurrencyCode
+
+        class PaymentReceivedEvent(Event):
+            money: Money
+            currency: CurrencyCode
+
+        # When
+        event1 = PaymentReceivedEvent.model_validate_json(
+            '{"money": {"amount": 1, "currency": "CAD"}, "currency": "CAD"}'
+        )
+        event2 = PaymentReceivedEvent(money={"amount": 1, "currency": "CAD"}, currency="CAD")
+
+        # Expect
+        self.assertIs(event1.money, event2.money)
+        self.assertIs(event1.currency, event2.currency)
+        self.assertIs(event1.money.currency, event1.currency)
+        self.assertIs(CurrencyCode("CAD"), event1.currency)
+
+    def test_flyweight_subclasses_should_share_instances_in_a_cache_of_their_own(self):
+        # Given
+        class CurrencyCode(Value[str], flyweight=2): ...
+
+        class LegacyCurrencyCode(CurrencyCode): ...
+
+        # When
+        code = LegacyCurrencyCode("CAD")
+
+        # Expect
+        self.assertIs(code, LegacyCurrencyCode("CAD"))
+        self.assertIsNot(code, CurrencyCode("CAD"))
+        self.assertEqual(FlyweightStats(hits=1, misses=1, size=1, maxsize=2), LegacyCurrencyCode.get_flyweight_stats())
+
+    def test_flyweight_subclasses_should_not_share_instances_when_opted_out(self):
+        # Given
+        class Money(ValueObject, flyweight=True):
+            amount: int
+            currency: str
+
+        class LegacyMoney(Money, flyweight=False): ...
+
+        # Expect
+        self.assertIsNot(LegacyMoney(amount=1, currency="CAD"), LegacyMoney(amount=1, currency="CAD"))
+        self.assertEqual(LegacyMoney(amount=1, currency="CAD"), LegacyMoney(amount=1, currency="CAD"))
+        with self.assertRaises(TypeError):
+            LegacyMoney.get_flyweight_stats()
+
+    def test_flyweights_should_still_be_copied(self):
+        # Given
+        class Money(ValueObject, flyweight=True):
+            amount: int
+            currency: str
+
+        money = Money(amount=1, currency="CAD")
+
+        # When
+        updated = money.model_copy(update={"amount": 2})
+        copied = deepcopy(money)
+
+        # Expect
+        self.assertEqual(Money(amount=1, currency="CAD"), money)
+        self.assertEqual(2, updated.amount)
+        self.assertEqual(money, copied)
+
+    def test_unreferenced_flyweights_should_be_released_beyond_the_cache_size(self):
+        # Given
+        class CurrencyCode(Value[str], flyweight=2): ...
+
+        kept = CurrencyCode("CAD")
+
+        # When
+        for code in ("USD", "EUR", "GBP"):
+            CurrencyCode(code)
+        gc.collect()
+
+        # Expect
+        self.assertEqual(3, CurrencyCode.get_flyweight_stats().size)
+        self.assertIs(kept, CurrencyCode("CAD"))
+
+    def test_cache_should_not_share_instances_with_unhashable_fields(self):
+        # Given
+        class Tags(ValueObject, flyweight=True):
+            names: list[str]
+
+        # When
+        tags1 = Tags(names=["a"])
+        tags2 = Tags(names=["a"])
+
+        # Expect
+        self.assertIsNot(tags1, tags2)
+        self.assertEqual(tags1, tags2)
+
+    def test_cache_should_not_share_equal_values_with_different_representations(self):
+        # Given
+        class Amount(Value[Decimal], flyweight=True): ...
+
+        class Money(ValueObject, flyweight=True):
+            amount: Decimal
+            currency: str
+
+        # When
+        amounts = [Amount(Decimal("1.0")), Amount(Decimal("1.00")), Amount("1.00")]
+        money = [Money(amount="1.0", currency="CAD"), Money(amount="1.00", currency="CAD")]
+
+        # Expect
+        self.assertEqual(["1.0", "1.00", "1.00"], [str(amount) for amount in amounts])
+        self.assertIs(amounts[1], amounts[2])
+        self.assertEqual(["1.0", "1.00"], [str(item.amount) for item in money])
+
+    def test_cache_should_require_a_positive_size(self):
+        # Expect
+        with self.assertRaises(ValueError):
+            FlyweightCache(0)
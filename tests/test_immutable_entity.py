@@ -21,3 +21,17 @@ class ImmutableEntityTests(TestCase):
         err = exc.exception.errors()[0]
         self.assertEqual("name", err["loc"][0])
         self.assertEqual("frozen_instance", err["type"])
+
+    def test_immutable_entity_should_not_be_updated(self):
+        # Given
+        class User(ImmutableEntity):
+            name: str
+
+        user = User(id=uuid4(), name="Alice")
+
+        # Expect
+        with self.assertRaises(ValidationError) as exc:
+            user.update(name="Bob")
+
+        self.assertEqual("frozen_instance", exc.exception.errors()[0]["type"])
+        self.assertEqual("Alice", user.name)
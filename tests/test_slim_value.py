@@ -0,0 +1,125 @@
+from copy import deepcopy
+from typing import Hashable
+from typing_extensions import Annotated
+from unittest import TestCase
+
+from pydantic import BaseModel, StringConstraints, ValidationError
+
+from pydddantic import SlimValue, Value
+
+
+class SlimValueTests(TestCase):
+    def test_slim_value_should_validate_its_root_on_construction(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        # When
+        count = BirdCount("3")
+
+        # Expect
+        self.assertEqual(3, count.root)
+        with self.assertRaises(ValidationError):
+            BirdCount("three")
+
+    def test_slim_value_should_validate_an_annotated_root(self):
+        # Given
+        class BirdFamily(SlimValue[str]):
+            root: Annotated[str, StringConstraints(max_length=10, to_upper=True)]
+
+        # When
+        family = BirdFamily("Corvidae")
+
+        # Expect
+        self.assertEqual("CORVIDAE", family.root)
+        with self.assertRaises(ValidationError):
+            BirdFamily("Corvidae and friends")
+
+    def test_slim_value_should_be_immutable(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        count = BirdCount(1)
+
+        # Expect
+        with self.assertRaises(ValidationError) as exc:
+            count.root = 2
+
+        err = exc.exception.errors()[0]
+        self.assertEqual("root", err["loc"][0])
+        self.assertEqual("frozen_instance", err["type"])
+
+    def test_slim_value_should_not_have_a_dict(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        # Expect
+        self.assertFalse(hasattr(BirdCount(1), "__dict__"))
+
+    def test_slim_value_should_compare_like_a_value(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        class NestCount(SlimValue[int]): ...
+
+        class EggCount(Value[int]): ...
+
+        # Expect
+        self.assertEqual(BirdCount(1), BirdCount(1))
+        self.assertEqual(BirdCount(1), NestCount(1))
+        self.assertEqual(BirdCount(1), EggCount(1))
+        self.assertEqual(BirdCount(1), 1)
+        self.assertNotEqual(BirdCount(1), BirdCount(2))
+        self.assertEqual("1", str(BirdCount(1)))
+
+    def test_slim_value_should_be_hashable(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        count = BirdCount(1)
+
+        # Expect
+        self.assertIsInstance(count, Hashable)
+        self.assertEqual(hash(1), hash(count))
+
+    def test_slim_value_should_be_copied(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        # When
+        count = deepcopy(BirdCount(1))
+
+        # Expect
+        self.assertEqual(BirdCount(1), count)
+
+    def test_slim_value_should_be_validated_and_serialized_as_a_field(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        class Sighting(BaseModel):
+            count: BirdCount
+
+        # When
+        from_python = Sighting(count="2")
+        from_instance = Sighting(count=BirdCount(2))
+        from_json = Sighting.model_validate_json('{"count": 2}')
+
+        # Expect
+        for sighting in (from_python, from_instance, from_json):
+            self.assertIsInstance(sighting.count, BirdCount)
+            self.assertEqual(2, sighting.count)
+        self.assertEqual({"count": 2}, from_python.model_dump())
+        self.assertEqual('{"count":2}', from_python.model_dump_json())
+        self.assertEqual("integer", Sighting.model_json_schema()["properties"]["count"]["type"])
+
+    def test_slim_value_field_should_fail_validation_on_an_invalid_root(self):
+        # Given
+        class BirdCount(SlimValue[int]): ...
+
+        class Sighting(BaseModel):
+            count: BirdCount
+
+        # Expect
+        with self.assertRaises(ValidationError) as exc:
+            Sighting(count="many")
+
+        self.assertEqual("int_parsing", exc.exception.errors()[0]["type"])
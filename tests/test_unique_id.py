@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing_extensions import Hashable
 from unittest import TestCase
 from uuid import UUID
@@ -156,3 +157,157 @@ class UniqueIdTests(TestCase):
         # Expect
         with self.assertWarns(DeprecationWarning):
             class UserId(UUIDValue): ...
+
+    def test_id_hash_should_be_cached(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        user_id = UserId("db5b3fe1-3631-4ac4-8b91-b8333da02616")
+
+        # When
+        first = hash(user_id)
+        second = hash(user_id)
+
+        # Expect
+        self.assertEqual(first, second)
+        self.assertEqual(hash(UUID("db5b3fe1-3631-4ac4-8b91-b8333da02616").int), first)
+
+    def test_interned_ids_should_share_one_instance(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        id_str = "db5b3fe1-3631-4ac4-8b91-b8333da02616"
+
+        # When
+        user_id1 = UserId.intern(id_str)
+        user_id2 = UserId.intern(UUID(id_str))
+        user_id3 = UserId.intern(UserId(id_str))
+
+        # Expect
+        self.assertIsInstance(user_id1, UserId)
+        self.assertIs(user_id1, user_id2)
+        self.assertIs(user_id1, user_id3)
+
+    def test_interned_ids_should_be_distinct_per_id_type(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        class OrderId(UniqueId): ...
+
+        id_str = "db5b3fe1-3631-4ac4-8b91-b8333da02616"
+
+        # When
+        user_id = UserId.intern(id_str)
+        order_id = OrderId.intern(id_str)
+
+        # Expect
+        self.assertIsInstance(user_id, UserId)
+        self.assertIsInstance(order_id, OrderId)
+
+    def test_should_generate_many_new_ids(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        # When
+        user_ids = UserId.generate_many(100)
+
+        # Expect
+        self.assertEqual(100, len(user_ids))
+        self.assertEqual(100, len(set(user_ids)))
+        for user_id in user_ids:
+            self.assertIsInstance(user_id, UserId)
+            self.assertEqual(4, user_id.version)
+
+    def test_should_create_ids_from_an_array_of_bytes(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        user_ids = UserId.generate_many(3)
+
+        # When
+        created = UserId.from_bytes_array(b"".join(user_id.bytes for user_id in user_ids))
+
+        # Expect
+        self.assertEqual(user_ids, created)
+        self.assertIsInstance(created[0], UserId)
+
+    def test_should_fail_to_create_ids_from_a_truncated_array_of_bytes(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        # Expect
+        with self.assertRaises(ValueError):
+            UserId.from_bytes_array(UserId.generate().bytes[:15])
+
+    def test_should_validate_a_model_field_as_the_id_type(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        class User(BaseModel):
+            id: UserId
+
+        id_str = "db5b3fe1-3631-4ac4-8b91-b8333da02616"
+
+        # When
+        from_str = User(id=id_str)
+        from_uuid = User(id=UUID(id_str))
+        from_json = User.model_validate_json(f'{{"id": "{id_str}"}}')
+
+        # Expect
+        for user in (from_str, from_uuid, from_json):
+            self.assertIsInstance(user.id, UserId)
+            self.assertEqual(UserId(id_str), user.id)
+        self.assertEqual(f'{{"id":"{id_str}"}}', from_str.model_dump_json())
+
+    def test_should_generate_time_ordered_ids(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        # When
+        user_ids = [UserId.generate_ordered() for _ in range(1000)]
+
+        # Expect
+        self.assertEqual(1000, len(set(user_ids)))
+        self.assertEqual(user_ids, sorted(user_ids))
+        self.assertEqual(sorted(str(user_id) for user_id in user_ids), [str(user_id) for user_id in user_ids])
+        for user_id in user_ids:
+            self.assertIsInstance(user_id, UserId)
+            self.assertEqual(7, user_id.version)
+
+    def test_should_extract_the_timestamp_of_a_time_ordered_id(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+
+        # When
+        user_id = UserId.generate_ordered()
+
+        # Expect
+        self.assertLessEqual(before, user_id.timestamp)
+        self.assertLessEqual(user_id.timestamp, datetime.now(timezone.utc))
+        self.assertEqual(
+            datetime(2022, 2, 22, 19, 22, 22, tzinfo=timezone.utc),
+            UserId("017f22e2-79b0-7cc3-98c4-dc0c0c07398f").timestamp,
+        )
+
+    def test_should_fail_to_extract_the_timestamp_of_a_random_id(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        # Expect
+        with self.assertRaises(ValueError):
+            UserId.generate().timestamp
+
+    def test_ids_should_cache_their_hash_without_a_dict(self):
+        # Given
+        class UserId(UniqueId): ...
+
+        user_id = UserId.generate()
+
+        # When
+        user_hash = hash(user_id)
+
+        # Expect
+        self.assertEqual(user_hash, hash(UserId(str(user_id))))
+        self.assertFalse(hasattr(user_id, "__dict__"))
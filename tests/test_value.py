@@ -94,3 +94,18 @@ class ValueTests(TestCase):
 
         # Expect
         self.assertIsInstance(value, Hashable)
+
+    def test_value_should_hash_as_its_root(self):
+        # Given
+        class MyValue(Value[str]): ...
+
+        value = MyValue("hello")
+
+        # When
+        values = {value: 1}
+
+        # Expect
+        self.assertEqual(hash("hello"), hash(value))
+        self.assertEqual(hash(value), hash(MyValue("hello")))
+        self.assertEqual(1, values[MyValue("hello")])
+        self.assertEqual(1, values["hello"])
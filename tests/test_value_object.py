@@ -74,3 +74,54 @@ class ValueObjectTests(TestCase):
 
         # Expect
         self.assertIsInstance(value, Hashable)
+
+    def test_equal_value_objects_should_have_equal_hashes(self):
+        # Given
+        class DeliveryBox(ValueObject):
+            type: str
+            size: int
+
+        value1 = DeliveryBox(type="tiny", size=1)
+        value2 = DeliveryBox(type="tiny", size=1)
+
+        # When
+        boxes = {value1: "first"}
+        boxes[value2] = "second"
+
+        # Expect
+        self.assertEqual(hash(value1), hash(value2))
+        self.assertEqual(hash(value1), hash(value1))
+        self.assertEqual({value1: "second"}, boxes)
+
+    def test_value_object_subclass_should_compare_its_own_fields(self):
+        # Given
+        class DeliveryBox(ValueObject):
+            size: int
+
+        class LabelledDeliveryBox(DeliveryBox):
+            label: str
+
+        # When
+        value1 = LabelledDeliveryBox(size=1, label="fragile")
+        value2 = LabelledDeliveryBox(size=1, label="urgent")
+
+        # Expect
+        self.assertNotEqual(value1, value2)
+        self.assertNotEqual(DeliveryBox(size=1), value1)
+
+    def test_value_object_should_keep_its_own_equality(self):
+        # Given
+        class DeliveryBox(ValueObject):
+            type: str
+            size: int
+
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, DeliveryBox) and self.size == other.size
+
+        # When
+        value1 = DeliveryBox(type="tiny", size=1)
+        value2 = DeliveryBox(type="small", size=1)
+
+        # Expect
+        self.assertEqual(value1, value2)
+        self.assertIsInstance(value1, Hashable)